@@ -0,0 +1,98 @@
+"""DB session and MarketDataFetcher lifecycle shared by the strategy analyzers."""
+
+from functools import lru_cache
+from typing import Any, Optional, Tuple
+
+from investlib_data.market_api import MarketDataFetcher
+
+
+@lru_cache(maxsize=1)
+def _db_cache_factories() -> Tuple[Any, Any]:
+    """(SessionLocal, CacheManager), imported once on the first cached fetch.
+
+    Not imported at module load: investlib_data.database builds its engine
+    (and may create a data/ directory) on import, which indicator-only and
+    backtest users of the strategies never need.
+    """
+    from investlib_data.cache_manager import CacheManager
+    from investlib_data.database import SessionLocal
+    return SessionLocal, CacheManager
+
+
+class FetcherSessionMixin:
+    """`with`-block reuse of one DB session and MarketDataFetcher.
+
+    Subclasses call _init_fetcher_session() from __init__ and need a `logger`
+    attribute. A non-None `cache_manager` attribute is a caller-owned cache
+    that is reused across calls and never closed here.
+    """
+
+    cache_manager: Optional[Any] = None
+
+    def _init_fetcher_session(self) -> None:
+        # DB session + cached fetcher, kept open only inside a `with` block
+        self._keep_session = False
+        self._session = None
+        self._fetcher = None
+
+    def __enter__(self):
+        """Reuse one DB session and MarketDataFetcher across analyze() calls.
+
+        Example:
+            >>> with KrollStrategy() as strategy:
+            ...     signals = [strategy.analyze(s) for s in symbols]
+        """
+        self._keep_session = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the shared DB session opened inside a `with` block."""
+        self._keep_session = False
+        self._fetcher = None
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+            self.logger.debug(f"[{type(self).__name__}] Database session closed")
+
+    def _open_fetcher(
+        self,
+        use_cache: bool,
+        shared: bool = True
+    ) -> Tuple[MarketDataFetcher, Any]:
+        """Build a MarketDataFetcher, reusing the shared one inside a `with` block.
+
+        Args:
+            use_cache: Whether to use the database cache
+            shared: Reuse (or keep) the `with`-block fetcher; False gives the
+                caller its own session, e.g. for a worker thread
+
+        Returns:
+            (fetcher, session) where session is the per-call DB session the
+            caller must close, or None when there is nothing to close
+        """
+        if not use_cache:
+            return MarketDataFetcher(cache_manager=None), None
+        if shared and self._fetcher is not None:
+            return self._fetcher, None
+        if self.cache_manager is not None:
+            # Caller-owned cache: reuse it across calls, never close its session
+            self._fetcher = MarketDataFetcher(cache_manager=self.cache_manager)
+            return self._fetcher, None
+
+        session = None
+        try:
+            SessionLocal, CacheManager = _db_cache_factories()
+            session = SessionLocal()
+            cache_manager = CacheManager(session=session)
+        except Exception as e:
+            self.logger.warning(f"Cache not available: {e}")
+            return MarketDataFetcher(cache_manager=None), session
+
+        fetcher = MarketDataFetcher(cache_manager=cache_manager)
+        if shared and self._keep_session:
+            self._session, self._fetcher = session, fetcher
+            return fetcher, None
+        return fetcher, session
@@ -21,9 +21,27 @@ from investlib_quant.livermore_strategy import LivermoreStrategy
 from investlib_quant.kroll_strategy import KrollStrategy
 
 
+# Ordinal scores shared by confidence and risk labels (LOW=1, MEDIUM=2, HIGH=3)
+_LEVEL_SCORE = {'LOW': 1, 'MEDIUM': 2, 'HIGH': 3}
+_LEVELS = ('LOW', 'MEDIUM', 'HIGH')
+
+
 class FusionStrategy:
     """Multi-strategy fusion combining Livermore + Kroll."""
 
+    # Fixed attribute set: cheaper attribute access in per-bar backtest loops
+    # and smaller instances in parameter-grid sweeps.
+    __slots__ = (
+        'livermore_weight',
+        'kroll_weight',
+        'enable_livermore',
+        'enable_kroll',
+        'livermore',
+        'kroll',
+        'logger',
+        '_fuse',
+    )
+
     def __init__(
         self,
         livermore_weight: float = 0.6,
@@ -50,6 +68,36 @@ class FusionStrategy:
 
         self.logger = logging.getLogger(__name__)
 
+        # The analyze paths only ever produce signals from the enabled
+        # strategies, so single-strategy configurations bind a variant that
+        # skips the weighted-voting path. fuse_signals() itself is unaffected.
+        if enable_livermore and not enable_kroll:
+            self._fuse = self._fuse_livermore_only
+        elif enable_kroll and not enable_livermore:
+            self._fuse = self._fuse_kroll_only
+        else:
+            self._fuse = self.fuse_signals
+
+    def _fuse_livermore_only(
+        self,
+        livermore_signal: Optional[Dict[str, Any]],
+        kroll_signal: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Internal fuse step when only Livermore is enabled (kroll_signal is always None)."""
+        if livermore_signal is None:
+            raise ValueError("At least one strategy must be enabled")
+        return self._wrap_single_signal(livermore_signal, 'Livermore')
+
+    def _fuse_kroll_only(
+        self,
+        livermore_signal: Optional[Dict[str, Any]],
+        kroll_signal: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Internal fuse step when only Kroll is enabled (livermore_signal is always None)."""
+        if kroll_signal is None:
+            raise ValueError("At least one strategy must be enabled")
+        return self._wrap_single_signal(kroll_signal, 'Kroll')
+
     def fuse_signals(
         self,
         livermore_signal: Optional[Dict[str, Any]],
@@ -72,14 +120,16 @@ class FusionStrategy:
         if kroll_signal is None:
             return self._wrap_single_signal(livermore_signal, 'Livermore')
 
+        livermore_weight = self.livermore_weight
+        kroll_weight = self.kroll_weight
+
         # Extract actions
         liv_action = livermore_signal['action']
         kroll_action = kroll_signal['action']
 
         # Extract confidences (map to numeric scores)
-        confidence_map = {'LOW': 1, 'MEDIUM': 2, 'HIGH': 3}
-        liv_conf_num = confidence_map.get(livermore_signal['confidence'], 2)
-        kroll_conf_num = confidence_map.get(kroll_signal['confidence'], 2)
+        liv_conf_num = _LEVEL_SCORE.get(livermore_signal['confidence'], 2)
+        kroll_conf_num = _LEVEL_SCORE.get(kroll_signal['confidence'], 2)
 
         # Fusion logic
         fusion_factors = []
@@ -127,8 +177,7 @@ class FusionStrategy:
             fusion_factors.append(f"Livermore={liv_action}, Kroll={kroll_action}")
 
         # Map confidence number back to label
-        reverse_map = {1: 'LOW', 2: 'MEDIUM', 3: 'HIGH'}
-        final_confidence = reverse_map[final_conf_num]
+        final_confidence = _LEVELS[final_conf_num - 1]
 
         # Choose more conservative position size (smaller of the two)
         liv_position = livermore_signal.get('position_size_pct', 15)
@@ -151,11 +200,11 @@ class FusionStrategy:
         # Use Kroll's take-profit (more conservative)
         final_take_profit = kroll_signal.get('take_profit', livermore_signal.get('take_profit', entry_price))
 
-        # Calculate weighted risk level
-        liv_risk = self._risk_to_score(livermore_signal.get('risk_level', 'MEDIUM'))
-        kroll_risk = self._risk_to_score(kroll_signal.get('risk_level', 'MEDIUM'))
-        weighted_risk = liv_risk * self.livermore_weight + kroll_risk * self.kroll_weight
-        final_risk = self._score_to_risk(weighted_risk)
+        # Calculate weighted risk level: <1.5 LOW, <2.5 MEDIUM, else HIGH
+        liv_risk = _LEVEL_SCORE.get(livermore_signal.get('risk_level', 'MEDIUM'), 2)
+        kroll_risk = _LEVEL_SCORE.get(kroll_signal.get('risk_level', 'MEDIUM'), 2)
+        weighted_risk = liv_risk * livermore_weight + kroll_risk * kroll_weight
+        final_risk = _LEVELS[min(2, max(0, int(weighted_risk - 0.5)))]
 
         return {
             'action': final_action,
@@ -170,12 +219,12 @@ class FusionStrategy:
             'livermore_signal': {
                 'action': liv_action,
                 'confidence': livermore_signal['confidence'],
-                'weight': self.livermore_weight
+                'weight': livermore_weight
             },
             'kroll_signal': {
                 'action': kroll_action,
                 'confidence': kroll_signal['confidence'],
-                'weight': self.kroll_weight
+                'weight': kroll_weight
             }
         }
 
@@ -184,7 +233,8 @@ class FusionStrategy:
         market_data,
         symbol: str,
         capital: float = 100000.0,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        analysis_timestamp: Optional[datetime] = None
     ) -> Dict[str, Any]:
         """Analyze provided market data with multi-strategy fusion (for backtesting).
 
@@ -195,6 +245,8 @@ class FusionStrategy:
             symbol: Stock symbol (for logging/output)
             capital: Total capital available (default: 100000)
             metadata: Optional metadata dict (for data provenance tracking)
+            analysis_timestamp: Time to stamp the analysis with (default: now).
+                Backtests can pass the bar timestamp to record simulated time.
 
         Returns:
             Fused signal dictionary with metadata
@@ -202,6 +254,7 @@ class FusionStrategy:
         Raises:
             ValueError: If all enabled strategies fail
         """
+        now = analysis_timestamp if analysis_timestamp is not None else datetime.now()
         self.logger.info(f"[FusionStrategy] Analyzing {symbol} with multi-strategy fusion (from data)")
 
         # Run enabled strategies using analyze_data()
@@ -233,13 +286,13 @@ class FusionStrategy:
                 self.logger.error(f"[FusionStrategy] Kroll failed: {e}")
 
         # Fuse signals
-        fused = self.fuse_signals(livermore_signal, kroll_signal)
+        fused = self._fuse(livermore_signal, kroll_signal)
 
         # Add metadata
         if metadata is None:
             metadata = {
                 'api_source': 'Backtest (pre-fetched)',
-                'retrieval_timestamp': datetime.now(),
+                'retrieval_timestamp': now,
                 'data_freshness': 'historical'
             }
 
@@ -250,7 +303,7 @@ class FusionStrategy:
             'data_timestamp': metadata['retrieval_timestamp'].isoformat() if isinstance(metadata.get('retrieval_timestamp'), datetime) else str(metadata.get('retrieval_timestamp', 'Unknown')),
             'data_freshness': metadata.get('data_freshness', 'unknown'),
             'data_points': len(market_data),
-            'analysis_timestamp': datetime.now().isoformat()
+            'analysis_timestamp': now.isoformat()
         })
 
         return fused
@@ -300,7 +353,7 @@ class FusionStrategy:
                 self.logger.error(f"[FusionStrategy] Kroll failed: {e}")
 
         # Fuse signals
-        fused = self.fuse_signals(livermore_signal, kroll_signal)
+        fused = self._fuse(livermore_signal, kroll_signal)
 
         # Add metadata from one of the strategies
         metadata_source = livermore_signal or kroll_signal
@@ -322,17 +375,3 @@ class FusionStrategy:
             **signal,
             'fusion_factors': [f"Using {strategy_name} only (other strategy disabled)"]
         }
-
-    def _risk_to_score(self, risk_level: str) -> float:
-        """Convert risk level to numeric score."""
-        risk_map = {'LOW': 1.0, 'MEDIUM': 2.0, 'HIGH': 3.0}
-        return risk_map.get(risk_level, 2.0)
-
-    def _score_to_risk(self, score: float) -> str:
-        """Convert numeric score to risk level."""
-        if score < 1.5:
-            return 'LOW'
-        elif score < 2.5:
-            return 'MEDIUM'
-        else:
-            return 'HIGH'
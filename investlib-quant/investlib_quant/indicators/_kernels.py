@@ -0,0 +1,567 @@
+"""Compiled rolling-window kernels shared by the indicator modules.
+
+Numba is an optional dependency. When it is installed the kernels below are
+JIT-compiled (and ``prange`` loops run in parallel across CPU cores); when it
+is missing, ``njit`` degrades to a no-op decorator so callers can check
+``NUMBA_AVAILABLE`` and fall back to their vectorized pandas/NumPy path.
+
+The kernels are declared with explicit signatures, so numba compiles them
+eagerly at import (or loads them from its on-disk cache) instead of on the
+first call inside a backtest.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange, types
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+if NUMBA_AVAILABLE:
+    def _in_array(dtype, ndim):
+        """Read-only, any-layout input array: what pandas' to_numpy() returns
+        under copy-on-write, and what writable arrays convert to."""
+        return types.Array(dtype, ndim, 'A', readonly=True)
+
+    _f8, _i8 = types.float64, types.int64
+    _BOLLINGER_ROW_SIG = types.void(
+        _in_array(_f8, 1), _i8, _f8, _f8[::1], _f8[::1], _f8[::1]
+    )
+    _BOLLINGER_BATCH_SIG = _f8[:, :, ::1](_in_array(_f8, 2), _i8, _f8)
+    # float32 variants back KrollStrategy.INDICATOR_DTYPE = np.float32
+    _KROLL_SIGS = [
+        types.UniTuple(t[::1], 6)(*([_in_array(t, 1)] * 4 + [_i8] * 4))
+        for t in (types.float64, types.float32)
+    ]
+    _KROLL_BATCH_SIGS = [
+        t[:, :, ::1](*([_in_array(t, 2)] * 4 + [_i8] * 4))
+        for t in (types.float64, types.float32)
+    ]
+    # Livermore params: ma_p, vol_p, EMA alphas (fast, slow, signal), atr_p, wilder
+    _LIVERMORE_PARAMS = [_i8, _i8, _f8, _f8, _f8, _i8, types.boolean]
+    _WILDER_ATR_SIG = _f8[::1](_in_array(_f8, 1), _i8)
+    _LAST_MEANS_SIG = types.UniTuple(_f8, 3)(_in_array(_f8, 1), _in_array(_f8, 1), _i8, _i8)
+    _LAST_MEAN_SIG = _f8(_in_array(_f8, 1), _i8)
+    # MultiIndicator params: MACD alphas (fast, slow, signal), kdj_p, KDJ K/D alphas, bb_p, vol_p
+    _MULTI_INDICATOR_SIG = types.UniTuple(_f8, 11)(
+        *([_in_array(_f8, 1)] * 4), _f8, _f8, _f8, _i8, _f8, _f8, _i8, _i8
+    )
+    # float32 variants back LivermoreStrategy.INDICATOR_DTYPE = np.float32
+    _LIVERMORE_SIGS = [
+        types.UniTuple(t[::1], 7)(*([_in_array(t, 1)] * 4 + _LIVERMORE_PARAMS))
+        for t in (types.float64, types.float32)
+    ]
+    _LIVERMORE_BATCH_SIGS = [
+        t[:, :, ::1](*([_in_array(t, 2)] * 4 + _LIVERMORE_PARAMS))
+        for t in (types.float64, types.float32)
+    ]
+else:
+    _BOLLINGER_ROW_SIG = _BOLLINGER_BATCH_SIG = None
+    _KROLL_SIGS = _KROLL_BATCH_SIGS = None
+    _LIVERMORE_SIGS = _LIVERMORE_BATCH_SIGS = _WILDER_ATR_SIG = None
+    _LAST_MEANS_SIG = _LAST_MEAN_SIG = _MULTI_INDICATOR_SIG = None
+
+
+@njit(_BOLLINGER_ROW_SIG, cache=True)
+def _bollinger_row(prices, period, k, upper, middle, lower):
+    """Fill one symbol's Bollinger bands (sample std, like pandas rolling)."""
+    n = prices.shape[0]
+    for i in range(n):
+        if i < period - 1:
+            upper[i] = np.nan
+            middle[i] = np.nan
+            lower[i] = np.nan
+            continue
+        total = 0.0
+        for j in range(i - period + 1, i + 1):
+            total += prices[j]
+        mean = total / period
+        sq = 0.0
+        for j in range(i - period + 1, i + 1):
+            d = prices[j] - mean
+            sq += d * d
+        std = np.sqrt(sq / (period - 1)) if period > 1 else np.nan
+        middle[i] = mean
+        upper[i] = mean + k * std
+        lower[i] = mean - k * std
+
+
+@njit(_BOLLINGER_BATCH_SIG, cache=True, parallel=True)
+def bollinger_batch(prices, period, k):
+    """Bollinger bands for a (n_symbols, n_bars) price matrix.
+
+    Returns a (3, n_symbols, n_bars) array holding upper, middle and lower
+    bands. Symbols are processed in parallel with ``prange``.
+    """
+    n_symbols, n_bars = prices.shape
+    out = np.empty((3, n_symbols, n_bars))
+    for s in prange(n_symbols):
+        _bollinger_row(prices[s], period, k, out[0, s], out[1, s], out[2, s])
+    return out
+
+
+@njit(_KROLL_SIGS, cache=True)
+def kroll_indicators(high, low, close, volume, ma_p, rsi_p, atr_p, vol_p):
+    """Kroll's indicator set in a single pass over the OHLCV arrays.
+
+    Returns (ma, rsi, atr, volume_ma, volume_ratio, atr_pct):
+    - ma / volume_ma: simple moving averages kept as running window sums
+    - rsi / atr: Wilder (RMA) smoothing, seeded like pandas_ta, so the first
+      value is emitted once ``rsi_p`` / ``atr_p`` deltas have been seen
+    - atr_pct: ATR as a percentage of the close, filled in the same loop
+
+    NaN inputs blank any window (MA) they fall into and are skipped by the
+    Wilder recursions, so left-padding a series with NaN does not change
+    its values. Outputs share the input dtype (float64 or float32); the
+    running sums and Wilder averages are always accumulated in float64.
+    """
+    n = close.shape[0]
+    dtype = close.dtype
+    ma = np.full(n, np.nan, dtype)
+    rsi = np.full(n, np.nan, dtype)
+    atr = np.full(n, np.nan, dtype)
+    volume_ma = np.full(n, np.nan, dtype)
+    volume_ratio = np.full(n, np.nan, dtype)
+    atr_pct = np.full(n, np.nan, dtype)
+
+    rsi_alpha = 1.0 / rsi_p
+    atr_alpha = 1.0 / atr_p
+
+    sum_close = 0.0
+    nan_close = 0
+    sum_vol = 0.0
+    nan_vol = 0
+    avg_gain = 0.0
+    avg_loss = 0.0
+    rsi_seen = 0
+    avg_tr = 0.0
+    atr_seen = 0
+
+    for i in range(n):
+        c = close[i]
+        v = volume[i]
+
+        # MA: add the new bar, drop the one leaving the window
+        if np.isnan(c):
+            nan_close += 1
+        else:
+            sum_close += c
+        if i >= ma_p:
+            old = close[i - ma_p]
+            if np.isnan(old):
+                nan_close -= 1
+            else:
+                sum_close -= old
+        if i >= ma_p - 1 and nan_close == 0:
+            ma[i] = sum_close / ma_p
+
+        # Volume MA and ratio
+        if np.isnan(v):
+            nan_vol += 1
+        else:
+            sum_vol += v
+        if i >= vol_p:
+            old = volume[i - vol_p]
+            if np.isnan(old):
+                nan_vol -= 1
+            else:
+                sum_vol -= old
+        if i >= vol_p - 1 and nan_vol == 0:
+            vma = sum_vol / vol_p
+            volume_ma[i] = vma
+            if vma != 0.0:
+                volume_ratio[i] = v / vma
+            elif v > 0.0:
+                volume_ratio[i] = np.inf
+
+        if i == 0:
+            continue
+        prev_close = close[i - 1]
+
+        # RSI (Wilder): first delta seeds the averages
+        delta = c - prev_close
+        if not np.isnan(delta):
+            gain = delta if delta > 0.0 else 0.0
+            loss = -delta if delta < 0.0 else 0.0
+            if rsi_seen == 0:
+                avg_gain = gain
+                avg_loss = loss
+            else:
+                avg_gain = (1.0 - rsi_alpha) * avg_gain + rsi_alpha * gain
+                avg_loss = (1.0 - rsi_alpha) * avg_loss + rsi_alpha * loss
+            rsi_seen += 1
+        if rsi_seen >= rsi_p:
+            denom = avg_gain + avg_loss
+            if denom != 0.0:
+                rsi[i] = 100.0 * avg_gain / denom
+
+        # ATR (Wilder) over the true range; undefined without a previous close
+        h = high[i]
+        lo = low[i]
+        tr = max(h - lo, abs(h - prev_close), abs(lo - prev_close))
+        if not (np.isnan(tr) or np.isnan(prev_close)):
+            if atr_seen == 0:
+                avg_tr = tr
+            else:
+                avg_tr = (1.0 - atr_alpha) * avg_tr + atr_alpha * tr
+            atr_seen += 1
+        if atr_seen >= atr_p:
+            atr[i] = avg_tr
+            if c != 0.0:
+                atr_pct[i] = avg_tr / c * 100.0
+            elif avg_tr > 0.0:
+                atr_pct[i] = np.inf
+
+    return ma, rsi, atr, volume_ma, volume_ratio, atr_pct
+
+
+@njit(_KROLL_BATCH_SIGS, cache=True, parallel=True, nogil=True)
+def kroll_indicators_batch(high, low, close, volume, ma_p, rsi_p, atr_p, vol_p):
+    """kroll_indicators() over (n_symbols, n_bars) matrices, one symbol per thread.
+
+    Rows may be left-padded with NaN to a common length. Returns a
+    (6, n_symbols, n_bars) array of the input dtype: ma, rsi, atr,
+    volume_ma, volume_ratio, atr_pct.
+    """
+    n_symbols, n_bars = close.shape
+    out = np.empty((6, n_symbols, n_bars), close.dtype)
+    for s in prange(n_symbols):
+        ma, rsi, atr, volume_ma, volume_ratio, atr_pct = kroll_indicators(
+            high[s], low[s], close[s], volume[s], ma_p, rsi_p, atr_p, vol_p
+        )
+        out[0, s] = ma
+        out[1, s] = rsi
+        out[2, s] = atr
+        out[3, s] = volume_ma
+        out[4, s] = volume_ratio
+        out[5, s] = atr_pct
+    return out
+
+
+@njit(inline='always')
+def _ewm_update(weighted, old_wt, x, alpha):
+    """One step of pandas ewm(alpha=alpha, adjust=False).mean().
+
+    NaN-aware like pandas: the average starts at the first observation, a
+    NaN bar repeats the previous value, and the old weight keeps decaying
+    across the gap. Returns the new (weighted, old_wt).
+    """
+    if np.isnan(weighted):
+        return x, 1.0
+    old_wt *= 1.0 - alpha
+    if not np.isnan(x):
+        if weighted != x:
+            weighted = (old_wt * weighted + alpha * x) / (old_wt + alpha)
+        old_wt = 1.0
+    return weighted, old_wt
+
+
+@njit(inline='always')
+def _wilder_update(value, count, tr, period):
+    """One bar of Wilder's ATR: ATR_i = ((period - 1) * ATR_{i-1} + TR_i) / period.
+
+    Seeded with the mean of the first `period` true ranges (value holds
+    their running sum until then), as in TA-Lib. A NaN true range restarts
+    the seed. Returns the new (value, count); the ATR is value once count
+    reaches period.
+    """
+    if np.isnan(tr):
+        return 0.0, 0
+    if count < period:
+        value += tr
+        count += 1
+        if count == period:
+            value /= period
+        return value, count
+    return (value * (period - 1) + tr) / period, count
+
+
+@njit(_WILDER_ATR_SIG, cache=True)
+def wilder_atr(true_range, period):
+    """Wilder-smoothed ATR of a true range array (NaN until seeded)."""
+    n = true_range.shape[0]
+    out = np.full(n, np.nan)
+    value = 0.0
+    count = 0
+    for i in range(n):
+        value, count = _wilder_update(value, count, true_range[i], period)
+        if count >= period:
+            out[i] = value
+    return out
+
+
+@njit(_LIVERMORE_SIGS, cache=True, nogil=True)
+def livermore_indicators(high, low, close, volume, ma_p, vol_p, a_fast, a_slow, a_sig, atr_p,
+                         wilder):
+    """Livermore's indicator set in a single pass over the OHLCV arrays.
+
+    Returns (ma, volume_ma, volume_ratio, macd, macd_signal, macd_histogram,
+    atr), matching LivermoreStrategy's pandas formulas:
+    - ma / volume_ma: rolling(window).mean(), kept as running window sums
+    - macd: ewm(span, adjust=False) fast/slow/signal EMAs, given as their
+      smoothing factors a = 2 / (span + 1)
+    - atr: rolling mean of the true range, its window held in a ring buffer;
+      with wilder, Wilder's smoothing instead (see _wilder_update), which
+      needs a previous close and so starts from the second bar
+
+    NaN inputs blank any rolling window they fall into and are skipped by
+    the EMAs, as in pandas. Outputs share the input dtype (float64 or
+    float32); window sums and EMA registers are always float64.
+    """
+    n = close.shape[0]
+    dtype = close.dtype
+    ma = np.full(n, np.nan, dtype)
+    volume_ma = np.full(n, np.nan, dtype)
+    volume_ratio = np.full(n, np.nan, dtype)
+    macd = np.empty(n, dtype)
+    macd_signal = np.empty(n, dtype)
+    macd_histogram = np.empty(n, dtype)
+    atr = np.full(n, np.nan, dtype)
+
+    ema_fast = ema_slow = ema_sig = np.nan
+    wt_fast = wt_slow = wt_sig = 1.0
+
+    sum_close = 0.0
+    nan_close = 0
+    sum_vol = 0.0
+    nan_vol = 0
+    tr_buf = np.empty(atr_p)
+    sum_tr = 0.0
+    nan_tr = 0
+    wilder_value = 0.0
+    wilder_count = 0
+
+    for i in range(n):
+        c = close[i]
+        v = volume[i]
+
+        # MA: add the new bar, drop the one leaving the window
+        if np.isnan(c):
+            nan_close += 1
+        else:
+            sum_close += c
+        if i >= ma_p:
+            old = close[i - ma_p]
+            if np.isnan(old):
+                nan_close -= 1
+            else:
+                sum_close -= old
+        if i >= ma_p - 1 and nan_close == 0:
+            ma[i] = sum_close / ma_p
+
+        # Volume MA and ratio
+        if np.isnan(v):
+            nan_vol += 1
+        else:
+            sum_vol += v
+        if i >= vol_p:
+            old = volume[i - vol_p]
+            if np.isnan(old):
+                nan_vol -= 1
+            else:
+                sum_vol -= old
+        if i >= vol_p - 1 and nan_vol == 0:
+            vma = sum_vol / vol_p
+            volume_ma[i] = vma
+            if vma != 0.0:
+                volume_ratio[i] = v / vma
+            elif v > 0.0:
+                volume_ratio[i] = np.inf
+
+        # MACD: three EMA registers
+        ema_fast, wt_fast = _ewm_update(ema_fast, wt_fast, c, a_fast)
+        ema_slow, wt_slow = _ewm_update(ema_slow, wt_slow, c, a_slow)
+        m = ema_fast - ema_slow
+        ema_sig, wt_sig = _ewm_update(ema_sig, wt_sig, m, a_sig)
+        macd[i] = m
+        macd_signal[i] = ema_sig
+        macd_histogram[i] = m - ema_sig
+
+        # True range
+        tr = high[i] - low[i]
+        prev_close = close[i - 1] if i > 0 else np.nan
+        hc = abs(high[i] - prev_close)
+        lc = abs(low[i] - prev_close)
+
+        if wilder:
+            # Wilder's ATR needs every term, as TA-Lib's TRANGE does
+            if np.isnan(hc) or np.isnan(lc):
+                tr = np.nan
+            else:
+                tr = max(tr, hc, lc)
+            wilder_value, wilder_count = _wilder_update(wilder_value, wilder_count, tr, atr_p)
+            if wilder_count >= atr_p:
+                atr[i] = wilder_value
+        else:
+            # NaN terms skipped; the first bar is high - low
+            if np.isnan(tr) or hc > tr:
+                tr = hc
+            if np.isnan(tr) or lc > tr:
+                tr = lc
+
+            # ATR: rolling mean of the true range over the ring buffer
+            slot = i % atr_p
+            if i >= atr_p:
+                old = tr_buf[slot]
+                if np.isnan(old):
+                    nan_tr -= 1
+                else:
+                    sum_tr -= old
+            tr_buf[slot] = tr
+            if np.isnan(tr):
+                nan_tr += 1
+            else:
+                sum_tr += tr
+            if i >= atr_p - 1 and nan_tr == 0:
+                atr[i] = sum_tr / atr_p
+
+    return ma, volume_ma, volume_ratio, macd, macd_signal, macd_histogram, atr
+
+
+@njit(_LIVERMORE_BATCH_SIGS, cache=True, parallel=True, nogil=True)
+def livermore_indicators_batch(high, low, close, volume, ma_p, vol_p, a_fast, a_slow, a_sig, atr_p,
+                               wilder):
+    """livermore_indicators() over (n_symbols, n_bars) matrices, one symbol per thread.
+
+    Rows may be left-padded with NaN to a common length; the padding does
+    not change any value. Returns a (7, n_symbols, n_bars) array of the
+    input dtype: ma, volume_ma, volume_ratio, macd, macd_signal,
+    macd_histogram, atr.
+    """
+    n_symbols, n_bars = close.shape
+    out = np.empty((7, n_symbols, n_bars), close.dtype)
+    for s in prange(n_symbols):
+        rows = livermore_indicators(
+            high[s], low[s], close[s], volume[s], ma_p, vol_p, a_fast, a_slow, a_sig, atr_p,
+            wilder
+        )
+        for k in range(7):
+            out[k, s] = rows[k]
+    return out
+
+
+@njit(_LAST_MEANS_SIG, cache=True, nogil=True)
+def last_means(close, volume, ma_p, vol_p):
+    """(last, previous) ma_p-bar means of close and the last vol_p-bar mean of volume.
+
+    The only rolling(window).mean() values the MA breakout rule reads,
+    summed over their windows instead of materializing whole series. As in
+    pandas, a mean is NaN when its window is incomplete or holds a NaN.
+    """
+    n = close.shape[0]
+    ma_last = ma_prev = volume_ma = np.nan
+
+    if n >= ma_p:
+        # Both close windows share bars n - ma_p .. n - 2
+        shared = 0.0
+        for i in range(n - ma_p, n - 1):
+            shared += close[i]
+        ma_last = (shared + close[n - 1]) / ma_p
+        if n > ma_p:
+            ma_prev = (shared + close[n - 1 - ma_p]) / ma_p
+
+    if n >= vol_p:
+        total = 0.0
+        for i in range(n - vol_p, n):
+            total += volume[i]
+        volume_ma = total / vol_p
+
+    return ma_last, ma_prev, volume_ma
+
+
+@njit(_LAST_MEAN_SIG, cache=True, nogil=True)
+def last_mean(values, window):
+    """Last value of rolling(window).mean(): NaN if incomplete or holding a NaN."""
+    n = values.shape[0]
+    if n < window:
+        return np.nan
+    total = 0.0
+    for i in range(n - window, n):
+        total += values[i]
+    return total / window
+
+
+@njit(_MULTI_INDICATOR_SIG, cache=True, nogil=True)
+def multi_indicator_last(high, low, close, volume, a_fast, a_slow, a_sig, kdj_p, a_k, a_d,
+                         bb_p, vol_p):
+    """The last values MultiIndicatorStrategy votes on, in one pass over OHLCV.
+
+    Returns (macd_prev, macd, signal_prev, signal, k_prev, k, d_prev, d,
+    bb_middle, bb_std, volume_ma), matching the pandas indicator modules:
+    - macd / signal: ewm(span, adjust=False) EMAs, given as smoothing factors
+    - k / d: ewm-smoothed RSV over kdj_p-bar low/high extremes, with an
+      incomplete or NaN-holding window (or 0 / 0) read as a neutral 50
+    - bb_middle / bb_std: rolling mean and sample std of the last bb_p closes
+    - volume_ma: rolling mean of the last vol_p volumes
+
+    The EMA recursions (MACD and the KDJ smoothing) walk the whole history;
+    the Bollinger and volume windows are summed over their last bars only.
+    """
+    n = close.shape[0]
+    ema_fast = ema_slow = ema_sig = np.nan
+    wt_fast = wt_slow = wt_sig = 1.0
+    k = d = np.nan
+    wt_k = wt_d = 1.0
+    macd_prev = sig_prev = k_prev = d_prev = np.nan
+    m = np.nan
+
+    for i in range(n):
+        macd_prev, sig_prev, k_prev, d_prev = m, ema_sig, k, d
+
+        # MACD
+        c = close[i]
+        ema_fast, wt_fast = _ewm_update(ema_fast, wt_fast, c, a_fast)
+        ema_slow, wt_slow = _ewm_update(ema_slow, wt_slow, c, a_slow)
+        m = ema_fast - ema_slow
+        ema_sig, wt_sig = _ewm_update(ema_sig, wt_sig, m, a_sig)
+
+        # KDJ: RSV over the window's extremes (NaN propagates through min/max)
+        rsv = np.nan
+        if i >= kdj_p - 1:
+            low_min = low[i]
+            high_max = high[i]
+            for j in range(i - kdj_p + 1, i):
+                low_min = low[j] if (low[j] < low_min or np.isnan(low[j])) else low_min
+                high_max = high[j] if (high[j] > high_max or np.isnan(high[j])) else high_max
+            num = 100.0 * (c - low_min)
+            den = high_max - low_min
+            if den != 0.0:
+                rsv = num / den
+            elif num != 0.0:
+                rsv = np.copysign(np.inf, num)
+        if np.isnan(rsv):
+            rsv = 50.0
+        k, wt_k = _ewm_update(k, wt_k, rsv, a_k)
+        d, wt_d = _ewm_update(d, wt_d, k, a_d)
+
+    bb_middle = bb_std = np.nan
+    if n >= bb_p:
+        total = 0.0
+        for i in range(n - bb_p, n):
+            total += close[i]
+        bb_middle = total / bb_p
+        if bb_p > 1:
+            sq = 0.0
+            for i in range(n - bb_p, n):
+                dev = close[i] - bb_middle
+                sq += dev * dev
+            bb_std = np.sqrt(sq / (bb_p - 1))
+
+    volume_ma = np.nan
+    if n >= vol_p:
+        total = 0.0
+        for i in range(n - vol_p, n):
+            total += volume[i]
+        volume_ma = total / vol_p
+
+    return (macd_prev, m, sig_prev, ema_sig, k_prev, k, d_prev, d,
+            bb_middle, bb_std, volume_ma)
@@ -33,12 +33,18 @@ def calculate_atr(data: pd.DataFrame, period: int = 14) -> pd.Series:
         import pandas_ta as ta
         atr = ta.atr(data['high'], data['low'], data['close'], length=period)
     except ImportError:
-        # Manual ATR calculation
-        high_low = data['high'] - data['low']
-        high_close = np.abs(data['high'] - data['close'].shift())
-        low_close = np.abs(data['low'] - data['close'].shift())
-
-        true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-        atr = true_range.rolling(window=period).mean()
+        # Manual ATR calculation on raw ndarrays (no intermediate DataFrame).
+        # fmax skips the NaN previous-close on the first bar, matching
+        # DataFrame.max(axis=1).
+        high = data['high'].to_numpy(dtype=np.float64)
+        low = data['low'].to_numpy(dtype=np.float64)
+        prev_close = data['close'].shift().to_numpy(dtype=np.float64)
+
+        high_low = high - low
+        high_close = np.abs(high - prev_close)
+        low_close = np.abs(low - prev_close)
+
+        true_range = np.fmax.reduce([high_low, high_close, low_close])
+        atr = pd.Series(true_range, index=data.index).rolling(window=period).mean()
 
     return atr
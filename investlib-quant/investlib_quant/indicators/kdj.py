@@ -81,9 +81,10 @@ def detect_kdj_signal(
     """Detect KDJ trading signals.
 
     Args:
-        k_line: K line values
-        d_line: D line values
-        j_line: J line values
+        k_line: K line values (Series, or any sequence ending in the
+            previous and latest values)
+        d_line: D line values, same form as k_line
+        j_line: J line values (unused)
         oversold_threshold: Oversold zone threshold (default 20)
         overbought_threshold: Overbought zone threshold (default 80)
 
@@ -101,11 +102,9 @@ def detect_kdj_signal(
     if len(k_line) < 2 or len(d_line) < 2:
         return None
 
-    # Get current and previous values
-    k_current = k_line.iloc[-1]
-    k_previous = k_line.iloc[-2]
-    d_current = d_line.iloc[-1]
-    d_previous = d_line.iloc[-2]
+    # Get current and previous values (Series or plain sequences)
+    k_previous, k_current = np.asarray(k_line)[-2:]
+    d_previous, d_current = np.asarray(d_line)[-2:]
 
     # Check for NaN
     if any(pd.isna([k_current, k_previous, d_current, d_previous])):
@@ -1,8 +1,14 @@
 """Moving Average calculations (T029)."""
 
+import numpy as np
 import pandas as pd
 from typing import Union, List
 
+try:
+    import talib
+except ImportError:
+    talib = None
+
 
 def calculate_ma(
     data: Union[pd.DataFrame, pd.Series],
@@ -42,11 +48,51 @@ def calculate_ma(
     if len(close) < max_period:
         raise ValueError(f"Insufficient data: need at least {max_period} rows, got {len(close)}")
 
+    # TA-Lib's C running-sum SMA when available. It carries a NaN forward
+    # instead of recovering after the window passes it, so gaps use pandas.
+    arr = close.to_numpy(dtype=np.float64)
+    has_nan = np.isnan(arr).any()
+    use_talib = talib is not None and not has_nan
+
     # Calculate MAs
     if return_series:
-        return close.rolling(window=periods[0]).mean()
+        if has_nan:
+            return close.rolling(window=periods[0]).mean()
+        out = np.empty(len(arr))
+        if use_talib:
+            out[:] = talib.SMA(arr, timeperiod=periods[0])
+        else:
+            _sma_from_cumsum(_cumsum0(arr), periods[0], out)
+        return pd.Series(out, index=close.index, name=close.name)
     else:
-        result = pd.DataFrame()
-        for p in periods:
-            result[f'ma_{p}'] = close.rolling(window=p).mean()
-        return result
+        columns = [f'ma_{p}' for p in periods]
+        if has_nan:
+            return pd.DataFrame(
+                {col: close.rolling(window=p).mean() for col, p in zip(columns, periods)},
+                index=close.index
+            )
+        out = np.empty((len(arr), len(periods)))
+        if use_talib:
+            for i, p in enumerate(periods):
+                out[:, i] = talib.SMA(arr, timeperiod=p)
+        else:
+            # One cumulative sum shared by every period
+            cs = _cumsum0(arr)
+            for i, p in enumerate(periods):
+                _sma_from_cumsum(cs, p, out[:, i])
+        return pd.DataFrame(out, index=close.index, columns=columns)
+
+
+def _cumsum0(arr: np.ndarray) -> np.ndarray:
+    """Cumulative sum with a leading zero: cs[i] = arr[:i].sum()."""
+    cs = np.empty(len(arr) + 1)
+    cs[0] = 0.0
+    np.cumsum(arr, out=cs[1:])
+    return cs
+
+
+def _sma_from_cumsum(cs: np.ndarray, period: int, out: np.ndarray) -> None:
+    """Fill out with the period-p SMA: MA_p[i] = (cs[i+1] - cs[i+1-p]) / p."""
+    out[:period - 1] = np.nan
+    np.subtract(cs[period:], cs[:-period], out=out[period - 1:])
+    out[period - 1:] /= period
@@ -1,8 +1,15 @@
 """RSI (Relative Strength Index) calculation (T027)."""
 
+import numpy as np
 import pandas as pd
 from typing import Union
 
+# Resolve the optional pandas_ta backend once at import, not on every call
+try:
+    from pandas_ta import rsi as _ta_rsi
+except ImportError:
+    _ta_rsi = None
+
 
 def calculate_rsi(data: Union[pd.DataFrame, pd.Series], period: int = 14) -> pd.Series:
     """Calculate RSI indicator.
@@ -30,16 +37,23 @@ def calculate_rsi(data: Union[pd.DataFrame, pd.Series], period: int = 14) -> pd.
         raise ValueError(f"Insufficient data: need at least {period + 1} rows, got {len(close)}")
 
     # Use pandas_ta if available, otherwise manual calculation
-    try:
-        import pandas_ta as ta
-        rsi = ta.rsi(close, length=period)
-    except ImportError:
-        # Manual RSI calculation
-        delta = close.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
+    if _ta_rsi is not None:
+        rsi = _ta_rsi(close, length=period)
+    else:
+        # Manual RSI calculation with Wilder's smoothing (RMA), as pandas_ta does
+        arr = close.to_numpy(dtype=np.float64)
+        delta = np.empty_like(arr)
+        delta[0] = np.nan
+        np.subtract(arr[1:], arr[:-1], out=delta[1:])
+        gain = np.where(delta > 0, delta, 0.0)
+        loss = np.where(delta < 0, -delta, 0.0)
+        gain[0] = loss[0] = np.nan
+
+        alpha = 1.0 / period
+        avg_gain = pd.Series(gain).ewm(alpha=alpha, adjust=False, min_periods=period).mean().to_numpy()
+        avg_loss = pd.Series(loss).ewm(alpha=alpha, adjust=False, min_periods=period).mean().to_numpy()
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi = pd.Series(100 * avg_gain / (avg_gain + avg_loss), index=close.index)
 
     return rsi
@@ -13,17 +13,219 @@
 V0.2: 使用真实市场数据通过MarketDataFetcher
 """
 
+import numpy as np
 import pandas as pd
 import logging
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
-from investlib_data.market_api import MarketDataFetcher, NoDataAvailableError
+from investlib_data.market_api import NoDataAvailableError
+from investlib_quant._fetcher_session import FetcherSessionMixin
 from investlib_quant.indicators import calculate_rsi, calculate_atr, calculate_ma
+from investlib_quant.signal_labels import ACTION_LABELS, LEVEL_LABELS
+from investlib_quant.indicators._kernels import (
+    NUMBA_AVAILABLE, kroll_indicators, kroll_indicators_batch
+)
+
+try:
+    import talib
+except ImportError:
+    talib = None
+
+# Categorical signal fields; signals_to_frame() stores them as int8 category codes
+_CATEGORICAL_FIELDS = {
+    'action': ACTION_LABELS,
+    'confidence': LEVEL_LABELS,
+    'risk_level': LEVEL_LABELS,
+}
+
+# Display precision of the numeric fields in a complete signal
+_DISPLAY_DIGITS = {
+    'entry_price': 2,
+    'stop_loss': 2,
+    'take_profit': 2,
+    'position_size_pct': 2,
+    'max_loss_amount': 2,
+    'max_loss_pct': 3,
+    'rsi': 2,
+    'atr': 2,
+    'atr_pct': 2,
+}
+
+
+def format_signal(signal: Dict[str, Any]) -> Dict[str, Any]:
+    """Round a signal's numeric fields to display precision (in place).
+
+    Used for signals requested with round_output=False, e.g. a backtest
+    that keeps raw floats and formats only the signals it reports.
+    """
+    for field, digits in _DISPLAY_DIGITS.items():
+        if field in signal:
+            signal[field] = round(signal[field], digits)
+    return signal
+
+
+class _OHLCVKey:
+    """Hashable high/low/close/volume arrays, the key of the indicator cache.
+
+    The hash is a cheap fingerprint (length, dtype, first/last close and
+    last volume); equality compares the full arrays, so a fingerprint
+    collision costs a comparison but never returns another series' values.
+    The key holds private copies: to_numpy() may return views of the
+    caller's columns, and an in-place edit of the frame must not edit a key
+    already stored in the cache.
+    """
+
+    __slots__ = ('arrays', '_hash')
+
+    def __init__(self, high, low, close, volume):
+        self.arrays = tuple(np.array(a, copy=True) for a in (high, low, close, volume))
+        for array in self.arrays:
+            array.flags.writeable = False
+        high, low, close, volume = self.arrays
+        self._hash = hash((
+            len(close), close.dtype.str,
+            close[[0, -1]].tobytes() if len(close) else b'',
+            volume[-1:].tobytes()
+        ))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, _OHLCVKey) or self._hash != other._hash:
+            return False
+        return all(
+            a.dtype == b.dtype and np.array_equal(a, b, equal_nan=True)
+            for a, b in zip(self.arrays, other.arrays)
+        )
+
+
+def _indicator_arrays(high, low, close, volume, ma_p, rsi_p, atr_p, vol_p):
+    """Kroll indicators as arrays: (ma, rsi, atr, volume_ma, volume_ratio, atr_pct)."""
+    if NUMBA_AVAILABLE:
+        # One fused pass over the arrays instead of four rolling passes
+        return kroll_indicators(high, low, close, volume, ma_p, rsi_p, atr_p, vol_p)
+
+    if talib is not None and not any(np.isnan(a).any() for a in (high, low, close, volume)):
+        # TA-Lib's C SMA/RSI/ATR. Its Wilder averages are SMA-seeded, so the
+        # first few dozen bars differ slightly from the RMA kernel; they have
+        # converged within the detect_signal_online() window. NaN gaps would
+        # be carried forward, so such inputs use the pandas helpers.
+        ma = talib.SMA(close, timeperiod=ma_p)
+        rsi = talib.RSI(close, timeperiod=rsi_p)
+        atr = talib.ATR(high, low, close, timeperiod=atr_p)
+        volume_ma = talib.SMA(volume, timeperiod=vol_p)
+    else:
+        ohlcv = pd.DataFrame({'high': high, 'low': low, 'close': close, 'volume': volume})
+        ma = calculate_ma(ohlcv, period=ma_p).to_numpy()
+        rsi = calculate_rsi(ohlcv, period=rsi_p).to_numpy()
+        atr = calculate_atr(ohlcv, period=atr_p).to_numpy()
+        volume_ma = calculate_ma(ohlcv['volume'], period=vol_p).to_numpy()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        volume_ratio = volume / volume_ma
+    # ATR as percentage of price (for volatility check)
+    atr_pct = (atr / close) * 100
+    return ma, rsi, atr, volume_ma, volume_ratio, atr_pct
+
+
+@lru_cache(maxsize=64)
+def _cached_indicator_arrays(key: _OHLCVKey, ma_p, rsi_p, atr_p, vol_p):
+    """_indicator_arrays() memoized across strategy instances.
+
+    Used only by strategies built with memoize_indicators=True: parameter
+    sweeps build a new KrollStrategy per trial over the same history, and
+    trials that only vary stops/position sizing reuse the arrays. Results
+    are shared, so they are returned read-only.
+    """
+    arrays = _indicator_arrays(*key.arrays, ma_p, rsi_p, atr_p, vol_p)
+    for array in arrays:
+        array.flags.writeable = False
+    return arrays
+
+
+@dataclass(frozen=True, slots=True)
+class _RiskFields:
+    """Risk metrics for one signal, before they are laid out in a dict."""
+
+    entry_price: float
+    stop_loss: float
+    take_profit: float
+    position_size_pct: float
+    max_loss_amount: float
+    max_loss_pct: float
+    risk_level: str
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'entry_price': self.entry_price,
+            'stop_loss': self.stop_loss,
+            'take_profit': self.take_profit,
+            'position_size_pct': self.position_size_pct,
+            'max_loss_amount': self.max_loss_amount,
+            'max_loss_pct': self.max_loss_pct,
+            'risk_level': self.risk_level
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class _SignalFields:
+    """Detected signal for one bar; detect_signal() returns it as a dict."""
 
+    action: str
+    confidence: str
+    key_factors: Tuple[str, ...]
+    entry_price: float
+    rsi: float
+    atr: float
+    atr_pct: float
+    position_size_pct: float
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'action': self.action,
+            'confidence': self.confidence,
+            'key_factors': list(self.key_factors),
+            'entry_price': self.entry_price,
+            'rsi': self.rsi,
+            'atr': self.atr,
+            'atr_pct': self.atr_pct,
+            'position_size_pct': self.position_size_pct
+        }
 
-class KrollStrategy:
+
+@dataclass(frozen=True, slots=True)
+class _SignalSnapshot:
+    """Memoized result of fetch + signal detection for one analyze() key."""
+
+    signal: _SignalFields
+    metadata: Tuple[Tuple[str, Any], ...]
+    data_points: int
+
+
+class KrollStrategy(FetcherSessionMixin):
     """Kroll risk-focused strategy analyzer with real data integration."""
 
+    # Max distinct (symbol, date range) results memoized by analyze(memoize=True)
+    ANALYZE_CACHE_SIZE = 1024
+    # Concurrent fetches used by analyze_symbols() (I/O bound)
+    FETCH_WORKERS = 8
+    # OHLCV columns analyze()/analyze_data() require
+    REQUIRED_COLUMNS = ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+    # Indicator columns read by detect_signal(), in unpack order
+    SIGNAL_COLUMNS = ['close', 'ma_60', 'rsi', 'volume_ratio', 'atr', 'atr_pct']
+
+    # Bars of history per Wilder period used by detect_signal_online();
+    # (1 - 1/14) ** 280 ~ 1e-9, so the truncated RSI/ATR match full history.
+    WILDER_WARMUP_FACTOR = 20
+
+    # Dtype of the numba kernels' input and indicator output arrays.
+    # np.float32 halves the bytes moved per bar; the kernels still accumulate
+    # in float64, and signal values are read back as float64.
+    INDICATOR_DTYPE = np.float64
+
     def __init__(
         self,
         ma_period: int = 60,
@@ -38,7 +240,9 @@ class KrollStrategy:
         base_position_pct: float = 12.0,
         reduced_position_pct: float = 8.0,
         high_volatility_threshold: float = 3.0,
-        position_size_pct: float = None  # 兼容参数优化器
+        position_size_pct: float = None,  # 兼容参数优化器
+        cache_manager: Optional[Any] = None,
+        memoize_indicators: bool = False
     ):
         """Initialize Kroll strategy parameters.
 
@@ -56,6 +260,14 @@ class KrollStrategy:
             reduced_position_pct: Reduced position for high volatility (default 8%)
             high_volatility_threshold: ATR% threshold for high volatility (default 3%)
             position_size_pct: Alias for base_position_pct (for optimizer compatibility)
+            cache_manager: Shared investlib_data CacheManager for analyze(); the
+                caller owns (and closes) its session. Default: a session per
+                call, or per `with` block
+            memoize_indicators: Serve indicator arrays for identical OHLCV
+                inputs from a process-wide memo shared by all strategies that
+                enable it; for parameter sweeps over one history. Off by
+                default: bar-by-bar backtests never repeat an input, and the
+                memo copies and hashes every input it sees
         """
         # 支持 position_size_pct 别名（用于参数优化器）
         if position_size_pct is not None:
@@ -77,150 +289,324 @@ class KrollStrategy:
         self.position_size_pct = base_position_pct  # 保存用于输出
         self.logger = logging.getLogger(__name__)
 
-    def calculate_indicators(self, data: pd.DataFrame) -> pd.DataFrame:
+        # Derived once here instead of on every analyze()/risk calculation
+        self._min_required = max(ma_period, rsi_period, atr_period) + 1
+        self._stop_frac = stop_loss_pct / 100
+        self._stop_mult = 1 - self._stop_frac
+        self._tp_mult = 1 + take_profit_pct / 100
+
+        # Per-instance memo of the fetch -> indicators -> signal pipeline
+        self._cached_fetch_and_detect = lru_cache(maxsize=self.ANALYZE_CACHE_SIZE)(
+            self._fetch_and_detect
+        )
+
+        self.memoize_indicators = memoize_indicators
+        self.cache_manager = cache_manager
+        self._init_fetcher_session()
+
+    def _signal_params(self) -> Tuple:
+        """Parameters that affect detect_signal(), used in the analyze() memo key."""
+        return (
+            self.ma_period, self.volume_period, self.rsi_period, self.atr_period,
+            self.volume_threshold, self.rsi_overbought, self.rsi_high_confidence,
+            self.base_position_pct, self.reduced_position_pct,
+            self.high_volatility_threshold
+        )
+
+    def clear_analyze_cache(self) -> None:
+        """Drop memoized analyze() results (e.g. after new bars were published)."""
+        self._cached_fetch_and_detect.cache_clear()
+
+    def calculate_indicators(self, data: pd.DataFrame, tail_only: bool = False) -> pd.DataFrame:
         """Calculate technical indicators for Kroll strategy.
 
         Args:
             data: DataFrame with OHLCV columns
+            tail_only: Only compute the trailing window whose last two bars
+                match a full-history run (see detect_signal_online()); for
+                callers that only need the latest signal (default: False)
 
         Returns:
-            DataFrame with added indicator columns
+            DataFrame with added indicator columns (the trailing window only
+            when tail_only is True)
         """
-        df = data.copy()
+        if tail_only:
+            data = data.iloc[-self._online_window():]
+
+        # Indicators are built as standalone arrays and attached with assign(),
+        # which shares the input OHLCV columns instead of copying the frame.
+        arrays = self._indicator_arrays(data)
+        if self.memoize_indicators:
+            # Memoized arrays are shared and read-only; the frame gets its own
+            arrays = [array.copy() for array in arrays]
+        ma, rsi, atr, volume_ma, volume_ratio, atr_pct = arrays
+
+        return data.assign(
+            ma_60=ma,
+            rsi=rsi,
+            atr=atr,
+            volume_ma=volume_ma,
+            volume_ratio=volume_ratio,
+            atr_pct=atr_pct
+        )
 
-        # MA60
-        df['ma_60'] = calculate_ma(df, period=self.ma_period)
+    def detect_signal_online(self, data: pd.DataFrame, key_factors: bool = True) -> Dict[str, Any]:
+        """Detect the latest signal from the tail of the OHLCV history only.
 
-        # RSI
-        df['rsi'] = calculate_rsi(df, period=self.rsi_period)
+        detect_signal() reads just the last two bars, so only the trailing
+        window that feeds them is run through the indicators: the MA windows
+        plus WILDER_WARMUP_FACTOR bars per RSI/ATR period. Cost is O(window)
+        instead of O(len(data)), which matters when backtests pass an
+        ever-growing history bar by bar. The last two bars are read straight
+        from the indicator arrays, without assembling an indicator frame.
 
-        # ATR
-        df['atr'] = calculate_atr(df, period=self.atr_period)
+        Args:
+            data: DataFrame with OHLCV columns
+            key_factors: Build the key_factors explanations (see detect_signal())
 
-        # Volume average and ratio
-        df['volume_ma'] = df['volume'].rolling(window=self.volume_period).mean()
-        df['volume_ratio'] = df['volume'] / df['volume_ma']
+        Returns:
+            Signal dictionary, same as detect_signal()
+        """
+        return self._detect_online(data, key_factors).as_dict()
+
+    def _detect_online(self, data: pd.DataFrame, key_factors: bool = True) -> _SignalFields:
+        """detect_signal_online() as _SignalFields (the analyze paths' form)."""
+        data = data.iloc[-self._online_window():]
+        ma, rsi, atr, _, volume_ratio, atr_pct = self._indicator_arrays(data)
+
+        # Rows = last two bars, columns in SIGNAL_COLUMNS order; no frame is built
+        tail = np.column_stack((
+            data['close'].to_numpy(dtype=np.float64)[-2:],
+            ma[-2:], rsi[-2:], volume_ratio[-2:], atr[-2:], atr_pct[-2:]
+        )).astype(np.float64, copy=False)
+        return self._signal_from_tail(tail, key_factors)
 
-        # ATR as percentage of price (for volatility check)
-        df['atr_pct'] = (df['atr'] / df['close']) * 100
+    def _indicator_arrays(self, data: pd.DataFrame) -> Tuple[np.ndarray, ...]:
+        """(ma, rsi, atr, volume_ma, volume_ratio, atr_pct) arrays for data.
 
-        return df
+        With memoize_indicators, identical inputs are served from a shared
+        memo and the arrays are read-only.
+        """
+        dtype = self.INDICATOR_DTYPE if NUMBA_AVAILABLE else np.float64
+        ohlcv = (
+            data['high'].to_numpy(dtype=dtype),
+            data['low'].to_numpy(dtype=dtype),
+            data['close'].to_numpy(dtype=dtype),
+            data['volume'].to_numpy(dtype=dtype)
+        )
+        periods = (self.ma_period, self.rsi_period, self.atr_period, self.volume_period)
+        if self.memoize_indicators:
+            return _cached_indicator_arrays(_OHLCVKey(*ohlcv), *periods)
+        return _indicator_arrays(*ohlcv, *periods)
+
+    def _online_window(self) -> int:
+        """Trailing bars needed to reproduce the last two bars' indicators."""
+        return max(
+            self.ma_period + 1,
+            self.volume_period + 1,
+            self.WILDER_WARMUP_FACTOR * max(self.rsi_period, self.atr_period)
+        )
 
-    def detect_signal(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def detect_signal(self, df: pd.DataFrame, key_factors: bool = True) -> Dict[str, Any]:
         """Detect Kroll trading signal from indicators.
 
         Args:
             df: DataFrame with calculated indicators
+            key_factors: Build the human-readable key_factors strings
+                (default: True); optimizer sweeps that only read action and
+                position_size_pct pass False and get an empty list
 
         Returns:
             Signal dictionary with action, confidence, and factors
         """
-        # Use latest data point
-        latest = df.iloc[-1]
-        previous = df.iloc[-2] if len(df) > 1 else latest
+        # Unpack the latest (and previous) bar as scalars in one array read
+        return self._signal_from_tail(
+            df[self.SIGNAL_COLUMNS].iloc[-2:].to_numpy(dtype=np.float64), key_factors
+        ).as_dict()
+
+    def _signal_from_tail(self, tail: np.ndarray, key_factors: bool = True) -> _SignalFields:
+        """detect_signal() on the last one or two rows of SIGNAL_COLUMNS values."""
+        price, ma60, rsi, volume_ratio, atr, atr_pct = tail[-1]
+        previous_above_ma = tail[0, 0] > tail[0, 1]
+
+        return self._signal_from_values(
+            price=price,
+            ma60=ma60,
+            rsi=rsi,
+            volume_ratio=volume_ratio,
+            atr=atr,
+            atr_pct=atr_pct,
+            previous_above_ma=previous_above_ma,
+            explain=key_factors
+        )
+
+    def detect_signals_vectorized(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Apply the Kroll rules to every bar at once (whole-series backtests).
+
+        Same rules as detect_signal(), evaluated with boolean masks over the
+        indicator columns instead of one Python call per bar; bar i sees
+        bar i-1 as its previous bar (the first bar is its own previous).
+
+        Args:
+            df: DataFrame with calculated indicators (calculate_indicators())
+
+        Returns:
+            DataFrame indexed like df with action / confidence (categoricals
+            over ACTION_LABELS / LEVEL_LABELS) and position_size_pct
+        """
+        values = df[self.SIGNAL_COLUMNS].to_numpy(dtype=np.float64)
+        price, ma60, rsi, atr_pct = values[:, 0], values[:, 1], values[:, 2], values[:, 5]
+
+        above_ma = price > ma60
+        previous_above_ma = np.empty_like(above_ma)
+        previous_above_ma[1:] = above_ma[:-1]
+        previous_above_ma[:1] = above_ma[:1]
+
+        rsi_ok = rsi < self.rsi_overbought
+        sell_break = (price < ma60) & previous_above_ma
+        sell_overbought = ~sell_break & ~rsi_ok
+        buy = ~sell_break & rsi_ok & above_ma & (values[:, 3] > self.volume_threshold)
+        buy_high = buy & (rsi < self.rsi_high_confidence)
+
+        # Codes index ACTION_LABELS ('HOLD', 'BUY', 'SELL') / LEVEL_LABELS
+        action = np.select([sell_break | sell_overbought, buy], [2, 1], 0).astype(np.int8)
+        confidence = np.select(
+            [sell_break | buy_high, sell_overbought | buy], [2, 1], 0
+        ).astype(np.int8)
+        position_size = np.where(
+            atr_pct > self.high_volatility_threshold,
+            self.reduced_position_pct,
+            self.base_position_pct
+        )
+
+        return pd.DataFrame({
+            'action': pd.Categorical.from_codes(action, categories=ACTION_LABELS),
+            'confidence': pd.Categorical.from_codes(confidence, categories=LEVEL_LABELS),
+            'position_size_pct': position_size
+        }, index=df.index)
 
+    def _signal_from_values(
+        self,
+        price: float,
+        ma60: float,
+        rsi: float,
+        volume_ratio: float,
+        atr: float,
+        atr_pct: float,
+        previous_above_ma: bool,
+        explain: bool = True
+    ) -> _SignalFields:
+        """Apply the Kroll signal rules to the latest bar's indicator values.
+
+        Shared by detect_signal() and analyze_batch(). With explain=False the
+        key_factors strings are not formatted and the list stays empty.
+        """
         # Initialize signal
         action = 'HOLD'
         confidence = 'LOW'
         key_factors = []
 
-        # Get current values
-        price = latest['close']
-        ma60 = latest['ma_60']
-        rsi = latest['rsi']
-        volume_ratio = latest['volume_ratio']
-        atr = latest['atr']
-        atr_pct = latest['atr_pct']
-
         # Check for bullish breakout: Price > MA60
         price_above_ma = price > ma60
-        if price_above_ma:
+        if price_above_ma and explain:
             key_factors.append(f"Price ({price:.2f}) above MA60 ({ma60:.2f})")
 
         # Check for volume surge
         volume_surge = volume_ratio > self.volume_threshold
-        if volume_surge:
+        if volume_surge and explain:
             key_factors.append(f"Volume surge: {volume_ratio:.2f}x average")
 
         # Check RSI (not overbought)
         rsi_ok = rsi < self.rsi_overbought
-        if not rsi_ok:
+        if not rsi_ok and explain:
             key_factors.append(f"OVERBOUGHT: RSI={rsi:.1f} > {self.rsi_overbought}")
 
         # Check for sell signals (price below MA60 or RSI overbought)
         price_below_ma = price < ma60
-        previous_above_ma = previous['close'] > previous['ma_60'] if 'ma_60' in previous else True
 
         # Determine action and confidence
         # SELL conditions (exit signals)
         if price_below_ma and previous_above_ma:
             action = 'SELL'
             confidence = 'HIGH'
-            key_factors.append(f"Price broke below MA60: {price:.2f} < {ma60:.2f}")
+            if explain:
+                key_factors.append(f"Price broke below MA60: {price:.2f} < {ma60:.2f}")
         elif not rsi_ok:
             # RSI超买也是卖出信号（风险控制）
             action = 'SELL'
             confidence = 'MEDIUM'
-            key_factors.append(f"Overbought exit: RSI={rsi:.1f} > {self.rsi_overbought}")
+            if explain:
+                key_factors.append(f"Overbought exit: RSI={rsi:.1f} > {self.rsi_overbought}")
         # BUY conditions (entry signals)
         elif price_above_ma and volume_surge and rsi_ok:
             action = 'BUY'
             # Confidence based on RSI
             if rsi < self.rsi_high_confidence:
                 confidence = 'HIGH'
-                key_factors.append(f"High confidence: RSI={rsi:.1f} < {self.rsi_high_confidence}")
+                if explain:
+                    key_factors.append(f"High confidence: RSI={rsi:.1f} < {self.rsi_high_confidence}")
             else:
                 confidence = 'MEDIUM'
-                key_factors.append(f"Medium confidence: RSI={rsi:.1f} in [{self.rsi_high_confidence}, {self.rsi_overbought})")
+                if explain:
+                    key_factors.append(f"Medium confidence: RSI={rsi:.1f} in [{self.rsi_high_confidence}, {self.rsi_overbought})")
         else:
             action = 'HOLD'
             confidence = 'LOW'
-            key_factors.append("No strong signal detected")
+            if explain:
+                key_factors.append("No strong signal detected")
 
         # Determine position size based on volatility
         position_size = self.base_position_pct
         if atr_pct > self.high_volatility_threshold:
             position_size = self.reduced_position_pct
-            key_factors.append(f"High volatility (ATR={atr_pct:.2f}%) → reduced position to {position_size}%")
+            if explain:
+                key_factors.append(f"High volatility (ATR={atr_pct:.2f}%) → reduced position to {position_size}%")
 
-        return {
-            'action': action,
-            'confidence': confidence,
-            'key_factors': key_factors,
-            'entry_price': price,
-            'rsi': rsi,
-            'atr': atr,
-            'atr_pct': atr_pct,
-            'position_size_pct': position_size
-        }
+        return _SignalFields(
+            action, confidence, tuple(key_factors), price, rsi, atr, atr_pct, position_size
+        )
 
     def calculate_risk_metrics(
         self,
         signal_data: Dict[str, Any],
-        capital: float = 100000.0
+        capital: float = 100000.0,
+        round_output: bool = True
     ) -> Dict[str, Any]:
         """Calculate risk metrics (stop-loss, take-profit, max loss).
 
         Args:
             signal_data: Signal dictionary from detect_signal()
             capital: Total capital available
+            round_output: Round values to display precision (default: True)
 
         Returns:
             Risk metrics dictionary
         """
+        risk_metrics = self._risk_fields(
+            signal_data['entry_price'], signal_data['position_size_pct'], capital
+        ).as_dict()
+        return format_signal(risk_metrics) if round_output else risk_metrics
+
+    def _risk_fields(
+        self,
+        entry_price: float,
+        position_size_pct: float,
+        capital: float
+    ) -> _RiskFields:
+        """Risk metrics as attributes, shared by calculate_risk_metrics() and
+        _complete_signal() (which writes them straight into the signal dict)."""
         # 确保价格和仓位大小是数值类型
-        entry_price = float(signal_data['entry_price'])
-        position_size_pct = float(signal_data['position_size_pct'])
+        entry_price = float(entry_price)
+        position_size_pct = float(position_size_pct)
 
         # Calculate stop-loss and take-profit (Kroll: tighter stops, conservative targets)
-        stop_loss = entry_price * (1 - self.stop_loss_pct / 100)
-        take_profit = entry_price * (1 + self.take_profit_pct / 100)
+        stop_loss = entry_price * self._stop_mult
+        take_profit = entry_price * self._tp_mult
 
-        # Calculate max loss
-        position_value = capital * (position_size_pct / 100)
-        price_risk = entry_price - stop_loss
-        max_loss_amount = position_value * (price_risk / entry_price)
-        max_loss_pct = (max_loss_amount / capital) * 100
+        # Calculate max loss: the stop risks stop_loss_pct of the position value,
+        # i.e. position_value * (entry_price - stop_loss) / entry_price
+        max_loss_pct = position_size_pct * self._stop_frac
+        max_loss_amount = capital * max_loss_pct / 100
 
         # Determine risk level
         if max_loss_pct < 1.5:
@@ -230,22 +616,18 @@ class KrollStrategy:
         else:
             risk_level = 'HIGH'
 
-        return {
-            'entry_price': round(entry_price, 2),
-            'stop_loss': round(stop_loss, 2),
-            'take_profit': round(take_profit, 2),
-            'position_size_pct': round(position_size_pct, 2),
-            'max_loss_amount': round(max_loss_amount, 2),
-            'max_loss_pct': round(max_loss_pct, 3),
-            'risk_level': risk_level
-        }
+        return _RiskFields(
+            entry_price, stop_loss, take_profit, position_size_pct,
+            max_loss_amount, max_loss_pct, risk_level
+        )
 
     def analyze_data(
         self,
         market_data: pd.DataFrame,
         symbol: str,
         capital: float = 100000.0,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        round_output: bool = True
     ) -> Dict[str, Any]:
         """Analyze provided market data without fetching from API.
 
@@ -256,6 +638,9 @@ class KrollStrategy:
             symbol: Stock symbol (for logging/output)
             capital: Total capital available (default: 100000)
             metadata: Optional metadata dict (for data provenance tracking)
+            round_output: Round prices/indicators to display precision
+                (default: True); pass False to keep raw floats and call
+                format_signal() only on signals that are shown
 
         Returns:
             Complete signal dictionary with action, risk metrics, and data metadata
@@ -263,58 +648,275 @@ class KrollStrategy:
         Raises:
             ValueError: If insufficient data or missing required columns
         """
+        now = datetime.now()
+
         # Use default metadata if not provided
         if metadata is None:
             metadata = {
                 'api_source': 'Direct Data',
-                'retrieval_timestamp': datetime.now(),
+                'retrieval_timestamp': now,
                 'data_freshness': 'unknown'
             }
 
-        # Validate input data
-        required_columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
-        for col in required_columns:
-            if col not in market_data.columns:
-                raise ValueError(f"Missing required column: {col}")
+        self._validate_market_data(market_data, symbol)
+
+        # Detect signal (only the tail of the history is needed)
+        signal = self._detect_online(market_data)
+
+        return self._complete_signal(
+            symbol, signal, capital, metadata, len(market_data), round_output, now
+        )
+
+    def analyze_batch(
+        self,
+        market_data: Dict[str, pd.DataFrame],
+        capital: float = 100000.0,
+        metadata: Optional[Dict[str, Any]] = None,
+        round_output: bool = True
+    ) -> Dict[str, Dict[str, Any]]:
+        """Analyze pre-fetched data for many symbols at once (portfolio scans).
+
+        The trailing window of every symbol is left-padded with NaN into
+        (n_symbols, n_bars) matrices and the indicators are computed by one
+        numba kernel running symbols in parallel. The Kroll rules are then
+        applied to each symbol's last two bars. Without numba this falls back
+        to analyze_data() per symbol.
+
+        Args:
+            market_data: Mapping of symbol -> DataFrame with OHLCV data
+            capital: Total capital available (default: 100000)
+            metadata: Optional metadata dict applied to every symbol
+            round_output: Round prices/indicators (default: True, as analyze_data())
+
+        Returns:
+            Mapping of symbol -> complete signal dictionary (as analyze_data())
+
+        Raises:
+            ValueError: If any symbol has insufficient data or missing columns
+        """
+        if not NUMBA_AVAILABLE:
+            return {
+                symbol: self.analyze_data(data, symbol, capital, metadata, round_output)
+                for symbol, data in market_data.items()
+            }
+
+        # One analysis timestamp for the whole scan
+        now = datetime.now()
+        if metadata is None:
+            metadata = {
+                'api_source': 'Direct Data',
+                'retrieval_timestamp': now,
+                'data_freshness': 'unknown'
+            }
+
+        return self._analyze_frames(
+            market_data, capital, dict.fromkeys(market_data, metadata), round_output, now
+        )
+
+    def _analyze_frames(
+        self,
+        market_data: Dict[str, pd.DataFrame],
+        capital: float,
+        metadata: Dict[str, Dict[str, Any]],
+        round_output: bool,
+        now: datetime
+    ) -> Dict[str, Dict[str, Any]]:
+        """Batch-kernel core of analyze_batch(), with per-symbol metadata."""
+        symbols = list(market_data)
+        window = self._online_window()
+        tails = []
+        for symbol in symbols:
+            self._validate_market_data(market_data[symbol], symbol)
+            tails.append(market_data[symbol].iloc[-window:])
+
+        n_bars = max(len(tail) for tail in tails)
+        ohlcv = np.full((4, len(symbols), n_bars), np.nan, dtype=self.INDICATOR_DTYPE)
+        for row, tail in enumerate(tails):
+            start = n_bars - len(tail)
+            for field, col in enumerate(('high', 'low', 'close', 'volume')):
+                ohlcv[field, row, start:] = tail[col].to_numpy()
+
+        # Only the last two bars feed the rules; read them back as float64
+        ma, rsi, atr, _, volume_ratio, atr_pct = kroll_indicators_batch(
+            ohlcv[0], ohlcv[1], ohlcv[2], ohlcv[3],
+            self.ma_period, self.rsi_period, self.atr_period, self.volume_period
+        )[:, :, -2:].astype(np.float64)
+        close = ohlcv[2, :, -2:].astype(np.float64)
+
+        results = {}
+        for row, symbol in enumerate(symbols):
+            signal = self._signal_from_values(
+                price=close[row, -1],
+                ma60=ma[row, -1],
+                rsi=rsi[row, -1],
+                volume_ratio=volume_ratio[row, -1],
+                atr=atr[row, -1],
+                atr_pct=atr_pct[row, -1],
+                previous_above_ma=close[row, -2] > ma[row, -2]
+            )
+            results[symbol] = self._complete_signal(
+                symbol, signal, capital, metadata[symbol], len(market_data[symbol]),
+                round_output, now
+            )
+        return results
+
+    def analyze_symbols(
+        self,
+        symbols: List[str],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        capital: float = 100000.0,
+        use_cache: bool = True,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Fetch and analyze many symbols at once (portfolio scans, optimizers).
+
+        Market data is fetched concurrently on a thread pool, each worker
+        with its own DB session, and the signals are then computed in one
+        batch-kernel pass (see analyze_batch()). A caller-owned
+        cache_manager holds a single session, so its fetches run serially.
+
+        Args:
+            symbols: Stock symbols (e.g. ['600519.SH', '000001.SZ'])
+            start_date: Start date in YYYY-MM-DD format (default: auto-calculated)
+            end_date: End date in YYYY-MM-DD format (default: today)
+            capital: Total capital available (default: 100000)
+            use_cache: Whether to use cached data (default: True)
+            max_workers: Fetch threads (default: FETCH_WORKERS)
+
+        Returns:
+            Mapping of symbol -> complete signal dictionary (as analyze())
+
+        Raises:
+            ValueError: If any symbol has insufficient data
+            NoDataAvailableError: If all data sources fail for any symbol
+        """
+        now = datetime.now()
+        start_date, end_date = self._date_range(start_date, end_date, now)
+
+        if use_cache and self.cache_manager is not None:
+            max_workers = 1
+        elif max_workers is None:
+            max_workers = self.FETCH_WORKERS
+
+        def fetch(symbol):
+            return self._fetch_market_data(
+                symbol, start_date, end_date, use_cache, shared=max_workers == 1
+            )
+
+        if max_workers == 1:
+            results = [fetch(symbol) for symbol in symbols]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                results = list(pool.map(fetch, symbols))
+
+        market_data, metadata = {}, {}
+        for symbol, result in zip(symbols, results):
+            market_data[symbol] = result['data']
+            metadata[symbol] = result['metadata']
+            self._validate_market_data(
+                market_data[symbol], symbol, hint=" Try extending date range."
+            )
+
+        if not NUMBA_AVAILABLE:
+            return {
+                symbol: self._complete_signal(
+                    symbol, self._detect_online(data), capital, metadata[symbol],
+                    len(data), now=now
+                )
+                for symbol, data in market_data.items()
+            }
+        return self._analyze_frames(market_data, capital, metadata, True, now)
+
+    @staticmethod
+    def signals_to_frame(signals: Dict[str, Dict[str, Any]]) -> pd.DataFrame:
+        """Stack signal dicts (e.g. from analyze_batch()) into a DataFrame.
+
+        action / confidence / risk_level become categoricals over
+        ACTION_LABELS / LEVEL_LABELS, so long signal histories store one
+        int8 code per row instead of a Python string reference.
+
+        Args:
+            signals: Mapping of symbol (or date) -> signal dictionary
+
+        Returns:
+            DataFrame indexed by the mapping keys, one row per signal
+        """
+        frame = pd.DataFrame.from_dict(signals, orient='index')
+        for field, labels in _CATEGORICAL_FIELDS.items():
+            if field in frame.columns:
+                frame[field] = pd.Categorical(frame[field], categories=labels)
+        return frame
+
+    def _validate_market_data(
+        self,
+        market_data: pd.DataFrame,
+        symbol: str,
+        hint: str = ''
+    ) -> None:
+        """Check required columns and minimum history (shared by all analyze paths).
+
+        Args:
+            market_data: DataFrame with OHLCV data
+            symbol: Stock symbol (for the error message)
+            hint: Optional suffix for the insufficient-data message
+        """
+        missing = set(self.REQUIRED_COLUMNS).difference(market_data.columns)
+        if missing:
+            raise ValueError(f"Missing required columns: {sorted(missing)}")
 
         # Require minimum data points
-        min_required = max(self.ma_period, self.rsi_period, self.atr_period) + 1
-        if len(market_data) < min_required:
+        if len(market_data) < self._min_required:
             raise ValueError(
-                f"Insufficient data for {symbol}: need at least {min_required} days, "
-                f"got {len(market_data)} days."
+                f"Insufficient data for {symbol}: need at least {self._min_required} days, "
+                f"got {len(market_data)} days.{hint}"
             )
 
-        # Calculate indicators
-        df = self.calculate_indicators(market_data)
-
-        # Detect signal
-        signal_data = self.detect_signal(df)
+    def _complete_signal(
+        self,
+        symbol: str,
+        signal: _SignalFields,
+        capital: float,
+        metadata: Dict[str, Any],
+        data_points: int,
+        round_output: bool = True,
+        now: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """Combine a detected signal with risk metrics and data metadata.
 
-        # Calculate risk metrics
-        risk_metrics = self.calculate_risk_metrics(signal_data, capital)
+        now is the caller's clock reading (analysis_timestamp), taken once
+        per analyze call instead of once per field.
+        """
+        # Calculate risk metrics (rounded below together with the indicators)
+        risk = self._risk_fields(signal.entry_price, signal.position_size_pct, capital)
 
         # Combine into complete signal with metadata
         complete_signal = {
             'symbol': symbol,
             'strategy': 'Kroll',
-            'action': signal_data['action'],
-            'confidence': signal_data['confidence'],
-            'key_factors': signal_data['key_factors'],
-            **risk_metrics,
+            'action': signal.action,
+            'confidence': signal.confidence,
+            'key_factors': list(signal.key_factors),
+            'entry_price': risk.entry_price,
+            'stop_loss': risk.stop_loss,
+            'take_profit': risk.take_profit,
+            'position_size_pct': risk.position_size_pct,
+            'max_loss_amount': risk.max_loss_amount,
+            'max_loss_pct': risk.max_loss_pct,
+            'risk_level': risk.risk_level,
             # Technical indicators
-            'rsi': round(signal_data['rsi'], 2),
-            'atr': round(signal_data['atr'], 2),
-            'atr_pct': round(signal_data['atr_pct'], 2),
+            'rsi': signal.rsi,
+            'atr': signal.atr,
+            'atr_pct': signal.atr_pct,
             # Data metadata
             'data_source': metadata.get('api_source', 'Unknown'),
             'data_timestamp': metadata['retrieval_timestamp'].isoformat() if isinstance(metadata.get('retrieval_timestamp'), datetime) else str(metadata.get('retrieval_timestamp', 'Unknown')),
             'data_freshness': metadata.get('data_freshness', 'unknown'),
-            'data_points': len(market_data),
-            'analysis_timestamp': datetime.now().isoformat()
+            'data_points': data_points,
+            'analysis_timestamp': (now or datetime.now()).isoformat()
         }
 
-        return complete_signal
+        return format_signal(complete_signal) if round_output else complete_signal
 
     def analyze(
         self,
@@ -322,7 +924,8 @@ class KrollStrategy:
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
         capital: float = 100000.0,
-        use_cache: bool = True
+        use_cache: bool = True,
+        memoize: bool = False
     ) -> Dict[str, Any]:
         """Analyze market data and generate Kroll trading signal using real market data.
 
@@ -332,6 +935,10 @@ class KrollStrategy:
             end_date: End date in YYYY-MM-DD format (default: today)
             capital: Total capital available (default: 100000)
             use_cache: Whether to use cached data (default: True)
+            memoize: Serve repeated (symbol, date range) calls from this
+                instance's memo, e.g. in backtests over historical ranges.
+                Only ranges ending before today are memoized, since today's
+                bars can still change (default: False)
 
         Returns:
             Complete signal dictionary with action, risk metrics, data metadata
@@ -340,110 +947,133 @@ class KrollStrategy:
             ValueError: If insufficient data for analysis
             NoDataAvailableError: If all data sources fail
         """
-        # Set default date range (need enough for MA60 + RSI/ATR)
+        now = datetime.now()
+        start_date, end_date = self._date_range(start_date, end_date, now)
+
+        # Opt-in memo for closed ranges; use_cache=False asks for fresh data,
+        # so it bypasses the memo too.
+        if memoize and use_cache and pd.Timestamp(end_date) < pd.Timestamp(now.date()):
+            snapshot = self._cached_fetch_and_detect(
+                symbol, start_date, end_date, use_cache, self._signal_params()
+            )
+        else:
+            snapshot = self._fetch_and_detect(symbol, start_date, end_date, use_cache)
+
+        return self._complete_signal(
+            symbol, snapshot.signal, capital, dict(snapshot.metadata), snapshot.data_points,
+            now=now
+        )
+
+    def _date_range(
+        self,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        now: datetime
+    ) -> Tuple[str, str]:
+        """Fill in the default date range (need enough for MA60 + RSI/ATR)."""
         if not end_date:
-            end_date = datetime.now().strftime('%Y-%m-%d')
+            end_date = now.strftime('%Y-%m-%d')
         if not start_date:
             # Need ~1.5x trading days for MA60 + buffer
             days_needed = int(self.ma_period * 1.5 + 30)  # 60 * 1.5 + 30 = 120 days
-            start_date = (datetime.now() - timedelta(days=days_needed)).strftime('%Y-%m-%d')
+            start_date = (now - timedelta(days=days_needed)).strftime('%Y-%m-%d')
+        return start_date, end_date
 
-        # Fetch real data
-        from investlib_data.cache_manager import CacheManager
-        from investlib_data.database import SessionLocal
+    def _fetch_market_data(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+        use_cache: bool,
+        shared: bool = True
+    ) -> Dict[str, Any]:
+        """Fetch one symbol's data; returns fetch_with_fallback()'s result dict.
 
-        cache_manager = None
-        session = None
-        if use_cache:
-            try:
-                session = SessionLocal()
-                cache_manager = CacheManager(session=session)
-            except Exception as e:
-                self.logger.warning(f"Cache not available: {e}")
+        Args:
+            symbol: Stock symbol
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format
+            use_cache: Whether to use the database cache
+            shared: Use the `with`-block fetcher (see _open_fetcher())
 
-        fetcher = MarketDataFetcher(cache_manager=cache_manager)
+        Raises:
+            NoDataAvailableError: If all data sources fail
+        """
+        fetcher, session = self._open_fetcher(use_cache, shared)
 
         self.logger.info(f"[KrollStrategy] Fetching data for {symbol} from {start_date} to {end_date}")
 
         try:
-            try:
-                result = fetcher.fetch_with_fallback(symbol, start_date, end_date)
-            except NoDataAvailableError as e:
-                self.logger.error(f"[KrollStrategy] Failed to fetch data for {symbol}: {e}")
-                raise
-
-            market_data = result['data']
-            metadata = result['metadata']
-
-            # Log data provenance
-            self.logger.info(
-                f"[KrollStrategy] Analyzing {symbol} with data from {metadata['api_source']}, "
-                f"retrieved at {metadata['retrieval_timestamp']}, freshness={metadata['data_freshness']}"
-            )
-
-            # Validate input data
-            required_columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
-            for col in required_columns:
-                if col not in market_data.columns:
-                    raise ValueError(f"Missing required column: {col}")
-
-            # Require minimum data points
-            min_required = max(self.ma_period, self.rsi_period, self.atr_period) + 1
-            if len(market_data) < min_required:
-                raise ValueError(
-                    f"Insufficient data for {symbol}: need at least {min_required} days, "
-                    f"got {len(market_data)} days. Try extending date range."
-                )
-
-            # Calculate indicators
-            df = self.calculate_indicators(market_data)
-
-            # Detect signal
-            signal_data = self.detect_signal(df)
-
-            # Calculate risk metrics
-            risk_metrics = self.calculate_risk_metrics(signal_data, capital)
-
-            # Combine into complete signal with metadata
-            complete_signal = {
-                'symbol': symbol,
-                'strategy': 'Kroll',
-                'action': signal_data['action'],
-                'confidence': signal_data['confidence'],
-                'key_factors': signal_data['key_factors'],
-                **risk_metrics,
-                # Technical indicators
-                'rsi': round(signal_data['rsi'], 2),
-                'atr': round(signal_data['atr'], 2),
-                'atr_pct': round(signal_data['atr_pct'], 2),
-                # Data metadata
-                'data_source': metadata['api_source'],
-                'data_timestamp': metadata['retrieval_timestamp'].isoformat() if isinstance(metadata['retrieval_timestamp'], datetime) else str(metadata['retrieval_timestamp']),
-                'data_freshness': metadata['data_freshness'],
-                'data_points': len(market_data),
-                'analysis_timestamp': datetime.now().isoformat()
-            }
-
-            return complete_signal
+            result = fetcher.fetch_with_fallback(symbol, start_date, end_date)
+        except NoDataAvailableError as e:
+            self.logger.error(f"[KrollStrategy] Failed to fetch data for {symbol}: {e}")
+            raise
         finally:
             # CRITICAL: Close database session to prevent connection leaks
+            # (a session shared inside a `with` block is closed by close())
             if session:
                 session.close()
                 self.logger.debug("[KrollStrategy] Database session closed")
 
+        metadata = result['metadata']
+
+        # Log data provenance
+        self.logger.info(
+            f"[KrollStrategy] Analyzing {symbol} with data from {metadata['api_source']}, "
+            f"retrieved at {metadata['retrieval_timestamp']}, freshness={metadata['data_freshness']}"
+        )
+        return result
+
+    def _fetch_and_detect(
+        self,
+        symbol: str,
+        start_date: str,
+        end_date: str,
+        use_cache: bool,
+        signal_params: Optional[Tuple] = None
+    ) -> _SignalSnapshot:
+        """Fetch market data and detect the Kroll signal (memoized by analyze()).
+
+        Args:
+            symbol: Stock symbol
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format
+            use_cache: Whether to use the database cache
+            signal_params: _signal_params() snapshot; only part of the memo key
+
+        Returns:
+            _SignalSnapshot with the signal, data metadata and row count
+
+        Raises:
+            ValueError: If insufficient data for analysis
+            NoDataAvailableError: If all data sources fail
+        """
+        # Fetch real data
+        result = self._fetch_market_data(symbol, start_date, end_date, use_cache)
+        market_data = result['data']
+
+        self._validate_market_data(market_data, symbol, hint=" Try extending date range.")
+
+        # Detect signal (only the tail of the history is needed); _SignalFields
+        # is immutable, so the memo can hand it out as is
+        return _SignalSnapshot(
+            signal=self._detect_online(market_data),
+            metadata=tuple(result['metadata'].items()),
+            data_points=len(market_data)
+        )
+
 
 # 注册策略到策略中心
+@lru_cache(maxsize=1)
 def register_strategy():
-    """注册Kroll策略到策略注册中心。"""
+    """注册Kroll策略到策略注册中心。
+
+    Not run at import: investlib_quant.strategies calls it when the registry
+    is loaded, so importing KrollStrategy alone stays cheap. Repeat calls are
+    no-ops.
+    """
     try:
         # 延迟导入，避免循环依赖
-        import sys
-        import os
-        # 添加 src 目录到路径
-        src_path = os.path.join(os.path.dirname(__file__), '../src')
-        if src_path not in sys.path:
-            sys.path.insert(0, src_path)
-
         from investlib_quant.strategies.registry import StrategyRegistry, StrategyInfo
 
         strategy_info = StrategyInfo(
@@ -530,7 +1160,3 @@ for factor in signal['key_factors']:
     except ImportError:
         # 如果注册中心还未创建，静默失败
         pass
-
-
-# 模块加载时尝试注册
-register_strategy()
@@ -12,14 +12,247 @@ V0.2 Update: Now uses real market data via MarketDataFetcher (US5 - T013)
 import pandas as pd
 import numpy as np
 import logging
-from typing import Dict, Any, List, Optional, Union
+from collections import deque, namedtuple
+from typing import Dict, Any, List, Literal, Optional, Tuple, Union
 from datetime import datetime, timedelta
-from investlib_data.market_api import MarketDataFetcher, NoDataAvailableError
+from investlib_data.market_api import NoDataAvailableError
+from investlib_quant._fetcher_session import FetcherSessionMixin
+from investlib_quant.signal_labels import ACTION_LABELS, LEVEL_LABELS
+from investlib_quant.indicators._kernels import (
+    NUMBA_AVAILABLE, livermore_indicators, livermore_indicators_batch, wilder_atr
+)
+
+
+# OHLCV columns the indicators read, as C-contiguous float64 arrays
+_Bars = namedtuple('_Bars', 'high low close volume')
+
+
+def _prepare_bars(data: pd.DataFrame) -> _Bars:
+    """Convert the OHLCV columns once (int volume, strided slices) for the kernels."""
+    return _Bars(*(
+        np.ascontiguousarray(data[col].to_numpy(), dtype=np.float64)
+        for col in _Bars._fields
+    ))
+
+
+class _RollingMean:
+    """Rolling mean over the last `window` pushes, kept as a running sum.
+
+    Like pandas rolling(window).mean(): NaN until the window is full, and
+    NaN while any value in the window is NaN.
+    """
+
+    __slots__ = ('window', 'values', 'total', 'nan_count')
+
+    def __init__(self, window: int):
+        self.window = window
+        self.values = deque(maxlen=window)
+        self.total = 0.0
+        self.nan_count = 0
+
+    def push(self, value: float) -> float:
+        if len(self.values) == self.window:
+            old = self.values[0]
+            if old != old:
+                self.nan_count -= 1
+            else:
+                self.total -= old
+        self.values.append(value)
+        if value != value:
+            self.nan_count += 1
+        else:
+            self.total += value
+        if len(self.values) < self.window or self.nan_count:
+            return np.nan
+        return self.total / self.window
+
+
+class _WilderMean:
+    """Streaming Wilder ATR (_kernels._wilder_update): one float, no window.
+
+    NaN until `period` true ranges have seeded it; a NaN true range
+    restarts the seed.
+    """
+
+    __slots__ = ('period', 'value', 'count')
+
+    def __init__(self, period: int):
+        self.period = period
+        self.value = 0.0
+        self.count = 0
+
+    def push(self, tr: float) -> float:
+        if tr != tr:
+            self.value, self.count = 0.0, 0
+            return np.nan
+        if self.count < self.period:
+            self.value += tr
+            self.count += 1
+            if self.count < self.period:
+                return np.nan
+            self.value /= self.period
+        else:
+            self.value = (self.value * (self.period - 1) + tr) / self.period
+        return self.value
+
+
+def _ema_alpha(span: int) -> float:
+    """Smoothing factor of pandas ewm(span=span)."""
+    return 2.0 / (span + 1.0)
+
+
+class _EWMean:
+    """Streaming pandas ewm(alpha=alpha, adjust=False).mean(), NaN-aware."""
+
+    __slots__ = ('alpha', 'value', 'old_wt')
 
+    def __init__(self, alpha: float):
+        self.alpha = alpha
+        self.value = np.nan
+        self.old_wt = 1.0
 
-class LivermoreStrategy:
+    def update(self, x: float) -> float:
+        if self.value != self.value:
+            self.value = x
+            return x
+        self.old_wt *= 1.0 - self.alpha
+        if x == x:
+            if self.value != x:
+                self.value = (self.old_wt * self.value + self.alpha * x) / (self.old_wt + self.alpha)
+            self.old_wt = 1.0
+        return self.value
+
+
+class LivermoreState:
+    """Livermore indicators maintained bar by bar in O(1) per update.
+
+    Holds the running MA/volume/ATR window sums and the three MACD EMA
+    registers, so live analysis and rolling backtests do not recompute the
+    whole history on every new bar. Values match calculate_indicators() on
+    the same bars.
+
+    Example:
+        >>> state = strategy.new_state()
+        >>> for bar in bars.itertuples():
+        ...     state.update(bar.high, bar.low, bar.close, bar.volume)
+        ...     if state.ready:
+        ...         signal = strategy.detect_signal(state)
+    """
+
+    def __init__(
+        self,
+        ma_period: int = 120,
+        volume_period: int = 20,
+        macd_fast: int = 12,
+        macd_slow: int = 26,
+        macd_signal: int = 9,
+        atr_period: int = 14,
+        atr_method: Literal['sma', 'wilder'] = 'sma'
+    ):
+        self._wilder = atr_method == 'wilder'
+        # Wilder's true range needs a previous close, so it seeds a bar later
+        self._warmup = max(ma_period, volume_period, atr_period + self._wilder)
+        self._ma = _RollingMean(ma_period)
+        self._volume_ma = _RollingMean(volume_period)
+        self._tr_ma = _WilderMean(atr_period) if self._wilder else _RollingMean(atr_period)
+        self._ema_fast = _EWMean(_ema_alpha(macd_fast))
+        self._ema_slow = _EWMean(_ema_alpha(macd_slow))
+        self._ema_signal = _EWMean(_ema_alpha(macd_signal))
+        self._prev_close = np.nan
+        self.bars = 0
+        self.latest: Optional[Dict[str, float]] = None
+        self.previous: Optional[Dict[str, float]] = None
+
+    @property
+    def ready(self) -> bool:
+        """True once every rolling window has been filled."""
+        return self.bars >= self._warmup
+
+    def update(self, high: float, low: float, close: float, volume: float) -> Dict[str, float]:
+        """Add one bar and return its indicator values (calculate_indicators() columns)."""
+        high, low, close, volume = float(high), float(low), float(close), float(volume)
+
+        volume_ma = self._volume_ma.push(volume)
+        macd = self._ema_fast.update(close) - self._ema_slow.update(close)
+        macd_signal = self._ema_signal.update(macd)
+
+        # True range: NaN terms are skipped, as in the pandas max(axis=1),
+        # except under Wilder, which needs them all (np.max propagates NaN)
+        terms = (high - low, abs(high - self._prev_close), abs(low - self._prev_close))
+        true_range = np.max(terms) if self._wilder else np.fmax.reduce(terms)
+        self._prev_close = close
+
+        if volume_ma != 0.0:
+            volume_ratio = volume / volume_ma
+        else:
+            volume_ratio = np.inf if volume > 0.0 else np.nan
+
+        self.previous = self.latest
+        self.latest = {
+            'close': close,
+            'ma_120': self._ma.push(close),
+            'volume_ma': volume_ma,
+            'volume_ratio': volume_ratio,
+            'macd': macd,
+            'macd_signal': macd_signal,
+            'macd_histogram': macd - macd_signal,
+            'atr': self._tr_ma.push(float(true_range))
+        }
+        self.bars += 1
+        return self.latest
+
+
+def _livermore_rule(
+    bullish_breakout: bool,
+    volume_spike: bool,
+    macd_golden_cross: bool,
+    macd_positive: bool,
+    below_ma: bool,
+    macd_negative: bool
+) -> Tuple[str, str, Optional[str]]:
+    """Livermore action rules on the bar's boolean facts.
+
+    Returns (action, confidence, reason); reason is the key factor the
+    chosen branch adds, if any.
+    """
+    if bullish_breakout and volume_spike and macd_golden_cross:
+        return 'BUY', 'HIGH', None
+    elif bullish_breakout and volume_spike:
+        return 'BUY', 'MEDIUM', "Bullish breakout with volume confirmation"
+    elif bullish_breakout and macd_positive:
+        return 'BUY', 'MEDIUM', "Bullish breakout with MACD support"
+    elif below_ma and volume_spike:
+        return 'SELL', 'MEDIUM', "Price below 120-day MA, bearish signal"
+    elif below_ma and macd_negative:
+        return 'SELL', 'LOW', "Bearish trend detected"
+    else:
+        return 'HOLD', 'LOW', "No strong trend detected, holding position"
+
+
+# _livermore_rule() for every combination of its facts, indexed by the
+# bitmask fact_0 | fact_1 << 1 | ... | fact_5 << 5 (argument order)
+_RULE_TABLE = tuple(
+    _livermore_rule(*(bool(key >> bit & 1) for bit in range(6)))
+    for key in range(64)
+)
+
+# The rule table as ACTION_LABELS / LEVEL_LABELS code arrays for
+# detect_signals_vectorized()
+_ACTION_CODES = np.array([ACTION_LABELS.index(rule[0]) for rule in _RULE_TABLE], dtype=np.int8)
+_LEVEL_CODES = np.array([LEVEL_LABELS.index(rule[1]) for rule in _RULE_TABLE], dtype=np.int8)
+
+
+class LivermoreStrategy(FetcherSessionMixin):
     """Livermore trend-following strategy analyzer with real data integration."""
 
+    # Indicator columns read by detect_signal(), in unpack order
+    SIGNAL_COLUMNS = ['close', 'ma_120', 'volume_ratio', 'macd', 'macd_signal', 'atr']
+
+    # Dtype of the OHLCV matrices analyze_batch() hands to the numba kernel.
+    # np.float32 halves the bytes moved per bar; the kernel still accumulates
+    # in float64, and signal values are read back as float64.
+    INDICATOR_DTYPE = np.float64
+
     def __init__(
         self,
         ma_period: int = 120,
@@ -28,6 +261,7 @@ class LivermoreStrategy:
         macd_slow: int = 26,
         macd_signal: int = 9,
         atr_period: int = 14,
+        atr_method: Literal['sma', 'wilder'] = 'sma',
         risk_pct: float = 2.0,
         stop_loss_atr_multiple: float = 2.0,
         risk_reward_ratio: float = 3.0
@@ -41,6 +275,8 @@ class LivermoreStrategy:
             macd_slow: MACD slow period (default 26)
             macd_signal: MACD signal period (default 9)
             atr_period: ATR period for stop-loss (default 14)
+            atr_method: 'sma' for a rolling mean of the true range (default),
+                'wilder' for Wilder's smoothing as in TA-Lib's ATR
             risk_pct: Risk percentage per trade (default 2%)
             stop_loss_atr_multiple: ATR multiple for stop-loss (default 2.0)
             risk_reward_ratio: Minimum risk-reward ratio (default 3.0)
@@ -50,12 +286,22 @@ class LivermoreStrategy:
         self.macd_fast = macd_fast
         self.macd_slow = macd_slow
         self.macd_signal = macd_signal
+        if atr_method not in ('sma', 'wilder'):
+            raise ValueError(f"atr_method must be 'sma' or 'wilder', got {atr_method!r}")
         self.atr_period = atr_period
+        self.atr_method = atr_method
         self.risk_pct = risk_pct
         self.stop_loss_atr_multiple = stop_loss_atr_multiple
         self.risk_reward_ratio = risk_reward_ratio
         self.logger = logging.getLogger(__name__)
 
+        # MACD EMA smoothing factors, derived once for the numba kernels
+        self._macd_alphas = (
+            _ema_alpha(macd_fast), _ema_alpha(macd_slow), _ema_alpha(macd_signal)
+        )
+
+        self._init_fetcher_session()
+
     def calculate_indicators(self, data: pd.DataFrame) -> pd.DataFrame:
         """Calculate technical indicators.
 
@@ -65,104 +311,218 @@ class LivermoreStrategy:
         Returns:
             DataFrame with added indicator columns
         """
-        df = data.copy()
+        # Indicators are built as standalone arrays and attached with assign(),
+        # which shares the input OHLCV columns instead of copying the frame.
+        ma, volume_ma, volume_ratio, macd, macd_signal, macd_histogram, atr = (
+            self._indicator_arrays(data)
+        )
+        return data.assign(
+            ma_120=ma,
+            volume_ma=volume_ma,
+            volume_ratio=volume_ratio,
+            macd=macd,
+            macd_signal=macd_signal,
+            macd_histogram=macd_histogram,
+            atr=atr
+        )
+
+    def _indicator_arrays(
+        self,
+        data: pd.DataFrame,
+        bars: Optional[_Bars] = None
+    ) -> Tuple[np.ndarray, ...]:
+        """(ma, volume_ma, volume_ratio, macd, macd_signal, macd_histogram, atr) arrays.
+
+        bars: data's _prepare_bars() arrays, when the caller already has them
+        """
+        if NUMBA_AVAILABLE:
+            # All indicators in one compiled pass over the OHLCV arrays
+            return livermore_indicators(
+                *(bars or _prepare_bars(data)),
+                self.ma_period, self.volume_period, *self._macd_alphas, self.atr_period,
+                self.atr_method == 'wilder'
+            )
 
         # 120-day moving average
-        df['ma_120'] = df['close'].rolling(window=self.ma_period).mean()
+        ma = data['close'].rolling(window=self.ma_period).mean()
 
         # Volume moving average
-        df['volume_ma'] = df['volume'].rolling(window=self.volume_period).mean()
-        df['volume_ratio'] = df['volume'] / df['volume_ma']
+        volume_ma = data['volume'].rolling(window=self.volume_period).mean()
+        volume_ratio = data['volume'] / volume_ma
 
         # MACD
-        ema_fast = df['close'].ewm(span=self.macd_fast, adjust=False).mean()
-        ema_slow = df['close'].ewm(span=self.macd_slow, adjust=False).mean()
-        df['macd'] = ema_fast - ema_slow
-        df['macd_signal'] = df['macd'].ewm(span=self.macd_signal, adjust=False).mean()
-        df['macd_histogram'] = df['macd'] - df['macd_signal']
-
-        # ATR (Average True Range)
-        high_low = df['high'] - df['low']
-        high_close = np.abs(df['high'] - df['close'].shift())
-        low_close = np.abs(df['low'] - df['close'].shift())
-        true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-        df['atr'] = true_range.rolling(window=self.atr_period).mean()
-
-        return df
-
-    def detect_signal(self, df: pd.DataFrame) -> Dict[str, Any]:
+        ema_fast = data['close'].ewm(span=self.macd_fast, adjust=False).mean()
+        ema_slow = data['close'].ewm(span=self.macd_slow, adjust=False).mean()
+        macd = ema_fast - ema_slow
+        macd_signal = macd.ewm(span=self.macd_signal, adjust=False).mean()
+        macd_histogram = macd - macd_signal
+
+        # ATR (Average True Range). fmax skips the NaN previous close on the
+        # first bar, matching DataFrame.max(axis=1) without the concat;
+        # Wilder's ATR needs every term, so np.max keeps it NaN.
+        high = data['high'].to_numpy(dtype=np.float64)
+        low = data['low'].to_numpy(dtype=np.float64)
+        prev_close = data['close'].shift().to_numpy(dtype=np.float64)
+        terms = [high - low, np.abs(high - prev_close), np.abs(low - prev_close)]
+        if self.atr_method == 'wilder':
+            atr = wilder_atr(np.max(terms, axis=0), self.atr_period)
+        else:
+            atr = pd.Series(np.fmax.reduce(terms)).rolling(window=self.atr_period).mean()
+
+        return tuple(
+            np.asarray(series, dtype=np.float64)
+            for series in (ma, volume_ma, volume_ratio, macd, macd_signal, macd_histogram, atr)
+        )
+
+    def new_state(self) -> LivermoreState:
+        """Streaming indicator state with this strategy's periods."""
+        return LivermoreState(
+            self.ma_period, self.volume_period, self.macd_fast,
+            self.macd_slow, self.macd_signal, self.atr_period, self.atr_method
+        )
+
+    def detect_signal(
+        self,
+        df: Union[pd.DataFrame, LivermoreState],
+        key_factors: bool = True
+    ) -> Dict[str, Any]:
         """Detect trading signal from indicators.
 
         Args:
-            df: DataFrame with calculated indicators
+            df: DataFrame with calculated indicators, or a LivermoreState
+                updated through the latest bar
+            key_factors: Build the human-readable key_factors strings
+                (default: True); backtests that only read action pass False
+                and get an empty list
 
         Returns:
             Signal dictionary with action, confidence, and key factors
         """
-        # Use latest data point
-        latest = df.iloc[-1]
-        previous = df.iloc[-2] if len(df) > 1 else latest
+        # Latest (and previous) bar as rows of SIGNAL_COLUMNS values
+        if isinstance(df, LivermoreState):
+            tail = np.array([
+                [row[col] for col in self.SIGNAL_COLUMNS]
+                for row in (df.previous or df.latest, df.latest)
+            ])
+        else:
+            tail = df[self.SIGNAL_COLUMNS].iloc[-2:].to_numpy(dtype=np.float64)
+
+        price, ma, volume_ratio, macd, macd_signal, atr = tail[-1]
+        return self._signal_from_values(
+            price, ma, volume_ratio, macd, macd_signal, atr,
+            previous_macd=tail[0, 3],
+            previous_macd_signal=tail[0, 4],
+            explain=key_factors
+        )
 
-        # Initialize signal
-        action = 'HOLD'
-        confidence = 'LOW'
+    def _signal_from_values(
+        self,
+        price: float,
+        ma: float,
+        volume_ratio: float,
+        macd: float,
+        macd_signal: float,
+        atr: float,
+        previous_macd: float,
+        previous_macd_signal: float,
+        explain: bool = True
+    ) -> Dict[str, Any]:
+        """Apply the Livermore rules to the latest bar's indicator values.
+
+        Shared by detect_signal() and analyze_batch(). With explain=False the
+        key_factors strings are not formatted and the list stays empty.
+        """
         key_factors = []
 
         # Check for bullish breakout
-        bullish_breakout = False
-        if latest['close'] > latest['ma_120']:
-            key_factors.append(f"Price ({latest['close']:.2f}) above 120-day MA ({latest['ma_120']:.2f})")
-            bullish_breakout = True
+        bullish_breakout = price > ma
+        if bullish_breakout and explain:
+            key_factors.append(f"Price ({price:.2f}) above 120-day MA ({ma:.2f})")
 
         # Check for volume spike (>30% above average)
-        volume_spike = False
-        if latest['volume_ratio'] > 1.3:
-            key_factors.append(f"Volume spike: {latest['volume_ratio']:.1f}x average")
-            volume_spike = True
+        volume_spike = volume_ratio > 1.3
+        if volume_spike and explain:
+            key_factors.append(f"Volume spike: {volume_ratio:.1f}x average")
 
         # Check for MACD golden cross
-        macd_golden_cross = False
-        if latest['macd'] > latest['macd_signal'] and previous['macd'] <= previous['macd_signal']:
+        macd_golden_cross = macd > macd_signal and previous_macd <= previous_macd_signal
+        if macd_golden_cross and explain:
             key_factors.append("MACD golden cross detected")
-            macd_golden_cross = True
-
-        # Check for MACD momentum (positive or increasing)
-        macd_positive = latest['macd'] > 0
-        macd_increasing = latest['macd'] > previous['macd']
-
-        # Determine action
-        if bullish_breakout and volume_spike and macd_golden_cross:
-            action = 'BUY'
-            confidence = 'HIGH'
-        elif bullish_breakout and volume_spike:
-            action = 'BUY'
-            confidence = 'MEDIUM'
-            key_factors.append("Bullish breakout with volume confirmation")
-        elif bullish_breakout and macd_positive:
-            action = 'BUY'
-            confidence = 'MEDIUM'
-            key_factors.append("Bullish breakout with MACD support")
-        elif latest['close'] < latest['ma_120'] and volume_spike:
-            action = 'SELL'
-            confidence = 'MEDIUM'
-            key_factors.append(f"Price below 120-day MA, bearish signal")
-        elif latest['close'] < latest['ma_120'] and latest['macd'] < 0:
-            action = 'SELL'
-            confidence = 'LOW'
-            key_factors.append("Bearish trend detected")
-        else:
-            action = 'HOLD'
-            confidence = 'LOW'
-            key_factors.append("No strong trend detected, holding position")
+
+        # Determine action: one lookup in the precomputed rule table
+        key = (
+            int(bullish_breakout) | int(volume_spike) << 1 | int(macd_golden_cross) << 2
+            | int(macd > 0) << 3 | int(price < ma) << 4 | int(macd < 0) << 5
+        )
+        action, confidence, reason = _RULE_TABLE[key]
+        if reason and explain:
+            key_factors.append(reason)
 
         return {
             'action': action,
             'confidence': confidence,
             'key_factors': key_factors,
-            'latest_price': latest['close'],
-            'atr': latest['atr']
+            'latest_price': price,
+            'atr': atr
         }
 
+    def detect_signals_vectorized(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Apply the Livermore rules and risk sizing to every bar at once.
+
+        Whole-series backtests get the signal of each bar from one pass over
+        the indicator columns instead of an analyze_data() call per bar
+        (which recomputes the indicators each time). Same rules as
+        detect_signal(); bar i sees bar i-1 as its previous bar (the first
+        bar is its own previous).
+
+        Args:
+            df: DataFrame with calculated indicators (calculate_indicators())
+
+        Returns:
+            DataFrame indexed like df with action / confidence (categoricals
+            over ACTION_LABELS / LEVEL_LABELS) and stop_loss / take_profit /
+            position_size_pct as calculate_risk_metrics() (unrounded) with
+            the default capital
+        """
+        values = df[self.SIGNAL_COLUMNS].to_numpy(dtype=np.float64)
+        price, ma, volume_ratio, macd, macd_signal, atr = values.T
+
+        previous_cross_ok = np.empty(len(values), dtype=bool)
+        previous_cross_ok[1:] = macd[:-1] <= macd_signal[:-1]
+        previous_cross_ok[:1] = macd[:1] <= macd_signal[:1]
+
+        # Same fact bitmask as _signal_from_values(), one table lookup per bar
+        key = (
+            (price > ma).astype(np.uint8)
+            | (volume_ratio > 1.3) << 1
+            | ((macd > macd_signal) & previous_cross_ok) << 2
+            | (macd > 0) << 3
+            | (price < ma) << 4
+            | (macd < 0) << 5
+        )
+        action = _ACTION_CODES[key]
+        confidence = _LEVEL_CODES[key]
+
+        # Risk sizing (calculate_risk_metrics() per bar); HOLD keeps no stop
+        side = np.select([action == 1, action == 2], [1.0, -1.0], 0.0)
+        stop_distance = np.where(side != 0.0, self.stop_loss_atr_multiple * atr, 0.0)
+        stop_loss = price - side * stop_distance
+        take_profit = price + side * self.risk_reward_ratio * stop_distance
+        with np.errstate(divide='ignore', invalid='ignore'):
+            position_size = np.where(
+                stop_distance > 0,
+                np.minimum(self.risk_pct * price / stop_distance, 20.0),
+                0.0
+            )
+
+        return pd.DataFrame({
+            'action': pd.Categorical.from_codes(action, categories=ACTION_LABELS),
+            'confidence': pd.Categorical.from_codes(confidence, categories=LEVEL_LABELS),
+            'stop_loss': stop_loss,
+            'take_profit': take_profit,
+            'position_size_pct': position_size
+        }, index=df.index)
+
     def calculate_risk_metrics(
         self,
         signal_data: Dict[str, Any],
@@ -242,7 +602,96 @@ class LivermoreStrategy:
                 'data_freshness': 'unknown'
             }
 
-        # Validate input data
+        self._validate_market_data(market_data, symbol)
+        return self._analyze_validated(market_data, symbol, capital, metadata)
+
+    def analyze_batch(
+        self,
+        market_data: Dict[str, pd.DataFrame],
+        capital: float = 100000.0,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Analyze pre-fetched data for many symbols at once (portfolio scans).
+
+        Histories are left-padded with NaN into (n_symbols, n_bars) matrices
+        and the indicators are computed by one numba kernel running symbols
+        in parallel; the rules are then applied to each symbol's last two
+        bars. Without numba this falls back to analyze_data() per symbol.
+
+        Args:
+            market_data: Mapping of symbol -> DataFrame with OHLCV data
+            capital: Total capital available (default: 100000)
+            metadata: Optional metadata dict applied to every symbol
+
+        Returns:
+            Mapping of symbol -> complete signal dictionary (as analyze_data())
+
+        Raises:
+            ValueError: If any symbol has insufficient data or missing columns
+        """
+        if not NUMBA_AVAILABLE:
+            return {
+                symbol: self.analyze_data(data, symbol, capital, metadata)
+                for symbol, data in market_data.items()
+            }
+
+        if metadata is None:
+            metadata = {
+                'api_source': 'Direct Data',
+                'retrieval_timestamp': datetime.now(),
+                'data_freshness': 'unknown'
+            }
+
+        symbols = list(market_data)
+        for symbol in symbols:
+            self._validate_market_data(market_data[symbol], symbol)
+
+        n_bars = max(len(data) for data in market_data.values())
+        ohlcv = np.full((4, len(symbols), n_bars), np.nan, dtype=self.INDICATOR_DTYPE)
+        for row, symbol in enumerate(symbols):
+            data = market_data[symbol]
+            start = n_bars - len(data)
+            for field, col in enumerate(('high', 'low', 'close', 'volume')):
+                ohlcv[field, row, start:] = data[col].to_numpy()
+
+        # Only the last two bars feed the rules; read them back as float64
+        ma, _, volume_ratio, macd, macd_signal, _, atr = livermore_indicators_batch(
+            ohlcv[0], ohlcv[1], ohlcv[2], ohlcv[3],
+            self.ma_period, self.volume_period, *self._macd_alphas, self.atr_period,
+            self.atr_method == 'wilder'
+        )[:, :, -2:].astype(np.float64)
+        close = ohlcv[2, :, -1].astype(np.float64)
+
+        results = {}
+        for row, symbol in enumerate(symbols):
+            signal_data = self._signal_from_values(
+                price=close[row],
+                ma=ma[row, -1],
+                volume_ratio=volume_ratio[row, -1],
+                macd=macd[row, -1],
+                macd_signal=macd_signal[row, -1],
+                atr=atr[row, -1],
+                previous_macd=macd[row, -2],
+                previous_macd_signal=macd_signal[row, -2]
+            )
+            results[symbol] = self._complete_signal(
+                symbol, signal_data, capital, metadata, len(market_data[symbol])
+            )
+        return results
+
+    def _validate_market_data(
+        self,
+        market_data: pd.DataFrame,
+        symbol: str,
+        hint: str = ''
+    ) -> None:
+        """Check required columns and minimum history (shared by analyze paths).
+
+        Args:
+            market_data: DataFrame with OHLCV data
+            symbol: Stock symbol (for the error message)
+            hint: Optional suffix for the insufficient-data message
+        """
         required_columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
         for col in required_columns:
             if col not in market_data.columns:
@@ -252,15 +701,46 @@ class LivermoreStrategy:
         if len(market_data) < self.ma_period:
             raise ValueError(
                 f"Insufficient data for {symbol}: need at least {self.ma_period} days, "
-                f"got {len(market_data)} days."
+                f"got {len(market_data)} days.{hint}"
             )
 
-        # Calculate indicators
-        df = self.calculate_indicators(market_data)
-
-        # Detect signal
-        signal_data = self.detect_signal(df)
+    def _analyze_validated(
+        self,
+        market_data: pd.DataFrame,
+        symbol: str,
+        capital: float,
+        metadata: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Indicators -> signal -> risk metrics for validated data.
 
+        Shared by analyze_data() and analyze().
+        """
+        # Calculate indicators (arrays only; no indicator frame is built)
+        bars = _prepare_bars(market_data)
+        ma, _, volume_ratio, macd, macd_signal, _, atr = self._indicator_arrays(
+            market_data, bars
+        )
+        close = bars.close
+
+        # Detect signal from the latest (and previous) bar
+        prev = -2 if len(close) > 1 else -1
+        signal_data = self._signal_from_values(
+            close[-1], ma[-1], volume_ratio[-1], macd[-1], macd_signal[-1], atr[-1],
+            previous_macd=macd[prev],
+            previous_macd_signal=macd_signal[prev]
+        )
+
+        return self._complete_signal(symbol, signal_data, capital, metadata, len(market_data))
+
+    def _complete_signal(
+        self,
+        symbol: str,
+        signal_data: Dict[str, Any],
+        capital: float,
+        metadata: Dict[str, Any],
+        data_points: int
+    ) -> Dict[str, Any]:
+        """Combine a detected signal with risk metrics and data metadata."""
         # Calculate risk metrics
         risk_metrics = self.calculate_risk_metrics(signal_data, capital)
 
@@ -275,7 +755,7 @@ class LivermoreStrategy:
             'data_source': metadata.get('api_source', 'Unknown'),
             'data_timestamp': metadata['retrieval_timestamp'].isoformat() if isinstance(metadata.get('retrieval_timestamp'), datetime) else str(metadata.get('retrieval_timestamp', 'Unknown')),
             'data_freshness': metadata.get('data_freshness', 'unknown'),
-            'data_points': len(market_data),
+            'data_points': data_points,
             'analysis_timestamp': datetime.now().isoformat()
         }
 
@@ -317,19 +797,7 @@ class LivermoreStrategy:
             start_date = (datetime.now() - timedelta(days=days_needed)).strftime('%Y-%m-%d')
 
         # Fetch real data using MarketDataFetcher
-        from investlib_data.cache_manager import CacheManager
-        from investlib_data.database import SessionLocal
-
-        cache_manager = None
-        session = None
-        if use_cache:
-            try:
-                session = SessionLocal()
-                cache_manager = CacheManager(session=session)
-            except Exception as e:
-                self.logger.warning(f"Cache not available: {e}")
-
-        fetcher = MarketDataFetcher(cache_manager=cache_manager)
+        fetcher, session = self._open_fetcher(use_cache)
 
         self.logger.info(f"[LivermoreStrategy] Fetching data for {symbol} from {start_date} to {end_date}")
 
@@ -349,46 +817,11 @@ class LivermoreStrategy:
                 f"retrieved at {metadata['retrieval_timestamp']}, freshness={metadata['data_freshness']}"
             )
 
-            # Validate input data
-            required_columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
-            for col in required_columns:
-                if col not in market_data.columns:
-                    raise ValueError(f"Missing required column: {col}")
-
-            # Require minimum data points for indicators
-            if len(market_data) < self.ma_period:
-                raise ValueError(
-                    f"Insufficient data for {symbol}: need at least {self.ma_period} days, "
-                    f"got {len(market_data)} days. Try extending date range."
-                )
-
-            # Calculate indicators
-            df = self.calculate_indicators(market_data)
-
-            # Detect signal
-            signal_data = self.detect_signal(df)
-
-            # Calculate risk metrics
-            risk_metrics = self.calculate_risk_metrics(signal_data, capital)
-
-            # Combine into complete signal with data metadata (US5 - T013)
-            complete_signal = {
-                'symbol': symbol,
-                'action': signal_data['action'],
-                'confidence': signal_data['confidence'],
-                'key_factors': signal_data['key_factors'],
-                **risk_metrics,
-                # Data metadata (NEW in V0.2)
-                'data_source': metadata['api_source'],
-                'data_timestamp': metadata['retrieval_timestamp'].isoformat() if isinstance(metadata['retrieval_timestamp'], datetime) else str(metadata['retrieval_timestamp']),
-                'data_freshness': metadata['data_freshness'],
-                'data_points': len(market_data),
-                'analysis_timestamp': datetime.now().isoformat()
-            }
-
-            return complete_signal
+            self._validate_market_data(market_data, symbol, hint=" Try extending date range.")
+            return self._analyze_validated(market_data, symbol, capital, metadata)
         finally:
             # CRITICAL: Close database session to prevent connection leaks
+            # (a session shared inside a `with` block is closed by close())
             if session:
                 session.close()
                 self.logger.debug("[LivermoreStrategy] Database session closed")
@@ -6,7 +6,7 @@ Implements risk calculation formulas for:
 - Position limit validation (single position ≤20%, total ≤100%)
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 
 class RiskCalculator:
@@ -31,7 +31,8 @@ class RiskCalculator:
         capital: float,
         risk_pct: float,
         entry_price: float,
-        stop_loss: float
+        stop_loss: float,
+        round_output: bool = True
     ) -> float:
         """Calculate position size based on risk parameters.
 
@@ -42,6 +43,8 @@ class RiskCalculator:
             risk_pct: Risk percentage per trade (e.g., 2.0 for 2%)
             entry_price: Entry price per share/contract
             stop_loss: Stop-loss price
+            round_output: Round to 2 decimals (default: True); backtests
+                evaluating many trades pass False and round only for display
 
         Returns:
             Position size as percentage of capital (0-100)
@@ -72,14 +75,15 @@ class RiskCalculator:
         # Cap at maximum single position limit
         position_size_pct = min(position_size_pct, self.max_single_position_pct)
 
-        return round(position_size_pct, 2)
+        return round(position_size_pct, 2) if round_output else position_size_pct
 
     def calculate_max_loss(
         self,
         capital: float,
         position_size_pct: float,
         entry_price: float,
-        stop_loss: float
+        stop_loss: float,
+        round_output: bool = True
     ) -> float:
         """Calculate maximum loss amount for a position.
 
@@ -90,6 +94,7 @@ class RiskCalculator:
             position_size_pct: Position size as percentage of capital
             entry_price: Entry price per share/contract
             stop_loss: Stop-loss price
+            round_output: Round to 2 decimals (default: True)
 
         Returns:
             Maximum loss amount in base currency
@@ -114,7 +119,7 @@ class RiskCalculator:
         price_risk_pct = abs(entry_price - stop_loss) / entry_price
         max_loss = position_value * price_risk_pct
 
-        return round(max_loss, 2)
+        return round(max_loss, 2) if round_output else max_loss
 
     def validate_position_limits(
         self,
@@ -142,29 +147,26 @@ class RiskCalculator:
         """
         errors = []
         warnings = []
-        valid = True
+        over_single, over_total, max_allowed = self._check_limits(
+            position_size_pct, current_allocation_pct
+        )
+        valid = not (over_single or over_total)
 
         # Check single position limit
-        if position_size_pct > self.max_single_position_pct:
+        if over_single:
             errors.append(
                 f"Position size {position_size_pct:.1f}% exceeds single position limit "
                 f"{self.max_single_position_pct:.1f}%"
             )
-            valid = False
 
         # Check total allocation limit
-        total_allocation = current_allocation_pct + position_size_pct
-        if total_allocation > self.max_total_allocation_pct:
+        if over_total:
+            total_allocation = current_allocation_pct + position_size_pct
             errors.append(
                 f"Total allocation {total_allocation:.1f}% would exceed limit "
                 f"{self.max_total_allocation_pct:.1f}% (current: {current_allocation_pct:.1f}%, "
                 f"new: {position_size_pct:.1f}%)"
             )
-            valid = False
-
-        # Calculate max allowed position given current allocation
-        max_allowed = self.max_total_allocation_pct - current_allocation_pct
-        max_allowed = min(max_allowed, self.max_single_position_pct)
 
         # Warning for high allocation
         if position_size_pct > 15.0 and valid:
@@ -179,6 +181,38 @@ class RiskCalculator:
             "max_allowed_position": round(max_allowed, 2)
         }
 
+    def within_limits(
+        self,
+        position_size_pct: float,
+        current_allocation_pct: float = 0.0
+    ) -> bool:
+        """validate_position_limits()['valid'] without building messages.
+
+        For backtests that check many candidate positions and only need the
+        verdict.
+        """
+        over_single, over_total, _ = self._check_limits(
+            position_size_pct, current_allocation_pct
+        )
+        return not (over_single or over_total)
+
+    def _check_limits(
+        self,
+        position_size_pct: float,
+        current_allocation_pct: float
+    ) -> Tuple[bool, bool, float]:
+        """(over single limit, over total limit, max allowed position %)."""
+        over_single = position_size_pct > self.max_single_position_pct
+        over_total = (
+            current_allocation_pct + position_size_pct > self.max_total_allocation_pct
+        )
+        # Max allowed position given current allocation
+        max_allowed = min(
+            self.max_total_allocation_pct - current_allocation_pct,
+            self.max_single_position_pct
+        )
+        return over_single, over_total, max_allowed
+
     def calculate_risk_metrics(
         self,
         capital: float,
@@ -187,7 +221,8 @@ class RiskCalculator:
         take_profit: float,
         position_size_pct: Optional[float] = None,
         risk_pct: float = 2.0,
-        current_allocation_pct: float = 0.0
+        current_allocation_pct: float = 0.0,
+        round_output: bool = True
     ) -> Dict[str, Any]:
         """Calculate comprehensive risk metrics for a trade.
 
@@ -199,6 +234,8 @@ class RiskCalculator:
             position_size_pct: Position size (if None, calculate from risk_pct)
             risk_pct: Risk percentage per trade (default 2%)
             current_allocation_pct: Current total allocation
+            round_output: Round amounts and ratios to 2 decimals (default:
+                True); False keeps raw floats throughout
 
         Returns:
             Complete risk metrics dictionary
@@ -206,12 +243,12 @@ class RiskCalculator:
         # Calculate position size if not provided
         if position_size_pct is None:
             position_size_pct = self.calculate_position_size(
-                capital, risk_pct, entry_price, stop_loss
+                capital, risk_pct, entry_price, stop_loss, round_output
             )
 
         # Calculate max loss
         max_loss = self.calculate_max_loss(
-            capital, position_size_pct, entry_price, stop_loss
+            capital, position_size_pct, entry_price, stop_loss, round_output
         )
 
         # Calculate max gain (if take-profit reached)
@@ -229,11 +266,14 @@ class RiskCalculator:
             position_size_pct, current_allocation_pct
         )
 
-        return {
-            "position_size_pct": round(position_size_pct, 2),
-            "position_value": round(position_value, 2),
-            "max_loss": round(max_loss, 2),
-            "max_gain": round(max_gain, 2),
-            "risk_reward_ratio": round(risk_reward_ratio, 2),
-            "validation": validation
+        metrics = {
+            "position_size_pct": position_size_pct,
+            "position_value": position_value,
+            "max_loss": max_loss,
+            "max_gain": max_gain,
+            "risk_reward_ratio": risk_reward_ratio
         }
+        if round_output:
+            metrics = {field: round(value, 2) for field, value in metrics.items()}
+        metrics["validation"] = validation
+        return metrics
@@ -6,14 +6,81 @@ Combines:
 - Validates all signals include mandatory safety fields
 """
 
+import os
 import pandas as pd
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 from investlib_quant.livermore_strategy import LivermoreStrategy
 from investlib_quant.risk_calculator import RiskCalculator
 
 
+# Strategy signal fields _validate_strategy_signal() requires, in report order
+_REQUIRED_FIELDS = (
+    'action', 'entry_price', 'stop_loss', 'take_profit',
+    'position_size_pct', 'confidence', 'key_factors'
+)
+_REQUIRED_FIELD_SET = frozenset(_REQUIRED_FIELDS)
+
+
+@dataclass(frozen=True, slots=True)
+class _TradingSignal:
+    """Complete trading signal; the public methods return it as a dict."""
+
+    symbol: str
+    action: str
+    confidence: str
+    entry_price: float
+    stop_loss: float
+    take_profit: float
+    position_size_pct: float
+    position_value: float
+    max_loss: float
+    max_gain: float
+    risk_reward_ratio: float
+    validation: Dict[str, Any]
+    key_factors: List[str]
+    generated_at: str
+    market_data_points: int
+    atr: float
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            # Core signal fields
+            "symbol": self.symbol,
+            "action": self.action,
+            "confidence": self.confidence,
+
+            # Price levels
+            "entry_price": self.entry_price,
+            "stop_loss": self.stop_loss,
+            "take_profit": self.take_profit,
+
+            # Position sizing
+            "position_size_pct": self.position_size_pct,
+            "position_value": self.position_value,
+
+            # Risk metrics
+            "max_loss": self.max_loss,
+            "max_gain": self.max_gain,
+            "risk_reward_ratio": self.risk_reward_ratio,
+
+            # Validation
+            "validation": self.validation,
+
+            # Explainability
+            "key_factors": self.key_factors,
+            "strategy_name": "Livermore Trend Following",
+
+            # Metadata
+            "generated_at": self.generated_at,
+            "market_data_points": self.market_data_points,
+            "atr": self.atr
+        }
+
+
 class SignalGenerator:
     """Generate trading signals with complete risk management."""
 
@@ -36,7 +103,8 @@ class SignalGenerator:
         symbol: str,
         market_data: pd.DataFrame,
         capital: float = 100000.0,
-        current_allocation_pct: float = 0.0
+        current_allocation_pct: float = 0.0,
+        now_iso: Optional[str] = None
     ) -> Dict[str, Any]:
         """Generate complete trading signal with risk management.
 
@@ -52,6 +120,8 @@ class SignalGenerator:
             market_data: DataFrame with OHLCV data
             capital: Total available capital
             current_allocation_pct: Current portfolio allocation %
+            now_iso: generated_at timestamp (UTC ISO format); batch callers
+                pass one shared value instead of formatting it per signal
 
         Returns:
             Complete trading signal dictionary
@@ -60,57 +130,61 @@ class SignalGenerator:
             ValueError: If signal validation fails (e.g., missing stop-loss)
         """
         # 1. Analyze market data with strategy
-        strategy_signal = self.strategy.analyze(market_data, capital)
+        strategy_signal = self.strategy.analyze_data(market_data, symbol, capital)
 
+        return self._build_signal(
+            symbol, strategy_signal, len(market_data), capital, current_allocation_pct, now_iso
+        ).as_dict()
+
+    def _build_signal(
+        self,
+        symbol: str,
+        strategy_signal: Dict[str, Any],
+        market_data_points: int,
+        capital: float,
+        current_allocation_pct: float,
+        now_iso: Optional[str] = None
+    ) -> '_TradingSignal':
+        """Steps 2-5 of generate_trading_signal() on a strategy signal."""
         # 2. Validate strategy signal has mandatory fields
         self._validate_strategy_signal(strategy_signal)
 
+        entry_price = strategy_signal['entry_price']
+        stop_loss = strategy_signal['stop_loss']
+        take_profit = strategy_signal['take_profit']
+
         # 3. Calculate comprehensive risk metrics
         risk_metrics = self.risk_calculator.calculate_risk_metrics(
             capital=capital,
-            entry_price=strategy_signal['entry_price'],
-            stop_loss=strategy_signal['stop_loss'],
-            take_profit=strategy_signal['take_profit'],
+            entry_price=entry_price,
+            stop_loss=stop_loss,
+            take_profit=take_profit,
             position_size_pct=strategy_signal['position_size_pct'],
             current_allocation_pct=current_allocation_pct
         )
 
-        # 4. Build complete signal
-        complete_signal = {
-            # Core signal fields
-            "symbol": symbol,
-            "action": strategy_signal['action'],
-            "confidence": strategy_signal['confidence'],
-
-            # Price levels
-            "entry_price": strategy_signal['entry_price'],
-            "stop_loss": strategy_signal['stop_loss'],
-            "take_profit": strategy_signal['take_profit'],
-
-            # Position sizing
-            "position_size_pct": risk_metrics['position_size_pct'],
-            "position_value": risk_metrics['position_value'],
-
-            # Risk metrics
-            "max_loss": risk_metrics['max_loss'],
-            "max_gain": risk_metrics['max_gain'],
-            "risk_reward_ratio": risk_metrics['risk_reward_ratio'],
-
-            # Validation
-            "validation": risk_metrics['validation'],
-
-            # Explainability
-            "key_factors": strategy_signal['key_factors'],
-            "strategy_name": "Livermore Trend Following",
-
-            # Metadata
-            "generated_at": datetime.utcnow().isoformat(),
-            "market_data_points": len(market_data),
-            "atr": strategy_signal.get('atr', 0)
-        }
+        # 4. Build complete signal (positional, in _TradingSignal field order)
+        complete_signal = _TradingSignal(
+            symbol,
+            strategy_signal['action'],
+            strategy_signal['confidence'],
+            entry_price,
+            stop_loss,
+            take_profit,
+            risk_metrics['position_size_pct'],
+            risk_metrics['position_value'],
+            risk_metrics['max_loss'],
+            risk_metrics['max_gain'],
+            risk_metrics['risk_reward_ratio'],
+            risk_metrics['validation'],
+            strategy_signal['key_factors'],
+            now_iso or datetime.utcnow().isoformat(),
+            market_data_points,
+            strategy_signal.get('atr', 0)
+        )
 
         # 5. Final validation
-        if not complete_signal['validation']['valid']:
+        if not complete_signal.validation['valid']:
             # Signal is technically valid but position limits exceeded
             # Return signal with validation errors for user decision
             pass
@@ -130,17 +204,17 @@ class SignalGenerator:
         Raises:
             ValueError: If any mandatory field is missing or invalid
         """
-        # Check mandatory fields
-        required_fields = [
-            'action', 'entry_price', 'stop_loss', 'take_profit',
-            'position_size_pct', 'confidence', 'key_factors'
-        ]
-
-        for field in required_fields:
-            if field not in signal:
-                raise ValueError(f"Strategy signal missing mandatory field: {field}")
-            if signal[field] is None:
-                raise ValueError(f"Strategy signal field '{field}' cannot be None")
+        # Check mandatory fields: one set comparison on the common, complete
+        # path; the ordered loop only runs to report the first bad field
+        if (
+            not _REQUIRED_FIELD_SET <= signal.keys()
+            or any(signal[field] is None for field in _REQUIRED_FIELDS)
+        ):
+            for field in _REQUIRED_FIELDS:
+                if field not in signal:
+                    raise ValueError(f"Strategy signal missing mandatory field: {field}")
+                if signal[field] is None:
+                    raise ValueError(f"Strategy signal field '{field}' cannot be None")
 
         # Special validation: stop-loss must be present (Constitution requirement)
         if signal['stop_loss'] <= 0:
@@ -181,24 +255,36 @@ class SignalGenerator:
 
         Returns:
             Dictionary mapping symbol to signal (or error message)
+
+        The strategy analyzes all symbols with data in one
+        LivermoreStrategy.analyze_batch() call (one parallel indicator pass);
+        only the per-symbol risk metrics and validation run in this loop.
         """
+        market_data = {
+            symbol: market_data_dict[symbol]
+            for symbol in symbols if symbol in market_data_dict
+        }
+        strategy_signals = self._analyze_batch(market_data, capital)
+        now_iso = datetime.utcnow().isoformat()
+
         signals = {}
 
         for symbol in symbols:
             try:
-                if symbol not in market_data_dict:
+                if symbol not in market_data:
                     signals[symbol] = {
                         "error": f"No market data available for {symbol}"
                     }
                     continue
 
-                signal = self.generate_trading_signal(
-                    symbol=symbol,
-                    market_data=market_data_dict[symbol],
-                    capital=capital,
-                    current_allocation_pct=current_allocation_pct
-                )
-                signals[symbol] = signal
+                strategy_signal = strategy_signals[symbol]
+                if isinstance(strategy_signal, Exception):
+                    raise strategy_signal
+
+                signals[symbol] = self._build_signal(
+                    symbol, strategy_signal, len(market_data[symbol]),
+                    capital, current_allocation_pct, now_iso
+                ).as_dict()
 
             except Exception as e:
                 signals[symbol] = {
@@ -207,3 +293,26 @@ class SignalGenerator:
                 }
 
         return signals
+
+    def _analyze_batch(
+        self,
+        market_data: Dict[str, pd.DataFrame],
+        capital: float
+    ) -> Dict[str, Any]:
+        """Strategy signals for every symbol, or the exception its analysis raised.
+
+        A symbol with invalid data fails the whole analyze_batch() call, so
+        that case is retried symbol by symbol to keep the errors per symbol,
+        on a thread pool (the indicator kernels release the GIL).
+        """
+        try:
+            return self.strategy.analyze_batch(market_data, capital)
+        except Exception:
+            def analyze(symbol):
+                try:
+                    return self.strategy.analyze_data(market_data[symbol], symbol, capital)
+                except Exception as e:
+                    return e
+
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+                return dict(zip(market_data, pool.map(analyze, market_data)))
@@ -0,0 +1,9 @@
+"""Label sets of the categorical signal fields shared by the strategy analyzers.
+
+Labels are listed in category-code order: signal dicts keep the string
+labels, while vectorized and tabular outputs store int8 codes into these
+tuples (pd.Categorical.from_codes).
+"""
+
+ACTION_LABELS = ('HOLD', 'BUY', 'SELL')
+LEVEL_LABELS = ('LOW', 'MEDIUM', 'HIGH')
@@ -26,13 +26,8 @@ from .options_strategy import OptionsStrategy, SimpleVolatilityOptionsStrategy
 from .multi_timeframe import MultiTimeframeStrategy
 from .multi_indicator import MultiIndicatorStrategy
 
-# 尝试导入Kroll策略（在旧位置）
+# Kroll策略依赖 investlib_data，缺失时置为 None
 try:
-    import sys
-    import os
-    parent_dir = os.path.dirname(os.path.dirname(__file__))
-    if parent_dir not in sys.path:
-        sys.path.insert(0, parent_dir)
     from investlib_quant.kroll_strategy import KrollStrategy, register_strategy as register_kroll
     register_kroll()  # 手动触发注册
 except ImportError:
@@ -7,14 +7,53 @@ Extends BaseStrategy with futures-specific features:
 - Contract rollover handling
 """
 
+import re
 from abc import abstractmethod
+from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Optional
+import numpy as np
 import pandas as pd
 import logging
 
+from investlib_quant.indicators._kernels import NUMBA_AVAILABLE, last_mean
 from investlib_quant.strategies.base import BaseStrategy
 
 
+# Contract code and YYMM expiry of a futures symbol (e.g., IF2506 -> IF, 2506)
+_EXPIRY_RE = re.compile(r'^([A-Z]+)(\d{4})')
+
+# Contract multipliers by symbol prefix; other contracts use the commodity default
+_INDEX_FUTURES_MULTIPLIERS = {'IF': 300, 'IC': 300, 'IH': 300}
+_DEFAULT_MULTIPLIER = 100
+
+
+@lru_cache(maxsize=256)
+def _third_friday(year: int, month: int) -> pd.Timestamp:
+    """Third Friday of the month (futures expiry), memoized per (year, month)."""
+    # Find first Friday
+    first_day = datetime(year, month, 1)
+    first_friday_offset = (4 - first_day.weekday()) % 7
+    first_friday = 1 + first_friday_offset
+
+    # Third Friday is 14 days later
+    third_friday = first_friday + 14
+
+    return pd.Timestamp(datetime(year, month, third_friday))
+
+
+@lru_cache(maxsize=1)
+def _margin_calculator():
+    """Shared stateless MarginCalculator, created on first use.
+
+    investlib_margin is a sibling package rather than a declared
+    dependency, so it is imported here instead of at module scope.
+    """
+    from investlib_margin.calculator import MarginCalculator
+
+    return MarginCalculator()
+
+
 class FuturesStrategy(BaseStrategy):
     """Futures strategy base class.
 
@@ -86,10 +125,7 @@ class FuturesStrategy(BaseStrategy):
         Returns:
             Margin required (CNY)
         """
-        from investlib_margin.calculator import MarginCalculator
-
-        calc = MarginCalculator()
-        return calc.calculate_margin(
+        return _margin_calculator().calculate_margin(
             contract_type='futures',
             quantity=contracts,
             price=price,
@@ -113,10 +149,7 @@ class FuturesStrategy(BaseStrategy):
         Returns:
             Liquidation price
         """
-        from investlib_margin.calculator import MarginCalculator
-
-        calc = MarginCalculator()
-        return calc.calculate_liquidation_price(
+        return _margin_calculator().calculate_liquidation_price(
             entry_price=entry_price,
             direction=direction,
             margin_rate=self.margin_rate,
@@ -173,19 +206,19 @@ class FuturesStrategy(BaseStrategy):
 
         for key in required_keys:
             if key not in signal:
-                self.logger.warning(f"Signal missing required key: {key}")
+                self.logger.warning("Signal missing required key: %s", key)
                 return False
 
         # Validate action
         if signal['action'] not in ['BUY', 'SELL', 'HOLD']:
-            self.logger.warning(f"Invalid action: {signal['action']}")
+            self.logger.warning("Invalid action: %s", signal['action'])
             return False
 
         # Validate leverage
         if 'leverage' in signal:
             if signal['leverage'] > self.max_leverage:
                 self.logger.warning(
-                    f"Leverage {signal['leverage']}x exceeds max {self.max_leverage}x"
+                    "Leverage %sx exceeds max %sx", signal['leverage'], self.max_leverage
                 )
                 signal['leverage'] = self.max_leverage
 
@@ -193,7 +226,7 @@ class FuturesStrategy(BaseStrategy):
         if 'contracts' in signal:
             if signal['contracts'] > self.max_positions:
                 self.logger.warning(
-                    f"Contracts {signal['contracts']} exceeds max {self.max_positions}"
+                    "Contracts %s exceeds max %s", signal['contracts'], self.max_positions
                 )
                 signal['contracts'] = self.max_positions
 
@@ -214,10 +247,7 @@ class FuturesStrategy(BaseStrategy):
             True if rollover needed (within 5 days of expiry)
         """
         # Parse expiry from symbol (e.g., IF2506 = 2025-06)
-        import re
-        from datetime import datetime
-
-        match = re.match(r'^([A-Z]+)(\d{4})', symbol.split('.')[0])
+        match = _EXPIRY_RE.match(symbol.split('.', 1)[0])
         if not match:
             return False
 
@@ -234,18 +264,7 @@ class FuturesStrategy(BaseStrategy):
 
     def _get_third_friday(self, year: int, month: int) -> pd.Timestamp:
         """Get third Friday of the month."""
-        import calendar
-        from datetime import datetime
-
-        # Find first Friday
-        first_day = datetime(year, month, 1)
-        first_friday_offset = (4 - first_day.weekday()) % 7
-        first_friday = 1 + first_friday_offset
-
-        # Third Friday is 14 days later
-        third_friday = first_friday + 14
-
-        return pd.Timestamp(datetime(year, month, third_friday))
+        return _third_friday(year, month)
 
     def analyze_data(
         self,
@@ -272,14 +291,14 @@ class FuturesStrategy(BaseStrategy):
         """
         # Validate data
         if not self.validate_data(market_data, required_rows=30):
-            self.logger.warning(f"Insufficient data for {symbol}")
+            self.logger.warning("Insufficient data for %s", symbol)
             return None
 
         # Check rollover
         current_date = pd.to_datetime(market_data['timestamp'].iloc[-1])
         if self.check_rollover_needed(symbol, current_date):
             self.logger.warning(
-                f"Contract {symbol} near expiry - consider rolling over"
+                "Contract %s near expiry - consider rolling over", symbol
             )
 
         # Generate signal
@@ -324,10 +343,8 @@ class FuturesStrategy(BaseStrategy):
 
     def _get_multiplier(self, symbol: str) -> int:
         """Get contract multiplier from symbol."""
-        if symbol.startswith('IF') or symbol.startswith('IC') or symbol.startswith('IH'):
-            return 300  # Stock index futures
-        else:
-            return 100  # Commodity futures (default)
+        # Stock index futures (IF/IC/IH) or commodity futures (default)
+        return _INDEX_FUTURES_MULTIPLIERS.get(symbol[:2], _DEFAULT_MULTIPLIER)
 
 
 class SimpleTrendFuturesStrategy(FuturesStrategy):
@@ -351,13 +368,16 @@ class SimpleTrendFuturesStrategy(FuturesStrategy):
         if len(market_data) < 60:
             return None
 
-        # Calculate moving averages
-        ma20 = market_data['close'].rolling(20).mean()
-        ma60 = market_data['close'].rolling(60).mean()
+        # Calculate moving averages (only their latest values are used)
+        close = market_data['close'].to_numpy(dtype=np.float64)
+        if NUMBA_AVAILABLE:
+            current_ma20 = last_mean(close, 20)
+            current_ma60 = last_mean(close, 60)
+        else:
+            current_ma20 = close[-20:].mean()
+            current_ma60 = close[-60:].mean()
 
         current_price = market_data['close'].iloc[-1]
-        current_ma20 = ma20.iloc[-1]
-        current_ma60 = ma60.iloc[-1]
 
         # Strong uptrend: price > MA20 > MA60
         if current_price > current_ma20 > current_ma60:
@@ -4,12 +4,26 @@
 策略名称来源于传奇交易员Jesse Livermore的交易哲学。
 """
 
-from typing import Dict, Optional
+import math
+from typing import Dict, List, Optional, Tuple
 import pandas as pd
 import numpy as np
 import logging
 from datetime import datetime, timedelta
 from .base import BaseStrategy
+from ..indicators._kernels import NUMBA_AVAILABLE, last_means
+
+
+class _MeanState:
+    """某标的最近一次 generate_signal() 的均线（用于逐日 O(1) 更新）。"""
+
+    __slots__ = ('bars', 'last_timestamp', 'ma', 'volume_ma')
+
+    def __init__(self, bars: int, last_timestamp, ma: float, volume_ma: float):
+        self.bars = bars
+        self.last_timestamp = last_timestamp
+        self.ma = ma
+        self.volume_ma = volume_ma
 
 
 class LivermoreStrategy(BaseStrategy):
@@ -60,11 +74,20 @@ class LivermoreStrategy(BaseStrategy):
         self.position_size_pct = position_size_pct
         self.logger = logging.getLogger(__name__)
 
-    def generate_signal(self, market_data: pd.DataFrame) -> Optional[Dict]:
+        # 按标的缓存的均线状态（generate_signal(..., symbol=...) 使用）
+        self._state: Dict[str, _MeanState] = {}
+
+    def generate_signal(
+        self,
+        market_data: pd.DataFrame,
+        symbol: Optional[str] = None
+    ) -> Optional[Dict]:
         """生成交易信号。
 
         Args:
             market_data: 市场数据（至少需要 120+ 天数据）
+            symbol: 标的代码（可选）。提供时按标的缓存均线，实盘中数据每次只
+                新增一根K线的调用以 O(1) 更新均线，而不是重新求和整个窗口
 
         Returns:
             信号字典或 None
@@ -73,31 +96,163 @@ class LivermoreStrategy(BaseStrategy):
         if not self.validate_data(market_data, required_rows=self.ma_period + 1):
             return None
 
-        # 确保数据按日期排序
-        df = market_data.copy().sort_values('timestamp').reset_index(drop=True)
+        close, volume, timestamps = self._sorted_arrays(market_data)
+        means = None
+        if symbol is not None:
+            means = self._incremental_means(symbol, close, volume, timestamps)
+        return self._signal_from_arrays(close, volume, len(close) - 1, means)
+
+    def backtest_range(
+        self,
+        market_data: pd.DataFrame,
+        start_idx: int = 0,
+        end_idx: Optional[int] = None
+    ) -> List[Optional[Dict]]:
+        """逐日回测 [start_idx, end_idx) 区间内每一日的信号。
+
+        结果与对截至该日的数据调用 generate_signal() 一致，但整段数据只排序、
+        转换为 NumPy 数组一次，不再每日切片复制 DataFrame。
 
-        # 计算技术指标
-        df['ma_120'] = df['close'].rolling(window=self.ma_period).mean()
-        df['volume_ma_20'] = df['volume'].rolling(window=20).mean()
+        Args:
+            market_data: 历史数据
+            start_idx: 起始行（按日期排序后的位置）
+            end_idx: 结束行（不含），默认到最后一行
+
+        Returns:
+            每一日的信号字典或 None（数据不足时）
+        """
+        if end_idx is None:
+            end_idx = len(market_data)
+        if not self.validate_data(market_data):
+            return [None] * len(range(start_idx, end_idx))
 
-        # 获取最新和前一日数据
-        latest = df.iloc[-1]
-        prev = df.iloc[-2]
+        close, volume, _ = self._sorted_arrays(market_data)
+        return [
+            self._signal_from_arrays(close, volume, idx) if idx >= self.ma_period else None
+            for idx in range(start_idx, end_idx)
+        ]
+
+    def scan_history(self, market_data: pd.DataFrame) -> List[Dict]:
+        """整段历史中的全部 BUY/SELL 信号（向量化扫描）。
+
+        均线与突破条件对所有日期一次性计算，只为触发信号的日期构建信号字典，
+        HOLD 日不做任何逐日工作。结果与 backtest_range() 中非 HOLD 的信号一致
+        （均线由 rolling().mean() 计算，仅有浮点舍入差异），并带有 timestamp 字段。
+
+        Args:
+            market_data: 历史数据
+
+        Returns:
+            按日期排序的信号字典列表
+        """
+        if not self.validate_data(market_data, required_rows=self.ma_period + 1):
+            return []
+
+        close, volume, timestamps = self._sorted_arrays(market_data)
+        ma = pd.Series(close).rolling(window=self.ma_period).mean().to_numpy()
+        volume_ma = pd.Series(volume).rolling(window=20).mean().to_numpy()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            volume_ratio = volume / volume_ma
+
+        # 第 i 日（i >= 1）与前一日的比较；均线未就绪（NaN）时比较结果为 False
+        prev_close, prev_ma = close[:-1], ma[:-1]
+        current, current_ma = close[1:], ma[1:]
+        ready = ~np.isnan(volume_ma[1:])
+        ma_breakdown = (prev_close > prev_ma) & (current < current_ma)
+        ma_breakout = (
+            (prev_close < prev_ma) & (current > current_ma)
+            & (volume_ratio[1:] > self.volume_threshold)
+        )
+
+        timestamps = pd.Index(timestamps)
+        return [
+            {
+                "timestamp": timestamps[idx],
+                **self._signal_from_arrays(
+                    close, volume, idx,
+                    (float(ma[idx]), float(ma[idx - 1]), float(volume_ma[idx]))
+                )
+            }
+            for idx in np.flatnonzero(ready & (ma_breakdown | ma_breakout)) + 1
+        ]
+
+    def _sorted_arrays(
+        self,
+        market_data: pd.DataFrame
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """按日期排序的 (close, volume, timestamp) 数组（上游数据通常已有序，此时不复制不排序）。"""
+        close = market_data['close'].to_numpy(dtype=np.float64)
+        volume = market_data['volume'].to_numpy(dtype=np.float64)
+        timestamps = market_data['timestamp']
+        in_order = timestamps.is_monotonic_increasing
+        timestamps = timestamps.to_numpy()
+        if not in_order:
+            order = np.argsort(timestamps, kind='stable')
+            close, volume, timestamps = close[order], volume[order], timestamps[order]
+        return close, volume, timestamps
+
+    def _incremental_means(
+        self,
+        symbol: str,
+        close: np.ndarray,
+        volume: np.ndarray,
+        timestamps: np.ndarray
+    ) -> Tuple[float, float, float]:
+        """(今日 MA, 前一日 MA, 今日 20 日量均线)，按标的缓存并逐日更新。
+
+        若上次调用的数据恰好少最新一根K线，则由进入和移出窗口的值 O(1) 更新；
+        否则（首次调用、跳过多日或窗口含 NaN）整窗重新计算。已缓存的历史K线
+        被修改时，请改用新的标的键或不传 symbol。
+        """
+        n = len(close)
+        p = self.ma_period
+        state = self._state.get(symbol)
+        if (
+            state is not None and state.bars == n - 1 and n > max(p, 20)
+            and state.last_timestamp == timestamps[-2]
+        ):
+            ma_prev = state.ma
+            ma = ma_prev + (close[-1] - close[-1 - p]) / p
+            volume_ma = state.volume_ma + (volume[-1] - volume[-21]) / 20
+            if not (math.isnan(ma) or math.isnan(volume_ma)):
+                state.bars, state.last_timestamp = n, timestamps[-1]
+                state.ma, state.volume_ma = float(ma), float(volume_ma)
+                return state.ma, ma_prev, state.volume_ma
+
+        ma, ma_prev, volume_ma = self._last_means(close, volume)
+        self._state[symbol] = _MeanState(n, timestamps[-1], ma, volume_ma)
+        return ma, ma_prev, volume_ma
+
+    def _signal_from_arrays(
+        self,
+        close: np.ndarray,
+        volume: np.ndarray,
+        idx: int,
+        means: Optional[Tuple[float, float, float]] = None
+    ) -> Dict:
+        """第 idx 日的信号（只使用 close[:idx + 1] / volume[:idx + 1]）。
+
+        means: 已知的 (今日 MA, 前一日 MA, 今日量均线)，省略时按窗口计算
+        """
+        # 计算技术指标（只计算规则用到的最后两日均线和最新量均线）
+        if means is None:
+            means = self._last_means(close[:idx + 1], volume[:idx + 1])
+        ma_120, prev_ma_120, volume_ma_20 = means
 
         # 检查是否有足够数据
-        if pd.isna(latest['ma_120']) or pd.isna(latest['volume_ma_20']):
+        if math.isnan(ma_120) or math.isnan(volume_ma_20):
             return {"action": "HOLD", "reason": "技术指标计算不足"}
 
-        current_price = float(latest['close'])
-        ma_120 = float(latest['ma_120'])
-        volume_ratio = float(latest['volume'] / latest['volume_ma_20'])
+        current_price = float(close[idx])
+        prev_close = close[idx - 1]
+        volume_ratio = float(volume[idx] / volume_ma_20)
 
         # 判断信号
         # 卖出条件：价格跌破 120 日均线（前一日高于，今日低于）
-        ma_breakdown = (prev['close'] > prev['ma_120']) and (current_price < ma_120)
+        ma_breakdown = (prev_close > prev_ma_120) and (current_price < ma_120)
 
         # 买入条件1：价格突破 120 日均线（前一日低于，今日高于）
-        ma_breakout = (prev['close'] < prev['ma_120']) and (current_price > ma_120)
+        ma_breakout = (prev_close < prev_ma_120) and (current_price > ma_120)
 
         # 买入条件2：成交量放大
         volume_surge = volume_ratio > self.volume_threshold
@@ -153,6 +308,18 @@ class LivermoreStrategy(BaseStrategy):
         # 无信号
         return {"action": "HOLD"}
 
+    def _last_means(self, close: np.ndarray, volume: np.ndarray):
+        """(今日 MA, 前一日 MA, 今日 20 日量均线)，与 rolling().mean() 的末尾取值一致。"""
+        if NUMBA_AVAILABLE:
+            return last_means(close, volume, self.ma_period, 20)
+
+        # 无 numba：直接对末尾窗口求均值（窗口不足或含 NaN 时为 NaN）
+        n = len(close)
+        ma_last = close[-self.ma_period:].mean() if n >= self.ma_period else np.nan
+        ma_prev = close[-self.ma_period - 1:-1].mean() if n > self.ma_period else np.nan
+        volume_ma = volume[-20:].mean() if n >= 20 else np.nan
+        return float(ma_last), float(ma_prev), float(volume_ma)
+
     def backtest_signal(self, market_data: pd.DataFrame, entry_date: str) -> Dict:
         """回测某个历史日期的信号（用于测试）。
 
@@ -164,7 +331,7 @@ class LivermoreStrategy(BaseStrategy):
             信号字典
         """
         # 截取到指定日期的数据
-        df = market_data[market_data['timestamp'] <= entry_date].copy()
+        df = market_data[market_data['timestamp'] <= entry_date]
         return self.generate_signal(df)
 
     def analyze(
@@ -10,6 +10,7 @@
 """
 
 from typing import Dict, Optional, List
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from .base import BaseStrategy
@@ -117,8 +118,10 @@ class MarketRotationStrategy(BaseStrategy):
                 "reason": "指数数据不足"
             }
 
-        # 确保数据按日期排序
-        idx_data = index_data.copy().sort_values('timestamp').reset_index(drop=True)
+        # 确保数据按日期排序（上游数据通常已有序，此时不复制不排序）
+        idx_data = index_data
+        if not idx_data['timestamp'].is_monotonic_increasing:
+            idx_data = idx_data.sort_values('timestamp')
 
         # 检查当前持仓状态
         current_holding = current_position or self.bond_symbol
@@ -132,9 +135,9 @@ class MarketRotationStrategy(BaseStrategy):
             # 找到入场日期在数据中的位置，计算已经过了多少个交易日
             # 确保timestamp列是datetime类型
             timestamps = pd.to_datetime(idx_data['timestamp'])
-            entry_idx_list = timestamps[timestamps >= entry_date].index
-            if len(entry_idx_list) > 0:
-                entry_idx = entry_idx_list[0]
+            # 数据已按日期排序：二分查找第一个 >= 入场日期的位置（按位置，不依赖行索引）
+            entry_idx = int(timestamps.searchsorted(entry_date, side='left'))
+            if entry_idx < len(timestamps):
                 current_idx = len(idx_data) - 1
                 holding_period = current_idx - entry_idx  # 交易日数量
             else:
@@ -183,21 +186,17 @@ class MarketRotationStrategy(BaseStrategy):
         if len(idx_data) < required_days:
             return {"action": "HOLD", "reason": "数据不足以判断连续跌幅"}
 
-        recent_days = idx_data.tail(required_days).copy()
-
-        # 计算每日涨跌幅
-        recent_days['pct_change'] = recent_days['close'].pct_change() * 100
-
-        # 获取最后N天的涨跌幅（排除第一天，因为它的pct_change是NaN）
-        last_n_changes = recent_days['pct_change'].iloc[-self.consecutive_days:]
+        # 计算最后N天的每日涨跌幅（只取最后N+1个收盘价）
+        closes = idx_data['close'].iloc[-required_days:].to_numpy(dtype=np.float64)
+        last_n_changes = (closes[1:] / closes[:-1] - 1.0) * 100
 
         # 检查最近N天是否都满足跌幅阈值
-        all_decline = all(last_n_changes <= self.decline_threshold)
+        all_decline = bool(np.all(last_n_changes <= self.decline_threshold))
 
         if all_decline:
             # 触发买入信号
             latest_data = idx_data.iloc[-1]
-            avg_decline = last_n_changes.mean()
+            avg_decline = float(last_n_changes.mean())
 
             return {
                 "action": "SWITCH",
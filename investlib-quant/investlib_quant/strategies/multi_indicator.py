@@ -4,9 +4,11 @@ Multi-Indicator Combination Strategy (T065)
 Combine MACD, KDJ, Bollinger Bands, and Volume for robust signals.
 """
 
+import numpy as np
 import pandas as pd
 from typing import Optional, Dict
 from .stock_strategy import StockStrategy
+from ..indicators._kernels import NUMBA_AVAILABLE, multi_indicator_last
 from ..indicators.macd import calculate_macd, detect_macd_crossover
 from ..indicators.kdj import calculate_kdj, detect_kdj_signal
 from ..indicators.bollinger import calculate_bollinger_bands, detect_bollinger_signal
@@ -16,6 +18,17 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Detector result -> vote (+1 buy, -1 sell, 0 neutral)
+_MACD_VOTES = {'bullish': 1, 'bearish': -1}
+_KDJ_VOTES = {'buy': 1, 'sell': -1}
+_BB_VOTES = {'oversold': 1, 'overbought': -1}
+
+# Reasoning labels, indexed by vote + 1
+_MACD_LABELS = ('卖出 (死叉)', '中性', '买入 (金叉)')
+_KDJ_LABELS = ('卖出 (超买回落)', '中性', '买入 (超卖反弹)')
+_BB_LABELS = ('卖出 (触及上轨)', '中性', '买入 (触及下轨)')
+_VOLUME_LABELS = ('放量确认 (卖出)', '放量', '放量确认 (买入)')
+
 
 class MultiIndicatorStrategy(StockStrategy):
     """多指标组合策略.
@@ -39,6 +52,8 @@ class MultiIndicatorStrategy(StockStrategy):
         macd_slow: int = 26,
         macd_signal: int = 9,
         kdj_period: int = 9,
+        kdj_k_smooth: int = 3,
+        kdj_d_smooth: int = 3,
         bb_period: int = 20,
         bb_std: float = 2.0,
         volume_period: int = 20,
@@ -49,6 +64,8 @@ class MultiIndicatorStrategy(StockStrategy):
         self.macd_slow = macd_slow
         self.macd_signal = macd_signal
         self.kdj_period = kdj_period
+        self.kdj_k_smooth = kdj_k_smooth
+        self.kdj_d_smooth = kdj_d_smooth
         self.bb_period = bb_period
         self.bb_std = bb_std
         self.volume_period = volume_period
@@ -58,72 +75,25 @@ class MultiIndicatorStrategy(StockStrategy):
         if not self.validate_data(market_data, required_rows=30):
             return None
 
-        df = market_data.copy()
-
-        # Calculate indicators
-        macd, macd_sig, _ = calculate_macd(df, self.macd_fast, self.macd_slow, self.macd_signal)
-        k, d, j = calculate_kdj(df, period=self.kdj_period)
-        upper, middle, lower = calculate_bollinger_bands(df, self.bb_period, self.bb_std)
-        vol_ma = calculate_volume_ma(df, self.volume_period)
-
-        # Detect signals
-        macd_signal = detect_macd_crossover(macd, macd_sig)
-        kdj_signal = detect_kdj_signal(k, d, j)
-        bb_signal = detect_bollinger_signal(
-            df['close'].iloc[-1],
-            upper.iloc[-1],
-            lower.iloc[-1],
-            middle.iloc[-1]
-        )
-        vol_spike = detect_volume_spike(df['volume'].iloc[-1], vol_ma.iloc[-1])
+        if NUMBA_AVAILABLE:
+            macd_signal, kdj_signal, bb_signal, vol_spike = self._detect_fused(market_data)
+        else:
+            macd_signal, kdj_signal, bb_signal, vol_spike = self._detect(market_data)
 
         # Vote counting
-        buy_votes = 0
-        sell_votes = 0
-        indicators = {}
-
-        if macd_signal == 'bullish':
-            buy_votes += 1
-            indicators['MACD'] = '买入 (金叉)'
-        elif macd_signal == 'bearish':
-            sell_votes += 1
-            indicators['MACD'] = '卖出 (死叉)'
-        else:
-            indicators['MACD'] = '中性'
-
-        if kdj_signal == 'buy':
-            buy_votes += 1
-            indicators['KDJ'] = '买入 (超卖反弹)'
-        elif kdj_signal == 'sell':
-            sell_votes += 1
-            indicators['KDJ'] = '卖出 (超买回落)'
-        else:
-            indicators['KDJ'] = '中性'
-
-        if bb_signal == 'oversold':
-            buy_votes += 1
-            indicators['布林带'] = '买入 (触及下轨)'
-        elif bb_signal == 'overbought':
-            sell_votes += 1
-            indicators['布林带'] = '卖出 (触及上轨)'
-        else:
-            indicators['布林带'] = '中性'
-
-        if vol_spike:
-            # Volume spike confirms direction
-            if buy_votes > sell_votes:
-                buy_votes += 1
-                indicators['成交量'] = '放量确认 (买入)'
-            elif sell_votes > buy_votes:
-                sell_votes += 1
-                indicators['成交量'] = '放量确认 (卖出)'
-            else:
-                indicators['成交量'] = '放量'
-        else:
-            indicators['成交量'] = '正常'
+        macd_vote = _MACD_VOTES.get(macd_signal, 0)
+        kdj_vote = _KDJ_VOTES.get(kdj_signal, 0)
+        bb_vote = _BB_VOTES.get(bb_signal, 0)
+        buy_votes = (macd_vote > 0) + (kdj_vote > 0) + (bb_vote > 0)
+        sell_votes = (macd_vote < 0) + (kdj_vote < 0) + (bb_vote < 0)
+
+        # Volume spike confirms the leading direction
+        volume_vote = (buy_votes > sell_votes) - (sell_votes > buy_votes) if vol_spike else 0
+        buy_votes += volume_vote > 0
+        sell_votes += volume_vote < 0
 
         # Decision
-        current_price = df['close'].iloc[-1]
+        current_price = market_data['close'].iloc[-1]
 
         if buy_votes >= self.min_votes:
             return {
@@ -137,7 +107,7 @@ class MultiIndicatorStrategy(StockStrategy):
                     'strategy': '多指标组合',
                     'buy_votes': buy_votes,
                     'sell_votes': sell_votes,
-                    'indicators': indicators
+                    'indicators': self._describe_votes(macd_vote, kdj_vote, bb_vote, vol_spike, volume_vote)
                 }
             }
         elif sell_votes >= self.min_votes:
@@ -152,12 +122,74 @@ class MultiIndicatorStrategy(StockStrategy):
                     'strategy': '多指标组合',
                     'buy_votes': buy_votes,
                     'sell_votes': sell_votes,
-                    'indicators': indicators
+                    'indicators': self._describe_votes(macd_vote, kdj_vote, bb_vote, vol_spike, volume_vote)
                 }
             }
 
         return None
 
+    @staticmethod
+    def _describe_votes(macd_vote: int, kdj_vote: int, bb_vote: int, vol_spike: bool,
+                        volume_vote: int) -> Dict[str, str]:
+        """Per-indicator reasoning labels (built only once a signal fires)."""
+        return {
+            'MACD': _MACD_LABELS[macd_vote + 1],
+            'KDJ': _KDJ_LABELS[kdj_vote + 1],
+            '布林带': _BB_LABELS[bb_vote + 1],
+            '成交量': _VOLUME_LABELS[volume_vote + 1] if vol_spike else '正常'
+        }
+
+    def _detect(self, df: pd.DataFrame):
+        """(macd, kdj, bollinger, volume spike) signals from the indicator modules."""
+        macd, macd_sig, _ = calculate_macd(df, self.macd_fast, self.macd_slow, self.macd_signal)
+        k, d, j = calculate_kdj(
+            df, period=self.kdj_period, k_smooth=self.kdj_k_smooth, d_smooth=self.kdj_d_smooth
+        )
+        upper, middle, lower = calculate_bollinger_bands(df, self.bb_period, self.bb_std)
+        vol_ma = calculate_volume_ma(df, self.volume_period)
+
+        return (
+            detect_macd_crossover(macd, macd_sig),
+            detect_kdj_signal(k, d, j),
+            detect_bollinger_signal(
+                df['close'].iloc[-1],
+                upper.iloc[-1],
+                lower.iloc[-1],
+                middle.iloc[-1]
+            ),
+            detect_volume_spike(df['volume'].iloc[-1], vol_ma.iloc[-1])
+        )
+
+    def _detect_fused(self, df: pd.DataFrame):
+        """Same signals as _detect(), from one multi_indicator_last() kernel pass."""
+        high, low, close, volume = (
+            df[col].to_numpy(dtype=np.float64) for col in ('high', 'low', 'close', 'volume')
+        )
+        (macd_prev, macd, sig_prev, sig, k_prev, k, d_prev, d,
+         middle, std, vol_ma) = multi_indicator_last(
+            high, low, close, volume,
+            2.0 / (self.macd_fast + 1.0),
+            2.0 / (self.macd_slow + 1.0),
+            2.0 / (self.macd_signal + 1.0),
+            self.kdj_period,
+            2.0 / (self.kdj_k_smooth + 1.0),  # calculate_kdj smooths with ewm(span)
+            2.0 / (self.kdj_d_smooth + 1.0),
+            self.bb_period,
+            self.volume_period
+        )
+
+        return (
+            detect_macd_crossover((macd_prev, macd), (sig_prev, sig)),
+            detect_kdj_signal((k_prev, k), (d_prev, d), None),
+            detect_bollinger_signal(
+                close[-1],
+                middle + std * self.bb_std,
+                middle - std * self.bb_std,
+                middle
+            ),
+            detect_volume_spike(volume[-1], vol_ma)
+        )
+
 
 # Example
 if __name__ == '__main__':
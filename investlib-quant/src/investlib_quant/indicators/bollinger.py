@@ -9,6 +9,8 @@ import numpy as np
 from typing import Tuple, Optional, Literal
 import logging
 
+from ._kernels import NUMBA_AVAILABLE, bollinger_batch
+
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +60,46 @@ def calculate_bollinger_bands(
     return upper_band, middle_band, lower_band
 
 
+def calculate_bollinger_bands_batch(
+    prices: np.ndarray,
+    period: int = 20,
+    std_dev: float = 2.0
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Calculate Bollinger Bands for many symbols at once (screener path).
+
+    Args:
+        prices: 2D array of shape (n_symbols, n_bars), one row per symbol
+        period: Moving average period (default 20)
+        std_dev: Standard deviation multiplier (default 2.0)
+
+    Returns:
+        Tuple of (upper_band, middle_band, lower_band), each (n_symbols, n_bars)
+
+    Uses a numba ``prange`` kernel over the symbol axis when numba is
+    installed, otherwise a pandas rolling pass over the transposed matrix.
+    Results match calculate_bollinger_bands() row by row.
+
+    Example:
+        >>> upper, middle, lower = calculate_bollinger_bands_batch(close_matrix, period=20)
+    """
+    prices = np.ascontiguousarray(prices, dtype=np.float64)
+    if prices.ndim != 2:
+        raise ValueError(f"prices must be 2D (n_symbols, n_bars), got {prices.ndim}D")
+
+    if NUMBA_AVAILABLE:
+        bands = bollinger_batch(prices, period, float(std_dev))
+        return bands[0], bands[1], bands[2]
+
+    frame = pd.DataFrame(prices.T)
+    middle_band = frame.rolling(window=period).mean().to_numpy().T
+    rolling_std = frame.rolling(window=period).std().to_numpy().T
+    return (
+        middle_band + rolling_std * std_dev,
+        middle_band,
+        middle_band - rolling_std * std_dev
+    )
+
+
 def detect_bollinger_signal(
     price: float,
     upper_band: float,
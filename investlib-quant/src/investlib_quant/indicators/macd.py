@@ -72,8 +72,9 @@ def detect_macd_crossover(
     """Detect MACD crossover signals.
 
     Args:
-        macd_line: MACD DIF line
-        signal_line: Signal DEA line
+        macd_line: MACD DIF line (Series, or any sequence ending in the
+            previous and latest values)
+        signal_line: Signal DEA line, same form as macd_line
 
     Returns:
         'bullish' | 'bearish' | None
@@ -91,11 +92,9 @@ def detect_macd_crossover(
     if len(macd_line) < 2 or len(signal_line) < 2:
         return None
 
-    # Get latest and previous values
-    macd_current = macd_line.iloc[-1]
-    macd_previous = macd_line.iloc[-2]
-    signal_current = signal_line.iloc[-1]
-    signal_previous = signal_line.iloc[-2]
+    # Get latest and previous values (Series or plain sequences)
+    macd_previous, macd_current = np.asarray(macd_line)[-2:]
+    signal_previous, signal_current = np.asarray(signal_line)[-2:]
 
     # Check for NaN
     if any(pd.isna([macd_current, macd_previous, signal_current, signal_previous])):
@@ -182,7 +181,8 @@ def detect_macd_divergence(
 def get_macd_strength(
     macd_line: pd.Series,
     signal_line: pd.Series,
-    histogram: pd.Series
+    histogram: pd.Series,
+    hist_std: Optional[float] = None
 ) -> dict:
     """Get MACD signal strength metrics.
 
@@ -190,6 +190,9 @@ def get_macd_strength(
         macd_line: MACD DIF line
         signal_line: Signal DEA line
         histogram: Histogram
+        hist_std: Precomputed std of the last 20 histogram values. Per-bar
+            callers can pass ``histogram.rolling(20, min_periods=1).std()``
+            values to skip the tail(20).std() recomputation.
 
     Returns:
         Dict with strength metrics:
@@ -217,7 +220,8 @@ def get_macd_strength(
 
     # Determine strength based on histogram magnitude
     hist_abs = abs(latest_hist)
-    hist_std = histogram.tail(20).std()
+    if hist_std is None:
+        hist_std = histogram.tail(20).std()
 
     if hist_abs > hist_std * 1.5:
         strength = 'strong'
@@ -240,6 +244,77 @@ def get_macd_strength(
     }
 
 
+def get_macd_strength_series(
+    macd_line: pd.Series,
+    signal_line: pd.Series,
+    histogram: pd.Series
+) -> dict:
+    """Get MACD strength metrics for every bar (backtest path).
+
+    Equivalent to calling get_macd_strength() on each growing prefix of the
+    series, but the 20-bar histogram std is computed once with a rolling
+    window instead of once per bar.
+
+    Args:
+        macd_line: MACD DIF line
+        signal_line: Signal DEA line
+        histogram: Histogram
+
+    Returns:
+        Dict of per-bar numpy arrays keyed like get_macd_strength():
+        'trend', 'strength', 'histogram_trend', 'histogram_value'
+
+    Example:
+        >>> strength = get_macd_strength_series(macd, signal, hist)
+        >>> strength['trend'][-1]
+    """
+    hist = histogram.to_numpy(dtype=np.float64)
+    macd_arr = macd_line.to_numpy(dtype=np.float64)
+    signal_arr = signal_line.to_numpy(dtype=np.float64)
+    if len(hist) == 0:
+        return {
+            'trend': np.empty(0, dtype=object),
+            'strength': np.empty(0, dtype=object),
+            'histogram_trend': np.empty(0, dtype=object),
+            'histogram_value': hist
+        }
+    hist_std = histogram.rolling(window=20, min_periods=1).std().to_numpy()
+
+    prev_hist = np.empty_like(hist)
+    prev_hist[0] = np.nan
+    prev_hist[1:] = hist[:-1]
+
+    trend = np.select(
+        [(hist > 0) & (macd_arr > signal_arr), (hist < 0) & (macd_arr < signal_arr)],
+        ['bullish', 'bearish'],
+        default='neutral'
+    ).astype(object)
+
+    hist_abs = np.abs(hist)
+    strength = np.select(
+        [hist_abs > hist_std * 1.5, hist_abs > hist_std * 0.5],
+        ['strong', 'moderate'],
+        default='weak'
+    ).astype(object)
+
+    histogram_trend = np.where(
+        hist_abs > np.abs(prev_hist), 'expanding', 'contracting'
+    ).astype(object)
+
+    # Match the scalar API's short-history answer for the first two bars
+    warmup = min(2, len(hist))
+    trend[:warmup] = 'neutral'
+    strength[:warmup] = 'weak'
+    histogram_trend[:warmup] = 'neutral'
+
+    return {
+        'trend': trend,
+        'strength': strength,
+        'histogram_trend': histogram_trend,
+        'histogram_value': hist
+    }
+
+
 # Example usage
 if __name__ == '__main__':
     # Create sample data
@@ -58,6 +58,34 @@ def detect_volume_spike(
     return False
 
 
+def detect_volume_spikes(
+    volume: np.ndarray,
+    volume_ma: np.ndarray,
+    threshold: float = 1.5
+) -> np.ndarray:
+    """Detect volume spikes for a whole series at once (backtest path).
+
+    Vectorized counterpart of detect_volume_spike(): bars whose volume MA
+    is NaN or non-positive never count as spikes.
+
+    Args:
+        volume: Volume array or Series
+        volume_ma: Volume moving average, same length
+        threshold: Spike threshold multiplier (default 1.5)
+
+    Returns:
+        Boolean array, True where a volume spike is detected
+    """
+    volume = np.asarray(volume, dtype=np.float64)
+    volume_ma = np.asarray(volume_ma, dtype=np.float64)
+
+    ratio = np.divide(volume, volume_ma, out=np.zeros_like(volume), where=volume_ma > 0)
+    spikes = ratio >= threshold
+
+    logger.debug(f"Volume spikes: {int(spikes.sum())} of {len(spikes)} bars")
+    return spikes
+
+
 def detect_volume_divergence(
     price_series: pd.Series,
     volume_series: pd.Series,
@@ -76,15 +104,16 @@ def detect_volume_divergence(
     if len(price_series) < lookback or len(volume_series) < lookback:
         return False
 
-    recent_price = price_series.tail(lookback)
-    recent_volume = volume_series.tail(lookback)
+    # ndarray slices are views, so no intermediate Series are built
+    recent_price = price_series.to_numpy()[-lookback:]
+    recent_volume = volume_series.to_numpy()[-lookback:]
 
     # Price trend
-    price_trend = (recent_price.iloc[-1] - recent_price.iloc[0]) / recent_price.iloc[0]
+    price_trend = (recent_price[-1] - recent_price[0]) / recent_price[0]
 
-    # Volume trend
-    vol_ma_early = recent_volume[:10].mean()
-    vol_ma_late = recent_volume[-10:].mean()
+    # Volume trend (nanmean skips missing volumes, as Series.mean() does)
+    vol_ma_early = np.nanmean(recent_volume[:10])
+    vol_ma_late = np.nanmean(recent_volume[-10:])
     volume_trend = (vol_ma_late - vol_ma_early) / vol_ma_early if vol_ma_early > 0 else 0
 
     # Divergence: price up but volume down (bearish)
@@ -197,3 +197,48 @@ class TestLivermoreStrategy:
         # Should mention at least one indicator
         assert any(keyword in factors_text for keyword in
                    ['ma', 'moving average', 'volume', 'macd', 'breakout'])
+
+    def test_streaming_state_matches_batch_indicators(self, sideways_market_data):
+        """Test LivermoreState updated bar by bar matches calculate_indicators."""
+        strategy = LivermoreStrategy()
+        batch = strategy.calculate_indicators(sideways_market_data)
+
+        state = strategy.new_state()
+        for bar in sideways_market_data.itertuples():
+            latest = state.update(bar.high, bar.low, bar.close, bar.volume)
+
+        assert state.ready
+        for column, value in latest.items():
+            assert value == pytest.approx(batch[column].iloc[-1], rel=1e-9)
+        assert strategy.detect_signal(state) == strategy.detect_signal(batch)
+
+    def test_wilder_atr_matches_talib(self, sideways_market_data):
+        """Test atr_method='wilder' matches TA-Lib ATR in batch and streaming paths."""
+        talib = pytest.importorskip('talib')
+        strategy = LivermoreStrategy(atr_method='wilder')
+        expected = talib.ATR(
+            sideways_market_data['high'].to_numpy(dtype=float),
+            sideways_market_data['low'].to_numpy(dtype=float),
+            sideways_market_data['close'].to_numpy(dtype=float),
+            timeperiod=strategy.atr_period
+        )
+
+        batch = strategy.calculate_indicators(sideways_market_data)
+        assert batch['atr'].to_numpy() == pytest.approx(expected, rel=1e-9, nan_ok=True)
+
+        state = strategy.new_state()
+        for bar in sideways_market_data.itertuples():
+            latest = state.update(bar.high, bar.low, bar.close, bar.volume)
+        assert latest['atr'] == pytest.approx(expected[-1], rel=1e-9)
+
+    def test_vectorized_signals_match_per_bar_detection(self, bullish_breakout_data):
+        """Test detect_signals_vectorized agrees with detect_signal on every bar."""
+        strategy = LivermoreStrategy()
+        indicators = strategy.calculate_indicators(bullish_breakout_data)
+        signals = strategy.detect_signals_vectorized(indicators)
+
+        assert len(signals) == len(indicators)
+        for i in range(1, len(indicators) + 1):
+            expected = strategy.detect_signal(indicators.iloc[:i])
+            assert signals['action'].iloc[i - 1] == expected['action']
+            assert signals['confidence'].iloc[i - 1] == expected['confidence']
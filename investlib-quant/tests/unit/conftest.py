@@ -0,0 +1,51 @@
+"""Shared fixtures for the investlib_quant unit tests."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Test the package in this tree (not the older src/ copy), with investlib-data beside it
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / 'investlib-data'))
+
+
+def _make_ohlcv(
+    seed: int = 0,
+    n: int = 300,
+    surge_rate: float = 0.1,
+    cycles: float = 0
+) -> pd.DataFrame:
+    """Synthetic daily OHLCV bars with occasional 3x volume surges.
+
+    Args:
+        seed: Random seed
+        n: Number of bars
+        surge_rate: Share of bars whose volume is tripled
+        cycles: 0 for a random-walk close; otherwise the number of sine
+            cycles (amplitude 8, plus noise) the close oscillates through,
+            so that oscillator signals fire in both directions
+    """
+    rng = np.random.default_rng(seed)
+    if cycles:
+        close = 100 + 8 * np.sin(np.linspace(0, 2 * np.pi * cycles, n)) + rng.normal(0, 1.5, n)
+    else:
+        close = 100 + rng.standard_normal(n).cumsum()
+    volume = rng.random(n) * 1e6 + 1e5
+    volume[rng.random(n) < surge_rate] *= 3
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2020-01-01', periods=n),
+        'open': close,
+        'high': close + rng.random(n),
+        'low': close - rng.random(n),
+        'close': close,
+        'volume': volume
+    })
+
+
+@pytest.fixture
+def make_ohlcv():
+    """Factory for synthetic OHLCV frames (see _make_ohlcv)."""
+    return _make_ohlcv
@@ -0,0 +1,39 @@
+"""Unit tests for the shared `with`-block session lifecycle of the strategy analyzers."""
+
+import pytest
+
+from investlib_quant.kroll_strategy import KrollStrategy
+from investlib_quant.livermore_strategy import LivermoreStrategy
+
+
+class FakeSession:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.mark.parametrize('strategy_cls', [KrollStrategy, LivermoreStrategy])
+class TestFetcherSession:
+
+    def test_with_block_keeps_and_closes_session(self, strategy_cls):
+        session = FakeSession()
+        with strategy_cls() as strategy:
+            assert strategy._keep_session
+            strategy._session, strategy._fetcher = session, object()
+            fetcher, owned = strategy._open_fetcher(use_cache=True)
+            assert fetcher is strategy._fetcher and owned is None
+
+        assert session.closed
+        assert not strategy._keep_session
+        assert strategy._session is None and strategy._fetcher is None
+
+    def test_caller_owned_cache_manager_is_reused(self, strategy_cls):
+        strategy = strategy_cls()
+        strategy.cache_manager = cache_manager = object()
+
+        first, owned = strategy._open_fetcher(use_cache=True)
+        second, _ = strategy._open_fetcher(use_cache=True)
+        assert first is second and owned is None
+        assert first.cache_manager is cache_manager
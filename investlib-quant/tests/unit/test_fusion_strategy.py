@@ -0,0 +1,68 @@
+"""Unit tests for FusionStrategy.fuse_signals()."""
+
+import json
+
+import pytest
+
+from investlib_quant.fusion_strategy import FusionStrategy
+
+
+@pytest.fixture
+def livermore_signal():
+    return {
+        'action': 'BUY', 'confidence': 'HIGH', 'position_size_pct': 15,
+        'entry_price': 100.0, 'stop_loss': 95.0, 'take_profit': 107.0, 'risk_level': 'MEDIUM'
+    }
+
+
+@pytest.fixture
+def kroll_signal():
+    return {
+        'action': 'BUY', 'confidence': 'MEDIUM', 'position_size_pct': 12,
+        'entry_price': 100.0, 'stop_loss': 97.5, 'take_profit': 105.0, 'risk_level': 'LOW'
+    }
+
+
+class TestFusionFactors:
+    """fusion_factors is returned as a plain list of strings."""
+
+    def test_fusion_factors_is_a_json_serializable_list(self, livermore_signal, kroll_signal):
+        fused = FusionStrategy().fuse_signals(livermore_signal, kroll_signal)
+        factors = fused['fusion_factors']
+
+        assert isinstance(factors, list)
+        assert all(isinstance(line, str) for line in factors)
+        assert "Stop-loss: 97.50 (tighter of 95.00, 97.50)" in factors
+        assert json.loads(json.dumps(factors)) == factors
+        assert factors + ['extra'] == list(factors) + ['extra']
+
+    def test_single_strategy_factors_is_a_list(self, kroll_signal):
+        wrapped = FusionStrategy(enable_livermore=False).fuse_signals(None, kroll_signal)
+        assert wrapped['fusion_factors'] == ["Using Kroll only (other strategy disabled)"]
+        json.dumps(wrapped)
+
+
+class TestFuseSignalsConfiguration:
+    """fuse_signals() behaves the same whichever strategies are enabled."""
+
+    @pytest.mark.parametrize('enable_livermore, enable_kroll', [
+        (True, True), (True, False), (False, True)
+    ])
+    def test_fuse_signals_ignores_enabled_strategies(
+        self, enable_livermore, enable_kroll, livermore_signal, kroll_signal
+    ):
+        reference = FusionStrategy()
+        strategy = FusionStrategy(enable_livermore=enable_livermore, enable_kroll=enable_kroll)
+
+        for liv, kroll in [
+            (livermore_signal, kroll_signal), (None, kroll_signal), (livermore_signal, None)
+        ]:
+            assert strategy.fuse_signals(liv, kroll) == reference.fuse_signals(liv, kroll)
+
+        with pytest.raises(ValueError):
+            strategy.fuse_signals(None, None)
+
+    def test_livermore_only_instance_wraps_kroll_signal(self, kroll_signal):
+        fused = FusionStrategy(enable_kroll=False).fuse_signals(None, kroll_signal)
+        assert fused['action'] == kroll_signal['action']
+        assert fused['fusion_factors'] == ["Using Kroll only (other strategy disabled)"]
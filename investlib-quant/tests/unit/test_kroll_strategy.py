@@ -0,0 +1,219 @@
+"""Unit tests for KrollStrategy's indicator cache and fast signal paths."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from investlib_quant.indicators._kernels import kroll_indicators, kroll_indicators_batch
+from investlib_quant.kroll_strategy import KrollStrategy, _cached_indicator_arrays
+from investlib_quant.signal_labels import ACTION_LABELS, LEVEL_LABELS
+
+
+METADATA = {
+    'api_source': 'test',
+    'retrieval_timestamp': pd.Timestamp('2024-01-01'),
+    'data_freshness': 'realtime'
+}
+
+# Fields of analyze_data() output that depend on the wall clock
+CLOCK_FIELDS = ('analysis_timestamp',)
+
+
+def without_clock(signal):
+    return {k: v for k, v in signal.items() if k not in CLOCK_FIELDS}
+
+
+class TestIndicatorCache:
+    """The opt-in indicator memo never serves stale or shared-writable arrays."""
+
+    def test_not_memoized_by_default(self, make_ohlcv):
+        df = make_ohlcv()
+        strategy = KrollStrategy()
+        before = _cached_indicator_arrays.cache_info()
+
+        strategy.calculate_indicators(df)
+        strategy.detect_signal_online(df)
+
+        after = _cached_indicator_arrays.cache_info()
+        assert (after.hits, after.misses) == (before.hits, before.misses)
+
+    def test_in_place_edit_of_middle_bar_invalidates_cache(self, make_ohlcv):
+        """Editing a middle bar of the same frame changes the indicators."""
+        df = make_ohlcv()
+        strategy = KrollStrategy(memoize_indicators=True)
+        before = strategy.calculate_indicators(df)['ma_60'].iloc[-1]
+
+        df.loc[len(df) - 20, 'close'] = 500.0
+        after = strategy.calculate_indicators(df)['ma_60'].iloc[-1]
+
+        assert after != pytest.approx(before)
+        assert after == pytest.approx(df['close'].iloc[-60:].mean())
+
+    def test_identical_data_is_served_from_cache(self, make_ohlcv):
+        """A second strategy over equal data reuses the cached arrays."""
+        df = make_ohlcv()
+        first = KrollStrategy(memoize_indicators=True).calculate_indicators(df)
+        hits = _cached_indicator_arrays.cache_info().hits
+        second = KrollStrategy(memoize_indicators=True).calculate_indicators(df.copy())
+
+        assert _cached_indicator_arrays.cache_info().hits == hits + 1
+        pd.testing.assert_frame_equal(first, second)
+        pd.testing.assert_frame_equal(first, KrollStrategy().calculate_indicators(df))
+
+    def test_indicator_frame_does_not_share_cached_arrays(self, make_ohlcv):
+        df = make_ohlcv()
+        strategy = KrollStrategy(memoize_indicators=True)
+        frame = strategy.calculate_indicators(df)
+        cached = strategy._indicator_arrays(df)
+
+        columns = ('ma_60', 'rsi', 'atr', 'volume_ma', 'volume_ratio', 'atr_pct')
+        for column, array in zip(columns, cached):
+            assert not array.flags.writeable
+            assert not np.shares_memory(frame[column].to_numpy(), array)
+
+        frame.loc[len(frame) - 1, 'ma_60'] = -1.0
+        assert strategy.calculate_indicators(df)['ma_60'].iloc[-1] != -1.0
+
+
+class TestAnalyzeMemo:
+    """analyze() memoizes only when asked to, and only closed date ranges."""
+
+    @pytest.fixture
+    def fetch_calls(self, monkeypatch, make_ohlcv):
+        calls = []
+
+        def fake_fetch(strategy, symbol, start_date, end_date, use_cache, shared=True):
+            calls.append((symbol, start_date, end_date))
+            return {
+                'data': make_ohlcv(seed=len(calls)),
+                'metadata': {
+                    'api_source': 'test',
+                    'retrieval_timestamp': pd.Timestamp('2024-01-01') + pd.Timedelta(minutes=len(calls)),
+                    'data_freshness': 'realtime'
+                }
+            }
+
+        monkeypatch.setattr(KrollStrategy, '_fetch_market_data', fake_fetch)
+        return calls
+
+    def test_not_memoized_by_default(self, fetch_calls):
+        strategy = KrollStrategy()
+        first = strategy.analyze('600519.SH', '2023-01-01', '2023-12-31')
+        second = strategy.analyze('600519.SH', '2023-01-01', '2023-12-31')
+
+        assert len(fetch_calls) == 2
+        assert first['data_timestamp'] != second['data_timestamp']
+
+    def test_range_ending_today_is_never_memoized(self, fetch_calls):
+        strategy = KrollStrategy()
+        strategy.analyze('600519.SH', memoize=True)
+        strategy.analyze('600519.SH', memoize=True)
+        assert len(fetch_calls) == 2
+
+    def test_closed_range_is_memoized_until_cleared(self, fetch_calls):
+        strategy = KrollStrategy()
+        first = strategy.analyze('600519.SH', '2023-01-01', '2023-12-31', memoize=True)
+        second = strategy.analyze('600519.SH', '2023-01-01', '2023-12-31', memoize=True)
+        assert len(fetch_calls) == 1
+        assert second['data_timestamp'] == first['data_timestamp']
+
+        strategy.analyze('600519.SH', '2023-01-01', '2023-12-31', use_cache=False, memoize=True)
+        assert len(fetch_calls) == 2
+
+        strategy.clear_analyze_cache()
+        strategy.analyze('600519.SH', '2023-01-01', '2023-12-31', memoize=True)
+        assert len(fetch_calls) == 3
+
+
+class TestFastPathsMatchPerBarDetection:
+    """Batch, vectorized and tail-only paths agree with full-history detect_signal()."""
+
+    @pytest.fixture
+    def strategy(self):
+        return KrollStrategy()
+
+    def test_tail_only_indicators_match_full_history(self, strategy, make_ohlcv):
+        df = make_ohlcv(n=500)
+        full = strategy.calculate_indicators(df)
+        tail = strategy.calculate_indicators(df, tail_only=True)
+
+        assert len(tail) < len(full)
+        for column in strategy.SIGNAL_COLUMNS:
+            assert tail[column].iloc[-2:].to_numpy() == pytest.approx(
+                full[column].iloc[-2:].to_numpy(), rel=1e-6
+            )
+
+    def test_detect_signal_online_matches_detect_signal(self, strategy, make_ohlcv):
+        df = make_ohlcv(seed=1, n=400)
+        for end in range(strategy._online_window() + 1, len(df) + 1, 7):
+            prefix = df.iloc[:end]
+            expected = strategy.detect_signal(strategy.calculate_indicators(prefix))
+            online = strategy.detect_signal_online(prefix)
+            for key in ('action', 'confidence', 'position_size_pct'):
+                assert online[key] == expected[key], f"{key} differs at bar {end}"
+
+    def test_vectorized_signals_match_per_bar_detect_signal(self, strategy, make_ohlcv):
+        indicators = strategy.calculate_indicators(make_ohlcv(seed=2))
+        signals = strategy.detect_signals_vectorized(indicators)
+
+        assert list(signals['action'].cat.categories) == list(ACTION_LABELS)
+        assert list(signals['confidence'].cat.categories) == list(LEVEL_LABELS)
+        for i in range(len(indicators)):
+            expected = strategy.detect_signal(indicators.iloc[:i + 1], key_factors=False)
+            assert signals['action'].iloc[i] == expected['action']
+            assert signals['confidence'].iloc[i] == expected['confidence']
+            assert signals['position_size_pct'].iloc[i] == expected['position_size_pct']
+
+    def test_batch_kernel_matches_single_symbol_kernel(self, make_ohlcv):
+        frames = [make_ohlcv(seed=seed, n=200) for seed in range(4)]
+        matrices = [
+            np.stack([frame[col].to_numpy(dtype=np.float64) for frame in frames])
+            for col in ('high', 'low', 'close', 'volume')
+        ]
+        batch = kroll_indicators_batch(*matrices, 60, 14, 14, 20)
+
+        for row, frame in enumerate(frames):
+            single = kroll_indicators(
+                *(frame[col].to_numpy(dtype=np.float64) for col in ('high', 'low', 'close', 'volume')),
+                60, 14, 14, 20
+            )
+            for field, values in enumerate(single):
+                np.testing.assert_array_equal(batch[field, row], values)
+
+    def test_analyze_batch_matches_analyze_data(self, strategy, make_ohlcv):
+        # Different lengths exercise the NaN left-padding of the batch matrices
+        market_data = {
+            f'SYM{seed}': make_ohlcv(seed=seed, n=150 + 60 * seed) for seed in range(5)
+        }
+        batch = strategy.analyze_batch(market_data, metadata=METADATA)
+
+        assert list(batch) == list(market_data)
+        for symbol, data in market_data.items():
+            single = strategy.analyze_data(data, symbol, metadata=METADATA)
+            assert without_clock(batch[symbol]) == without_clock(single)
+
+    def test_analyze_symbols_matches_analyze_data(self, strategy, monkeypatch, make_ohlcv):
+        market_data = {f'SYM{seed}': make_ohlcv(seed=seed) for seed in range(3)}
+
+        def fake_fetch(self, symbol, start_date, end_date, use_cache, shared=True):
+            return {'data': market_data[symbol], 'metadata': METADATA}
+
+        monkeypatch.setattr(KrollStrategy, '_fetch_market_data', fake_fetch)
+        signals = strategy.analyze_symbols(list(market_data), max_workers=2)
+
+        for symbol, data in market_data.items():
+            single = strategy.analyze_data(data, symbol, metadata=METADATA)
+            assert without_clock(signals[symbol]) == without_clock(single)
+
+    def test_signals_to_frame_uses_shared_categories(self, strategy, make_ohlcv):
+        market_data = {f'SYM{seed}': make_ohlcv(seed=seed) for seed in range(3)}
+        signals = strategy.analyze_batch(market_data, metadata=METADATA)
+        frame = KrollStrategy.signals_to_frame(signals)
+
+        assert list(frame.index) == list(signals)
+        assert list(frame['action'].cat.categories) == list(ACTION_LABELS)
+        assert list(frame['confidence'].cat.categories) == list(LEVEL_LABELS)
+        assert list(frame['risk_level'].cat.categories) == list(LEVEL_LABELS)
+        for symbol, signal in signals.items():
+            assert frame.loc[symbol, 'action'] == signal['action']
+            assert frame.loc[symbol, 'entry_price'] == signal['entry_price']
@@ -0,0 +1,46 @@
+"""Unit tests for MultiIndicatorStrategy's fused kernel path."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from investlib_quant.strategies.multi_indicator import MultiIndicatorStrategy
+
+
+def with_flat_windows(df: pd.DataFrame) -> pd.DataFrame:
+    """High == low == close over stretches longer than the KDJ window (RSV is 0 / 0)."""
+    df = df.copy()
+    for start in (40, 100):
+        df.loc[start:start + 11, ['open', 'high', 'low', 'close']] = 100.0
+    return df
+
+
+def with_nan_bars(df: pd.DataFrame) -> pd.DataFrame:
+    """Missing high/low values, which blank the KDJ window that contains them."""
+    df = df.copy()
+    df.loc[[30, 75, 76, 120], ['high', 'low']] = np.nan
+    return df
+
+
+class TestDetectFused:
+    """_detect_fused() gives the same votes as the pandas _detect()."""
+
+    @pytest.mark.parametrize('prepare', [
+        lambda df: df, with_flat_windows, with_nan_bars
+    ], ids=['plain', 'flat_windows', 'nan_bars'])
+    @pytest.mark.parametrize('params', [
+        {}, {'kdj_k_smooth': 5, 'kdj_d_smooth': 4, 'kdj_period': 14}
+    ], ids=['defaults', 'custom_kdj'])
+    def test_matches_pandas_detectors(self, prepare, params, make_ohlcv):
+        strategy = MultiIndicatorStrategy(**params)
+        # Oscillating closes so that MACD, KDJ and Bollinger signals all fire
+        df = prepare(make_ohlcv(n=160, cycles=3))
+
+        detected = set()
+        for end in range(30, len(df) + 1):
+            prefix = df.iloc[:end]
+            expected = strategy._detect(prefix)
+            assert strategy._detect_fused(prefix) == expected, f"differs at bar {end}"
+            detected.add(expected[1])
+
+        assert detected - {None}, "no KDJ signal fired"
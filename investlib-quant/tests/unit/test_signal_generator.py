@@ -0,0 +1,74 @@
+"""Unit tests for SignalGenerator.generate_signals_batch()."""
+
+import pytest
+
+from investlib_quant.signal_generator import SignalGenerator
+
+# Fields of a trading signal that depend on the wall clock
+CLOCK_FIELDS = ('generated_at',)
+
+
+def without_clock(signal):
+    return {k: v for k, v in signal.items() if k not in CLOCK_FIELDS}
+
+
+@pytest.fixture
+def generator():
+    return SignalGenerator()
+
+
+@pytest.fixture
+def market_data(make_ohlcv):
+    return {f'SYM{seed}': make_ohlcv(seed=seed, n=200 + 20 * seed) for seed in range(5)}
+
+
+class TestGenerateSignalsBatch:
+    """The batch path agrees with generate_trading_signal() symbol by symbol."""
+
+    def test_matches_per_symbol_signals(self, generator, market_data, monkeypatch):
+        def no_fallback(*args, **kwargs):
+            raise AssertionError("valid data must not fall back to analyze_data()")
+
+        monkeypatch.setattr(generator.strategy, 'analyze_data', no_fallback)
+        signals = generator.generate_signals_batch(list(market_data), market_data)
+        monkeypatch.undo()
+
+        assert list(signals) == list(market_data)
+        assert {signal['action'] for signal in signals.values()} >= {'BUY', 'SELL'}
+        for symbol, data in market_data.items():
+            expected = generator.generate_trading_signal(symbol, data)
+            assert without_clock(signals[symbol]) == without_clock(expected)
+
+    def test_short_history_falls_back_to_per_symbol_errors(
+        self, generator, market_data, make_ohlcv, monkeypatch
+    ):
+        market_data['SHORT'] = make_ohlcv(seed=9, n=50)
+        batch_calls = []
+        analyze_batch = generator.strategy.analyze_batch
+
+        def spy(*args, **kwargs):
+            batch_calls.append(args)
+            return analyze_batch(*args, **kwargs)
+
+        monkeypatch.setattr(generator.strategy, 'analyze_batch', spy)
+        signals = generator.generate_signals_batch(list(market_data), market_data)
+
+        assert len(batch_calls) == 1
+        with pytest.raises(ValueError) as excinfo:
+            generator.generate_trading_signal('SHORT', market_data['SHORT'])
+        assert signals['SHORT'] == {'error': str(excinfo.value), 'symbol': 'SHORT'}
+
+        for symbol, data in market_data.items():
+            if symbol != 'SHORT':
+                expected = generator.generate_trading_signal(symbol, data)
+                assert without_clock(signals[symbol]) == without_clock(expected)
+
+    def test_symbols_without_data_are_reported(self, generator, market_data):
+        signals = generator.generate_signals_batch(['SYM0', 'MISSING'], market_data)
+
+        assert 'action' in signals['SYM0']
+        assert signals['MISSING'] == {'error': 'No market data available for MISSING'}
+
+    def test_no_symbols_with_data(self, generator):
+        signals = generator.generate_signals_batch(['MISSING'], {})
+        assert signals == {'MISSING': {'error': 'No market data available for MISSING'}}
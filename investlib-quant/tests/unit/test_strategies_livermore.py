@@ -0,0 +1,140 @@
+"""Unit tests for the MA breakout strategy's replay and incremental paths."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from investlib_quant.strategies.livermore import LivermoreStrategy
+
+
+def assert_signals_close(actual, expected):
+    """Signals match, allowing float rounding in the MA-derived fields."""
+    assert (actual is None) == (expected is None)
+    if expected is None:
+        return
+    assert actual.keys() == expected.keys()
+    for key, value in expected.items():
+        if isinstance(value, dict):
+            assert actual[key] == pytest.approx(value, abs=0.011)
+        elif isinstance(value, float):
+            assert actual[key] == pytest.approx(value)
+        else:
+            assert actual[key] == value
+
+
+@pytest.fixture
+def strategy():
+    return LivermoreStrategy()
+
+
+@pytest.fixture
+def market_data(make_ohlcv):
+    # Frequent volume surges so that both BUY and SELL breakouts occur
+    return make_ohlcv(n=400, surge_rate=0.2)
+
+
+class TestBacktestRange:
+    """backtest_range() equals generate_signal() on each prefix."""
+
+    def test_matches_generate_signal_on_slices(self, strategy, market_data):
+        signals = strategy.backtest_range(market_data)
+
+        assert len(signals) == len(market_data)
+        for idx, signal in enumerate(signals):
+            assert signal == strategy.generate_signal(market_data.iloc[:idx + 1])
+
+    def test_sub_range(self, strategy, market_data):
+        full = strategy.backtest_range(market_data)
+        assert strategy.backtest_range(market_data, 150, 200) == full[150:200]
+
+    def test_shuffled_input_is_sorted_by_timestamp(self, strategy, market_data):
+        shuffled = market_data.sample(frac=1, random_state=0)
+        assert strategy.backtest_range(shuffled) == strategy.backtest_range(market_data)
+
+
+class TestScanHistory:
+    """scan_history() returns exactly the non-HOLD days of backtest_range()."""
+
+    def test_matches_non_hold_backtest_signals(self, strategy, market_data):
+        expected = [
+            {'timestamp': market_data['timestamp'].iloc[idx], **signal}
+            for idx, signal in enumerate(strategy.backtest_range(market_data))
+            if signal is not None and signal['action'] != 'HOLD'
+        ]
+        scanned = strategy.scan_history(market_data)
+
+        assert {s['action'] for s in expected} == {'BUY', 'SELL'}
+        assert len(scanned) == len(expected)
+        for actual, signal in zip(scanned, expected):
+            assert_signals_close(actual, signal)
+
+    def test_shuffled_input(self, strategy, market_data):
+        shuffled = market_data.sample(frac=1, random_state=1)
+        assert strategy.scan_history(shuffled) == strategy.scan_history(market_data)
+
+    def test_too_short_history_has_no_signals(self, strategy, market_data):
+        assert strategy.scan_history(market_data.iloc[:strategy.ma_period]) == []
+
+
+class TestIncrementalMeans:
+    """generate_signal(..., symbol=) keeps per-symbol means in step with full recomputation."""
+
+    def test_daily_updates_match_full_recomputation(self, strategy, market_data):
+        for end in range(strategy.ma_period + 1, len(market_data) + 1):
+            prefix = market_data.iloc[:end]
+            assert_signals_close(
+                strategy.generate_signal(prefix, symbol='600519.SH'),
+                strategy.generate_signal(prefix)
+            )
+
+        state = strategy._state['600519.SH']
+        assert state.bars == len(market_data)
+        assert state.last_timestamp == market_data['timestamp'].iloc[-1]
+
+    def test_incremental_means_track_last_means(self, strategy, market_data):
+        close = market_data['close'].to_numpy(dtype=np.float64)
+        volume = market_data['volume'].to_numpy(dtype=np.float64)
+        timestamps = market_data['timestamp'].to_numpy()
+
+        for end in range(strategy.ma_period + 1, len(close) + 1):
+            means = strategy._incremental_means('SYM', close[:end], volume[:end], timestamps[:end])
+            assert means == pytest.approx(strategy._last_means(close[:end], volume[:end]))
+
+    def test_shuffled_input(self, strategy, market_data):
+        for end in range(strategy.ma_period + 1, len(market_data) + 1, 13):
+            prefix = market_data.iloc[:end]
+            shuffled = prefix.sample(frac=1, random_state=end)
+            assert_signals_close(
+                strategy.generate_signal(shuffled, symbol='SYM'),
+                strategy.generate_signal(prefix)
+            )
+
+    def test_stale_timestamp_falls_back_to_full_recomputation(self, strategy, market_data):
+        """One extra bar whose predecessor is not the cached bar is recomputed from scratch."""
+        strategy.generate_signal(market_data.iloc[:-1], symbol='SYM')
+
+        # Same bar count as a daily update, but the history is shifted by one day
+        other = market_data.iloc[1:].copy()
+        other['close'] += 5.0
+        other = pd.concat([other, market_data.iloc[[-1]].assign(
+            timestamp=market_data['timestamp'].iloc[-1] + pd.Timedelta(days=1)
+        )], ignore_index=True)
+
+        assert strategy.generate_signal(other, symbol='SYM') == strategy.generate_signal(other)
+        assert strategy._state['SYM'].last_timestamp == other['timestamp'].iloc[-1]
+
+        close = other['close'].to_numpy(dtype=np.float64)
+        volume = other['volume'].to_numpy(dtype=np.float64)
+        assert strategy._state['SYM'].ma == pytest.approx(strategy._last_means(close, volume)[0])
+
+    def test_symbols_are_cached_independently(self, strategy, make_ohlcv):
+        first, second = make_ohlcv(seed=1, n=400), make_ohlcv(seed=2, n=400)
+        for end in range(strategy.ma_period + 1, len(first) + 1, 5):
+            assert_signals_close(
+                strategy.generate_signal(first.iloc[:end], symbol='A'),
+                strategy.generate_signal(first.iloc[:end])
+            )
+            assert_signals_close(
+                strategy.generate_signal(second.iloc[:end], symbol='B'),
+                strategy.generate_signal(second.iloc[:end])
+            )
@@ -12,10 +12,16 @@ from pathlib import Path
 # 添加 investlib-quant 到路径
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'investlib-quant' / 'src'))
 
-from investlib_quant.indicators.macd import calculate_macd, detect_macd_crossover
+from investlib_quant.indicators.macd import (
+    calculate_macd, detect_macd_crossover, get_macd_strength, get_macd_strength_series
+)
 from investlib_quant.indicators.kdj import calculate_kdj, detect_kdj_signal
-from investlib_quant.indicators.bollinger import calculate_bollinger_bands, detect_bollinger_signal
-from investlib_quant.indicators.volume import detect_volume_spike, detect_volume_divergence, calculate_volume_ma
+from investlib_quant.indicators.bollinger import (
+    calculate_bollinger_bands, calculate_bollinger_bands_batch, detect_bollinger_signal
+)
+from investlib_quant.indicators.volume import (
+    detect_volume_spike, detect_volume_spikes, detect_volume_divergence, calculate_volume_ma
+)
 
 
 class TestMACDIndicator:
@@ -78,6 +84,22 @@ class TestMACDIndicator:
         # 允许浮点误差
         pd.testing.assert_series_equal(histogram, expected_histogram, check_names=False)
 
+    def test_macd_strength_series_matches_scalar(self, sample_data):
+        """测试：逐 K 线 MACD 强度与标量版本一致"""
+        macd, signal, histogram = calculate_macd(sample_data)
+
+        series = get_macd_strength_series(macd, signal, histogram)
+
+        for end in (3, 20, len(sample_data)):
+            scalar = get_macd_strength(macd.iloc[:end], signal.iloc[:end], histogram.iloc[:end])
+            for key in ('trend', 'strength', 'histogram_trend'):
+                assert series[key][end - 1] == scalar[key], f"{key} 在第 {end} 根 K 线应一致"
+
+        # 空序列：返回空数组而不是抛出异常
+        empty = get_macd_strength_series(macd.iloc[:0], signal.iloc[:0], histogram.iloc[:0])
+        for key in ('trend', 'strength', 'histogram_trend', 'histogram_value'):
+            assert len(empty[key]) == 0
+
 
 class TestKDJIndicator:
     """KDJ 指标测试"""
@@ -200,6 +222,24 @@ class TestBollingerBands:
         # 允许浮点误差
         pd.testing.assert_series_equal(middle, ma20, check_names=False)
 
+    def test_bollinger_batch_matches_single(self):
+        """测试：批量布林带与单品种计算一致"""
+        prices = np.array([
+            [100 + i * 0.5 + np.sin(i) * 3 for i in range(50)],
+            [50 - i * 0.2 + np.cos(i) * 2 for i in range(50)],
+        ])
+
+        upper, middle, lower = calculate_bollinger_bands_batch(prices, period=20, std_dev=2)
+
+        assert upper.shape == prices.shape, "输出形状应为 (品种数, K线数)"
+        for row in range(prices.shape[0]):
+            exp_upper, exp_middle, exp_lower = calculate_bollinger_bands(
+                pd.DataFrame({'close': prices[row]}), period=20, std_dev=2
+            )
+            np.testing.assert_allclose(upper[row], exp_upper.to_numpy(), equal_nan=True)
+            np.testing.assert_allclose(middle[row], exp_middle.to_numpy(), equal_nan=True)
+            np.testing.assert_allclose(lower[row], exp_lower.to_numpy(), equal_nan=True)
+
     def test_bollinger_oversold_signal(self):
         """测试：布林带超卖信号"""
         dates = pd.date_range('2024-01-01', periods=30, freq='D')
@@ -285,6 +325,20 @@ class TestVolumeIndicator:
         )
         assert spike_high is True, "低阈值应检测到极端放量"
 
+    def test_volume_spikes_matches_scalar(self, sample_data):
+        """测试：向量化放量检测与逐根检测一致"""
+        sample_data.loc[sample_data.index[-5], 'volume'] = 3000000
+        vol_ma = calculate_volume_ma(sample_data, period=20)
+
+        spikes = detect_volume_spikes(sample_data['volume'], vol_ma, threshold=2.0)
+
+        expected = [
+            detect_volume_spike(v, m, threshold=2.0)
+            for v, m in zip(sample_data['volume'], vol_ma)
+        ]
+        assert spikes.tolist() == expected, "向量化结果应与标量版本一致"
+        assert spikes[-5], "应检测到 3 倍放量"
+
     def test_price_volume_divergence(self, sample_data):
         """测试：价格与成交量背离"""
         # 模拟背离：价格上涨，成交量下降
@@ -316,6 +370,20 @@ class TestVolumeIndicator:
         assert divergence in [True, False], "应返回布尔值"
 
 
+    def test_volume_divergence_skips_missing_volume(self, sample_data):
+        """测试：回看窗口内缺失的成交量被跳过，不影响背离判断"""
+        sample_data.loc[sample_data.index[-20:], 'close'] = range(100, 120)  # 价格上涨
+        sample_data.loc[sample_data.index[-20:], 'volume'] = list(range(2000000, 1000000, -50000))  # 成交量下降
+        sample_data.loc[sample_data.index[-15], 'volume'] = np.nan
+
+        divergence = detect_volume_divergence(
+            price_series=sample_data['close'],
+            volume_series=sample_data['volume'],
+            lookback=20
+        )
+
+        assert divergence, "单个缺失成交量不应掩盖量价背离"
+
 class TestEdgeCases:
     """边界情况测试"""
 